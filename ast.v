@@ -166,6 +166,7 @@ pub mut:
 	body              []Stmt
 	loc               Location
 	docstring_comment ?string
+	buffered_output   bool // prints go through one buffered stdout writer
 }
 
 // Expressions
@@ -343,6 +344,7 @@ pub mut:
 	elt        Expr
 	generators []Comprehension
 	loc        Location
+	parallel   bool // iterations run on worker threads
 }
 
 pub struct SetComp {
@@ -365,6 +367,7 @@ pub mut:
 	elt        Expr
 	generators []Comprehension
 	loc        Location
+	parallel   bool // iterations run on worker threads
 }
 
 pub struct Comprehension {
@@ -439,6 +442,11 @@ pub mut:
 	decorator_kind  string
 	dunder_op       string
 	v_annotation    string   // Inferred return type (e.g., 'int', 'bool')
+	multi_return    bool     // Tuple results are always unpacked: emit V multi-return
+	recursion_loop  string   // 'tail' or 'accumulate': self-recursion emitted as a loop
+	loop_params     []string // parameters rebound by the recursive calls
+	accumulator_op  string   // '+' or '*' folding the operands of accumulate returns
+	acc_prepend     bool     // the recursive call is the left operand of accumulate returns
 }
 
 pub struct AsyncFunctionDef {
@@ -458,6 +466,11 @@ pub mut:
 	decorator_kind  string
 	dunder_op       string
 	v_annotation    string   // Inferred return type (e.g., 'int', 'bool')
+	multi_return    bool     // Tuple results are always unpacked: emit V multi-return
+	recursion_loop  string   // 'tail' or 'accumulate': self-recursion emitted as a loop
+	loop_params     []string // parameters rebound by the recursive calls
+	accumulator_op  string   // '+' or '*' folding the operands of accumulate returns
+	acc_prepend     bool     // the recursive call is the left operand of accumulate returns
 }
 
 pub struct Arguments {
@@ -496,8 +509,9 @@ pub mut:
 
 pub struct Return {
 pub mut:
-	value ?Expr
-	loc   Location
+	value     ?Expr
+	loc       Location
+	recursion string // 'tail' (recursive call) or 'base' inside a recursion loop
 }
 
 pub struct Delete {
@@ -516,14 +530,16 @@ pub mut:
 	is_typevar_assign bool
 	literal_values    []string // non-empty when Literal[v1, v2, ...] assignment
 	literal_name      string   // name being bound (e.g. 'Status' in Status = Literal[...])
+	string_builder    bool     // string accumulator lowered to a strings.Builder
 }
 
 pub struct AugAssign {
 pub mut:
-	target Expr
-	op     Operator
-	value  Expr
-	loc    Location
+	target         Expr
+	op             Operator
+	value          Expr
+	loc            Location
+	string_builder bool // append to a strings.Builder accumulator
 }
 
 pub struct AnnAssign {
@@ -537,13 +553,16 @@ pub mut:
 
 pub struct For {
 pub mut:
-	target       Expr
-	iter         Expr
-	body         []Stmt
-	orelse       []Stmt
-	type_comment ?string
-	loc          Location
-	level        int
+	target          Expr
+	iter            Expr
+	body            []Stmt
+	orelse          []Stmt
+	type_comment    ?string
+	loc             Location
+	level           int
+	builder_flush   []string // string builders to materialise after the loop
+	parallel        bool     // iterations run on worker threads
+	line_end_unused bool     // the body trims the line terminator of each line
 }
 
 pub struct AsyncFor {
@@ -559,11 +578,12 @@ pub mut:
 
 pub struct While {
 pub mut:
-	test   Expr
-	body   []Stmt
-	orelse []Stmt
-	loc    Location
-	level  int
+	test          Expr
+	body          []Stmt
+	orelse        []Stmt
+	loc           Location
+	level         int
+	builder_flush []string // string builders to materialise after the loop
 }
 
 pub struct If {
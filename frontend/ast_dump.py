@@ -9,20 +9,29 @@ Enrichments beyond standard ast.parse():
   - _type field on every node
   - mutable_vars, is_void, is_generator on FunctionDef
   - is_class_method, class_name on methods
+  - multi_return on functions whose tuple results are always unpacked
+  - v_annotation and parameter annotations inferred across module functions
   - is_mutable on Name nodes
   - redefined_targets on Assign nodes
+  - string_builder on string accumulators, builder_flush on their last loop
+  - dict[K, V] v_annotation on defaultdict/Counter calls typed from usage
   - level (nesting depth) on For/While/If
+  - parallel on loops and comprehensions whose iterations run on threads
+  - line_end_unused on line loops whose body trims the line terminator
+  - buffered_output on Module when a # py2v: buffered-output pragma is set
   - docstring_comment on Module
   - __main__ guard rewritten to main() function
 
 Usage:
-    python frontend/ast_dump.py <source.py>
+    python frontend/ast_dump.py [--auto-parallel] <source.py>
 """
 
 import ast
+import io
 import json
 import sys
 import os
+import tokenize
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 
@@ -36,6 +45,8 @@ class AnalysisContext:
     """
     var_annotations: Dict[str, str] = field(default_factory=dict)
     func_ret_annotations: Dict[str, str] = field(default_factory=dict)
+    cached_properties: Set[str] = field(default_factory=set)
+    in_place_calls: Set[str] = field(default_factory=set)
 
     @staticmethod
     def empty() -> "AnalysisContext":
@@ -47,12 +58,21 @@ class AnalysisContext:
 # Analysis passes
 # ---------------------------------------------------------------------------
 
+# heapq and bisect functions that update the list passed first
+_IN_PLACE_FUNCS = {
+    'heapq': {'heappush', 'heappop', 'heapify', 'heapreplace', 'heappushpop'},
+    'bisect': {'insort', 'insort_left', 'insort_right'},
+}
+
 class ScopeTracker(ast.NodeVisitor):
     """Track variable assignments per scope to detect mutability and redefinitions."""
 
-    def __init__(self):
+    def __init__(self, cached_properties: Optional[Set[str]] = None,
+                 in_place_calls: Optional[Set[str]] = None):
         self.scopes: List[Dict[str, List[ast.AST]]] = [{}]
         self.mutable: Set[str] = set()
+        self.cached_properties = cached_properties or set()
+        self.in_place_calls = in_place_calls or set()
 
     def _current(self) -> Dict[str, List[ast.AST]]:
         return self.scopes[-1]
@@ -86,13 +106,45 @@ class ScopeTracker(ast.NodeVisitor):
     def visit_Call(self, node: ast.Call):
         """Detect mutating method calls like x.append(), x.insert(), etc."""
         _MUTATING_METHODS = {
-            'append', 'insert', 'remove', 'extend',
+            'append', 'insert', 'remove', 'extend', 'add', 'discard', 'sort',
+            'appendleft', 'popleft', 'extendleft',
         }
         if (isinstance(node.func, ast.Attribute)
                 and node.func.attr in _MUTATING_METHODS
                 and isinstance(node.func.value, ast.Name)):
             self.mutable.add(node.func.value.id)
             self._record_assign(node.func.value.id, node)
+        # self.items.add(x) mutates the object that owns the field
+        if (isinstance(node.func, ast.Attribute)
+                and node.func.attr in _MUTATING_METHODS
+                and isinstance(node.func.value, ast.Attribute)
+                and isinstance(node.func.value.value, ast.Name)
+                and node.func.value.value.id == "self"):
+            self.mutable.add("self")
+        # heapq and bisect.insort functions update the list passed first;
+        # only spellings that were actually imported count
+        in_place = False
+        if (isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name)):
+            in_place = f"{node.func.value.id}.{node.func.attr}" in self.in_place_calls
+        elif isinstance(node.func, ast.Name):
+            in_place = node.func.id in self.in_place_calls
+        if in_place and node.args and isinstance(node.args[0], ast.Name):
+            self.mutable.add(node.args[0].id)
+            self._record_assign(node.args[0].id, node)
+        # readinto() fills the buffer passed to it
+        if (isinstance(node.func, ast.Attribute) and node.func.attr == "readinto"
+                and node.args and isinstance(node.args[0], ast.Name)):
+            self.mutable.add(node.args[0].id)
+            self._record_assign(node.args[0].id, node)
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        """Reading a @cached_property stores the computed value on the object."""
+        if (node.attr in self.cached_properties
+                and isinstance(node.ctx, ast.Load)
+                and isinstance(node.value, ast.Name)):
+            self.mutable.add(node.value.id)
         self.generic_visit(node)
 
     def visit_Delete(self, node: ast.Delete):
@@ -379,6 +431,540 @@ def _infer_return_type(node: ast.FunctionDef) -> str:
     return ret
 
 
+# ---------------------------------------------------------------------------
+# Module-wide scalar type propagation
+# ---------------------------------------------------------------------------
+
+_SCALAR_TYPES = ("int", "float", "str", "bool")
+
+_BUILTIN_SCALAR_RETURNS = {
+    "len": "int", "int": "int", "ord": "int", "hash": "int", "id": "int",
+    "str": "str", "chr": "str", "repr": "str", "input": "str",
+    "hex": "str", "oct": "str", "bin": "str", "ascii": "str",
+    "float": "float",
+    "bool": "bool", "isinstance": "bool", "issubclass": "bool",
+    "callable": "bool", "all": "bool", "any": "bool",
+}
+
+_STR_METHOD_RETURNS = {
+    "upper": "str", "lower": "str", "strip": "str", "lstrip": "str",
+    "rstrip": "str", "title": "str", "capitalize": "str", "replace": "str",
+    "join": "str", "format": "str", "center": "str", "ljust": "str",
+    "rjust": "str", "zfill": "str", "swapcase": "str", "casefold": "str",
+    "find": "int", "rfind": "int", "index": "int", "rindex": "int",
+    "count": "int",
+    "startswith": "bool", "endswith": "bool", "isdigit": "bool",
+    "isalpha": "bool", "isalnum": "bool", "isspace": "bool",
+    "isupper": "bool", "islower": "bool", "isnumeric": "bool",
+}
+
+
+def _scalar_annotation(node: Optional[ast.AST]) -> str:
+    """Return the scalar type named by an annotation, or '' otherwise."""
+    ann = _annotation_to_str(node)
+    return ann if ann in _SCALAR_TYPES else ""
+
+
+def _scalar_binop_type(left: str, op: ast.operator, right: str) -> str:
+    """Result type of a binary operator over scalar operand types."""
+    if not left or not right:
+        return ""
+    if left == right == "str":
+        return "str" if isinstance(op, (ast.Add, ast.Mod)) else ""
+    if {left, right} == {"str", "int"} and isinstance(op, ast.Mult):
+        return "str"
+    numeric = ("int", "float", "bool")
+    if left not in numeric or right not in numeric:
+        return ""
+    if "float" in (left, right):
+        return "float"
+    # int ** int is a float for negative exponents, and the backend lowers
+    # int / int to V integer division.
+    if isinstance(op, (ast.Pow, ast.Div)):
+        return ""
+    return "int"
+
+
+class _FlowTypeWalker:
+    """Flow-sensitive scalar type inference over one statement body.
+
+    Walks statements in order, keeping a name -> type environment that is
+    updated on every assignment. Branches are merged at join points and
+    loop bodies are walked twice so loop-carried changes reach a fixpoint.
+    Unknown or conflicting types are recorded as ''. Return types and the
+    argument types of calls to module functions are collected on the way.
+    """
+
+    def __init__(self, func_types: Dict[str, str]):
+        self.func_types = func_types
+        self.return_types: List[tuple] = []
+        self.calls: List[tuple] = []
+        self.recording = True
+
+    # -- expressions -------------------------------------------------------
+
+    def expr_type(self, node: Optional[ast.AST], env: Dict[str, str]) -> str:
+        if node is None:
+            return ""
+        if isinstance(node, ast.Constant):
+            typ = _infer_type_from_value(node)
+            return typ if typ in _SCALAR_TYPES else ""
+        if isinstance(node, ast.Name):
+            return env.get(node.id, "")
+        if isinstance(node, ast.JoinedStr):
+            return "str"
+        if isinstance(node, ast.Compare):
+            return "bool"
+        if isinstance(node, ast.BoolOp):
+            types = {self.expr_type(v, env) for v in node.values}
+            return types.pop() if len(types) == 1 else ""
+        if isinstance(node, ast.UnaryOp):
+            if isinstance(node.op, ast.Not):
+                return "bool"
+            typ = self.expr_type(node.operand, env)
+            if isinstance(node.op, ast.Invert):
+                return "int" if typ in ("int", "bool") else ""
+            if typ == "bool":
+                return "int"
+            return typ if typ in ("int", "float") else ""
+        if isinstance(node, ast.BinOp):
+            return _scalar_binop_type(self.expr_type(node.left, env), node.op,
+                                      self.expr_type(node.right, env))
+        if isinstance(node, ast.IfExp):
+            body = self.expr_type(node.body, env)
+            return body if body == self.expr_type(node.orelse, env) else ""
+        if isinstance(node, ast.NamedExpr):
+            return self.expr_type(node.value, env)
+        if isinstance(node, ast.Call):
+            return self._call_type(node, env)
+        return ""
+
+    def _call_type(self, node: ast.Call, env: Dict[str, str]) -> str:
+        func = node.func
+        if isinstance(func, ast.Name):
+            if func.id in self.func_types:
+                return self.func_types[func.id]
+            if func.id in _BUILTIN_SCALAR_RETURNS:
+                return _BUILTIN_SCALAR_RETURNS[func.id]
+            if func.id in ("abs", "min", "max") and node.args and not node.keywords:
+                types = {self.expr_type(a, env) for a in node.args}
+                if len(node.args) == 1 and func.id != "abs":
+                    return ""
+                typ = types.pop() if len(types) == 1 else ""
+                return typ if typ in ("int", "float") else ""
+            return ""
+        if isinstance(func, ast.Attribute) and func.attr in _STR_METHOD_RETURNS:
+            if self.expr_type(func.value, env) == "str":
+                return _STR_METHOD_RETURNS[func.attr]
+        return ""
+
+    # -- statements --------------------------------------------------------
+
+    def walk(self, stmts: List[ast.stmt], env: Dict[str, str]) -> bool:
+        """Walk ``stmts`` updating ``env``; return True if control cannot
+        fall off the end of the block."""
+        for stmt in stmts:
+            self._record_calls(stmt, env)
+            if self._walk_stmt(stmt, env):
+                return True
+        return False
+
+    def _record_calls(self, stmt: ast.stmt, env: Dict[str, str]):
+        """Record argument types for calls made by ``stmt`` itself."""
+        if not self.recording:
+            return
+        for node in _iter_own_nodes(stmt):
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                args = [self.expr_type(a, env) for a in node.args]
+                kwargs = {kw.arg: self.expr_type(kw.value, env)
+                          for kw in node.keywords if kw.arg is not None}
+                self.calls.append((node, args, kwargs))
+
+    def _assign(self, target: ast.AST, typ: str, env: Dict[str, str]):
+        if isinstance(target, ast.Name):
+            env[target.id] = typ
+        else:
+            for name in _extract_names(target):
+                env[name] = ""
+
+    def _walk_stmt(self, stmt: ast.stmt, env: Dict[str, str]) -> bool:
+        for node in _iter_own_nodes(stmt):
+            if isinstance(node, ast.NamedExpr):
+                env[node.target.id] = self.expr_type(node.value, env)
+
+        if isinstance(stmt, ast.Assign):
+            value_typ = self.expr_type(stmt.value, env)
+            for target in stmt.targets:
+                if (isinstance(target, (ast.Tuple, ast.List))
+                        and isinstance(stmt.value, (ast.Tuple, ast.List))
+                        and len(target.elts) == len(stmt.value.elts)):
+                    elt_types = [self.expr_type(v, env) for v in stmt.value.elts]
+                    for elt, elt_typ in zip(target.elts, elt_types):
+                        self._assign(elt, elt_typ, env)
+                else:
+                    self._assign(target, value_typ, env)
+        elif isinstance(stmt, ast.AnnAssign):
+            self._assign(stmt.target, _scalar_annotation(stmt.annotation), env)
+        elif isinstance(stmt, ast.AugAssign):
+            if isinstance(stmt.target, ast.Name):
+                env[stmt.target.id] = _scalar_binop_type(
+                    env.get(stmt.target.id, ""), stmt.op, self.expr_type(stmt.value, env))
+        elif isinstance(stmt, ast.Return):
+            if self.recording:
+                if stmt.value is None or (isinstance(stmt.value, ast.Constant)
+                                          and stmt.value.value is None):
+                    self.return_types.append((stmt, "None"))
+                else:
+                    self.return_types.append((stmt, self.expr_type(stmt.value, env)))
+            return True
+        elif isinstance(stmt, ast.Raise):
+            return True
+        elif isinstance(stmt, ast.If):
+            body_env = dict(env)
+            else_env = dict(env)
+            body_exits = self.walk(stmt.body, body_env)
+            else_exits = self.walk(stmt.orelse, else_env)
+            if body_exits and else_exits:
+                return True
+            if body_exits:
+                env.update(else_env)
+            elif else_exits:
+                env.update(body_env)
+            else:
+                env.update(_merge_flow_envs(body_env, else_env))
+        elif isinstance(stmt, (ast.For, ast.AsyncFor)):
+            iter_typ = ""
+            if (isinstance(stmt.iter, ast.Call) and isinstance(stmt.iter.func, ast.Name)
+                    and stmt.iter.func.id == "range"):
+                iter_typ = "int"
+            elif self.expr_type(stmt.iter, env) == "str":
+                iter_typ = "str"
+            self._walk_loop(stmt, env, lambda e: self._assign(stmt.target, iter_typ, e))
+        elif isinstance(stmt, ast.While):
+            self._walk_loop(stmt, env, lambda e: None)
+        elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+            for item in stmt.items:
+                if item.optional_vars is not None:
+                    self._assign(item.optional_vars, "", env)
+            return self.walk(stmt.body, env)
+        elif isinstance(stmt, ast.Try) or type(stmt).__name__ == "TryStar":
+            entry = dict(env)
+            body_exits = self.walk(stmt.body, env)
+            if not body_exits:
+                body_exits = self.walk(stmt.orelse, env)
+            envs = [] if body_exits else [env.copy()]
+            for handler in stmt.handlers:
+                handler_env = _merge_flow_envs(entry, env)
+                if handler.name:
+                    handler_env[handler.name] = ""
+                if not self.walk(handler.body, handler_env):
+                    envs.append(handler_env)
+            env.clear()
+            env.update(_merge_flow_envs(*envs) if envs else entry)
+            if self.walk(stmt.finalbody, env):
+                return True
+            return not envs
+        elif type(stmt).__name__ == "Match":
+            envs = []
+            for case in stmt.cases:
+                case_env = dict(env)
+                for node in ast.walk(case.pattern):
+                    name = getattr(node, "name", None) or getattr(node, "rest", None)
+                    if isinstance(name, str):
+                        case_env[name] = ""
+                if not self.walk(case.body, case_env):
+                    envs.append(case_env)
+            envs.append(dict(env))
+            env.update(_merge_flow_envs(*envs))
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            env[stmt.name] = ""
+        elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            for alias in stmt.names:
+                env[(alias.asname or alias.name).split(".")[0]] = ""
+        elif isinstance(stmt, ast.Delete):
+            for target in stmt.targets:
+                if isinstance(target, ast.Name):
+                    env.pop(target.id, None)
+        return False
+
+    def _walk_loop(self, stmt, env: Dict[str, str], bind_target):
+        """Walk a loop body until the loop-carried environment is stable."""
+        recording = self.recording
+        self.recording = False
+        loop_env = dict(env)
+        for _ in range(3):
+            trial = dict(loop_env)
+            bind_target(trial)
+            self.walk(stmt.body, trial)
+            merged = _merge_flow_envs(loop_env, trial)
+            if merged == loop_env:
+                break
+            loop_env = merged
+        self.recording = recording
+        body_env = dict(loop_env)
+        bind_target(body_env)
+        self.walk(stmt.body, body_env)
+        env.clear()
+        env.update(_merge_flow_envs(loop_env, body_env))
+        self.walk(stmt.orelse, env)
+
+
+def _merge_flow_envs(*envs: Dict[str, str]) -> Dict[str, str]:
+    """Join environments from converging control-flow paths.
+
+    A name keeps its type only if every path that binds it agrees.
+    """
+    merged: Dict[str, str] = {}
+    for env in envs:
+        for name, typ in env.items():
+            if name not in merged:
+                merged[name] = typ
+            elif merged[name] != typ:
+                merged[name] = ""
+    return merged
+
+
+def _iter_own_nodes(stmt: ast.stmt):
+    """Yield the expression nodes that belong to ``stmt`` itself.
+
+    Nested statement bodies, function definitions, lambdas, comprehensions
+    and class bodies are not entered; compound statements only contribute
+    their headers.
+    """
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        roots = list(stmt.decorator_list)
+        if not isinstance(stmt, ast.ClassDef):
+            roots += [d for d in stmt.args.defaults + stmt.args.kw_defaults if d is not None]
+    elif isinstance(stmt, (ast.If, ast.While)):
+        roots = [stmt.test]
+    elif isinstance(stmt, (ast.For, ast.AsyncFor)):
+        roots = [stmt.iter]
+    elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+        roots = [item.context_expr for item in stmt.items]
+    elif isinstance(stmt, ast.Try) or type(stmt).__name__ in ("TryStar", "Match"):
+        roots = [stmt.subject] if hasattr(stmt, "subject") else []
+    else:
+        roots = [stmt]
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)):
+            continue
+        yield node
+        stack.extend(ast.iter_child_nodes(node))
+
+
+def _operand_names(node: ast.AST) -> Set[str]:
+    """Names whose value flows arithmetically into ``node``.
+
+    Calls, subscripts and attribute accesses only pass on their result, so
+    names under them are not collected.
+    """
+    names: Set[str] = set()
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, ast.Name):
+            names.add(n.id)
+        elif not isinstance(n, (ast.Call, ast.Subscript, ast.Attribute, ast.Lambda)):
+            stack.extend(ast.iter_child_nodes(n))
+    return names
+
+
+def _true_division_names(fn: ast.FunctionDef) -> Set[str]:
+    """Names that reach an operand of ``/`` or ``/=`` in ``fn``."""
+    names: Set[str] = set()
+    for n in ast.walk(fn):
+        if isinstance(n, ast.BinOp) and isinstance(n.op, ast.Div):
+            names |= _operand_names(n.left) | _operand_names(n.right)
+        elif isinstance(n, ast.AugAssign) and isinstance(n.op, ast.Div):
+            names |= _operand_names(n.target) | _operand_names(n.value)
+    return names
+
+
+def _mixed_display_names(fn: ast.FunctionDef, env: Dict[str, str]) -> Set[str]:
+    """Names used directly as elements of list, set or dict displays whose
+    elements do not share one scalar type.
+
+    The backend types a display from its elements, so such a display is
+    lowered over Any and its elements have to stay Any as well.
+    """
+    walker = _FlowTypeWalker({})
+    names: Set[str] = set()
+    for n in ast.walk(fn):
+        if isinstance(n, ast.Dict):
+            elts = [v for v in n.values if v is not None]
+        elif isinstance(n, (ast.List, ast.Set)):
+            elts = n.elts
+        else:
+            continue
+        if len({walker.expr_type(e, env) for e in elts}) > 1:
+            names.update(e.id for e in elts if isinstance(e, ast.Name))
+    return names
+
+
+def _propagate_module_types(tree: ast.Module):
+    """Infer scalar return and parameter types across module functions.
+
+    Return types flow from each function's body into its callers; parameter
+    types flow from call sites into unannotated parameters when every call
+    in the module agrees. Iterates to a fixpoint and records results as
+    ``_inferred_return`` on functions and synthesized annotations on params.
+    """
+    funcs: Dict[str, ast.FunctionDef] = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and not node.decorator_list and not _is_generator(node):
+            funcs[node.name] = node
+
+    # Only functions that are always called directly by name can take types
+    # from their call sites.
+    call_funcs = {id(n.func) for n in ast.walk(tree)
+                  if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)}
+    escaping: Set[str] = set()
+    for n in ast.walk(tree):
+        if isinstance(n, ast.Name) and n.id in funcs and id(n) not in call_funcs:
+            escaping.add(n.id)
+        elif isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id in funcs:
+            if any(isinstance(a, ast.Starred) for a in n.args) or any(kw.arg is None for kw in n.keywords):
+                escaping.add(n.func.id)
+        elif isinstance(n, (ast.Global, ast.Nonlocal)):
+            escaping.update(name for name in n.names if name in funcs)
+
+    func_types: Dict[str, str] = {}
+    param_types: Dict[str, Dict[str, str]] = {name: {} for name in funcs}
+    divided = {name: _true_division_names(fn) for name, fn in funcs.items()}
+    rejected: Set[tuple] = set()
+
+    for _ in range(8):
+        walkers: Dict[str, _FlowTypeWalker] = {}
+        other_walkers: List[tuple] = []
+        all_calls: List[tuple] = []
+
+        module_walker = _FlowTypeWalker(func_types)
+        module_walker.walk([s for s in tree.body if not isinstance(s, ast.FunctionDef)], {})
+        all_calls.extend((None, c) for c in module_walker.calls)
+
+        for fn in ast.walk(tree):
+            if not isinstance(fn, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            env: Dict[str, str] = {}
+            all_args = fn.args.posonlyargs + fn.args.args + fn.args.kwonlyargs
+            for a in all_args:
+                env[a.arg] = _scalar_annotation(a.annotation)
+            if funcs.get(fn.name) is fn:
+                env.update(param_types[fn.name])
+                walkers[fn.name] = walker = _FlowTypeWalker(func_types)
+            else:
+                walker = _FlowTypeWalker(func_types)
+                other_walkers.append((fn, walker))
+            walker.walk(fn.body, env)
+            all_calls.extend((fn, c) for c in walker.calls)
+
+        changed = False
+
+        # Return types.
+        for name, walker in walkers.items():
+            fn = funcs[name]
+            if fn.returns is not None:
+                typ = _scalar_annotation(fn.returns)
+                if typ:
+                    func_types[name] = typ
+                continue
+            types: Set[str] = set()
+            for ret_stmt, typ in walker.return_types:
+                calls_self = any(isinstance(n, ast.Call) and isinstance(n.func, ast.Name)
+                                 and n.func.id == name for n in ast.walk(ret_stmt))
+                if not typ and calls_self and name not in func_types:
+                    # Recursive case: assume the base cases decide the type
+                    # and check the assumption on the next iteration.
+                    continue
+                types.add(typ)
+            typ = types.pop() if len(types) == 1 else ""
+            if (name, "return") in rejected:
+                typ = ""
+            if typ in ("", "None"):
+                if name in func_types:
+                    rejected.add((name, "return"))
+                    del func_types[name]
+                    changed = True
+                continue
+            if func_types.get(name) != typ:
+                func_types[name] = typ
+                changed = True
+
+        # Parameter types from call sites.
+        seen_calls = {id(call) for _, (call, _, _) in all_calls}
+        for name, fn in funcs.items():
+            if name in escaping:
+                continue
+            calls = [(owner, args, kwargs) for owner, (call, args, kwargs) in all_calls
+                     if call.func.id == name]
+            unseen = any(isinstance(n, ast.Call) and isinstance(n.func, ast.Name)
+                         and n.func.id == name and id(n) not in seen_calls
+                         for n in ast.walk(tree))
+            if unseen or not calls:
+                continue
+            positional = fn.args.posonlyargs + fn.args.args
+            defaults = [None] * (len(positional) - len(fn.args.defaults)) + list(fn.args.defaults)
+            for idx, a in enumerate(positional):
+                if a.annotation is not None or a.arg in ("self", "cls"):
+                    continue
+                key = (name, a.arg)
+                if key in rejected:
+                    continue
+                types = set()
+                for owner, args, kwargs in calls:
+                    if idx < len(args):
+                        typ = args[idx]
+                    elif a.arg in kwargs:
+                        typ = kwargs[a.arg]
+                    elif defaults[idx] is not None:
+                        typ = _FlowTypeWalker(func_types).expr_type(defaults[idx], {})
+                    else:
+                        typ = ""
+                    if not typ and owner is fn and a.arg not in param_types[name]:
+                        continue
+                    types.add(typ)
+                typ = types.pop() if len(types) == 1 else ""
+                if not typ:
+                    if a.arg in param_types[name]:
+                        rejected.add(key)
+                        del param_types[name][a.arg]
+                        changed = True
+                    continue
+                # V divides ints with truncation, so a parameter that
+                # reaches `/` takes the float Python would produce.
+                if typ == "int" and a.arg in divided[name]:
+                    typ = "float"
+                if param_types[name].get(a.arg) != typ:
+                    param_types[name][a.arg] = typ
+                    changed = True
+            for arg in _mixed_display_names(fn, param_types[name]):
+                if arg in param_types[name]:
+                    rejected.add((name, arg))
+                    del param_types[name][arg]
+                    changed = True
+
+        if not changed:
+            break
+
+    for name, fn in funcs.items():
+        if name in func_types and fn.returns is None:
+            fn._inferred_return = func_types[name]
+        for a in fn.args.posonlyargs + fn.args.args:
+            typ = param_types[name].get(a.arg, "")
+            if typ and a.annotation is None:
+                a.annotation = ast.Name(id=typ, ctx=ast.Load())
+    # Methods and nested functions only take their return type from their
+    # own body.
+    for fn, walker in other_walkers:
+        types = {typ for _, typ in walker.return_types}
+        if fn.returns is None and not _is_generator(fn) and len(types) == 1:
+            typ = types.pop()
+            if typ not in ("", "None"):
+                fn._inferred_return = typ
+
+
 def _has_main_guard(tree: ast.Module) -> Optional[ast.If]:
     """Find `if __name__ == "__main__":` at the module level."""
     for node in tree.body:
@@ -668,6 +1254,668 @@ def _detect_class_methods(tree: ast.Module):
                     item._class_name = node.name
 
 
+def _tuple_return_arity(node: ast.FunctionDef) -> int:
+    """Return N when every return in `node` yields an N-tuple literal (N >= 2)
+    and any return annotation agrees; 0 otherwise."""
+    arity = 0
+    returns = _collect_returns_excluding_nested(node)
+    if not returns:
+        return 0
+    for ret in returns:
+        if not isinstance(ret.value, ast.Tuple) or len(ret.value.elts) < 2:
+            return 0
+        if any(isinstance(e, ast.Starred) for e in ret.value.elts):
+            return 0
+        if arity and len(ret.value.elts) != arity:
+            return 0
+        arity = len(ret.value.elts)
+    ann = node.returns
+    if ann is None or (isinstance(ann, ast.Name) and ann.id in ("tuple", "Tuple")):
+        return arity
+    if (isinstance(ann, ast.Subscript) and isinstance(ann.value, ast.Name)
+            and ann.value.id in ("tuple", "Tuple") and isinstance(ann.slice, ast.Tuple)):
+        elts = ann.slice.elts
+        if len(elts) == arity and not any(
+                isinstance(e, ast.Constant) and e.value is Ellipsis for e in elts):
+            return arity
+    return 0
+
+
+def _detect_multi_return_functions(tree: ast.Module):
+    """Mark top-level functions whose tuple results are always unpacked at
+    the call site, so they can be emitted as V multi-return functions."""
+    candidates: Dict[str, int] = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and not _is_generator(node):
+            arity = _tuple_return_arity(node)
+            if arity:
+                candidates[node.name] = arity
+    if not candidates:
+        return
+
+    parents: Dict[int, ast.AST] = {}
+    for parent in ast.walk(tree):
+        for child in ast.iter_child_nodes(parent):
+            parents[id(child)] = parent
+
+    for name_node in ast.walk(tree):
+        if not isinstance(name_node, ast.Name) or name_node.id not in candidates:
+            continue
+        call = parents.get(id(name_node))
+        stmt = parents.get(id(call)) if call is not None else None
+        consumed = False
+        if isinstance(call, ast.Call) and call.func is name_node:
+            if isinstance(stmt, ast.Expr):
+                consumed = True
+            elif (isinstance(stmt, ast.Assign) and stmt.value is call
+                    and len(stmt.targets) == 1
+                    and isinstance(stmt.targets[0], ast.Tuple)):
+                elts = stmt.targets[0].elts
+                consumed = (len(elts) == candidates[name_node.id]
+                            and all(isinstance(e, ast.Name) for e in elts))
+        if not consumed:
+            del candidates[name_node.id]
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in candidates:
+            node._multi_return = True
+
+
+
+def _detect_string_builders(tree: ast.Module):
+    """Mark string accumulators that can be lowered to a strings.Builder.
+
+    A local initialised from a string literal, extended only with ``+=``
+    inside loops at the top level of its function, and read only after the
+    last of those loops qualifies. The init and the appends get
+    ``_string_builder``; the last appending loop lists the name in
+    ``_builder_flush`` so the backend materialises the string after it.
+    """
+    for fn in ast.walk(tree):
+        if not isinstance(fn, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        scoped: Set[str] = set()
+        for node in ast.walk(fn):
+            if isinstance(node, (ast.Global, ast.Nonlocal)):
+                scoped.update(node.names)
+            elif node is not fn and isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef,
+                                                        ast.Lambda, ast.ClassDef)):
+                scoped.update(n.id for n in ast.walk(node) if isinstance(n, ast.Name))
+        for init_idx, init in enumerate(fn.body):
+            if not (isinstance(init, ast.Assign) and len(init.targets) == 1
+                    and isinstance(init.targets[0], ast.Name)
+                    and isinstance(init.value, ast.Constant)
+                    and isinstance(init.value.value, str)):
+                continue
+            name = init.targets[0].id
+            if name in scoped:
+                continue
+            appends: List[ast.AugAssign] = []
+            last_loop: Optional[ast.stmt] = None
+            read = False
+            ok = True
+            for idx, stmt in enumerate(fn.body):
+                if stmt is init:
+                    continue
+                refs = [n for n in ast.walk(stmt) if isinstance(n, ast.Name) and n.id == name]
+                if not refs:
+                    continue
+                if idx < init_idx:
+                    ok = False
+                    break
+                if isinstance(stmt, (ast.For, ast.While)):
+                    stmt_appends = [n for n in ast.walk(stmt)
+                                    if isinstance(n, ast.AugAssign) and isinstance(n.op, ast.Add)
+                                    and isinstance(n.target, ast.Name) and n.target.id == name]
+                    append_targets = {id(n.target) for n in stmt_appends}
+                    if read or any(id(r) not in append_targets for r in refs):
+                        ok = False
+                        break
+                    appends.extend(stmt_appends)
+                    last_loop = stmt
+                elif all(isinstance(r.ctx, ast.Load) for r in refs):
+                    read = True
+                else:
+                    ok = False
+                    break
+            if not ok or last_loop is None:
+                continue
+            init._string_builder = True
+            for aug in appends:
+                aug._string_builder = True
+            last_loop._builder_flush = getattr(last_loop, "_builder_flush", []) + [name]
+
+
+_SCALAR_ANNOTATIONS = {"int", "float", "str", "bool"}
+
+
+def _recursive_returns(stmts: List[ast.stmt], out: List[ast.Return]) -> bool:
+    """Collect the Return statements of a body that only nests them under
+    ``if``/``else``; False when a return sits inside a loop, try or with."""
+    for stmt in stmts:
+        if isinstance(stmt, ast.Return):
+            out.append(stmt)
+        elif isinstance(stmt, ast.If):
+            if not (_recursive_returns(stmt.body, out) and _recursive_returns(stmt.orelse, out)):
+                return False
+        elif any(isinstance(n, ast.Return) for n in ast.walk(stmt)):
+            return False
+    return True
+
+
+def _detect_recursion_loops(tree: ast.Module):
+    """Mark self-recursive functions that can be emitted as loops.
+
+    Every self-call must be returned directly (``return f(...)``) or as one
+    operand of ``+``/``*`` (``return n * f(n - 1)``), with the same operator
+    and side throughout; the latter needs an int/float (or str for ``+``)
+    return annotation so the pending operands fold into an accumulator.
+    Parameters rebound by the calls must be scalar-annotated and never
+    assigned in the body. The function gets ``_recursion_loop`` ('tail' or
+    'accumulate'), its rebound ``_loop_params``, ``_accumulator_op`` and
+    ``_acc_prepend`` (the call is the left operand); each return is
+    tagged ``_recursion`` 'tail' or 'base'.
+    """
+    for fn in tree.body:
+        if not isinstance(fn, ast.FunctionDef) or fn.decorator_list or _is_generator(fn):
+            continue
+        args = fn.args
+        if (args.posonlyargs or args.vararg or args.kwonlyargs or args.kwarg
+                or args.defaults or getattr(fn, "_multi_return", False)):
+            continue
+        params = [a.arg for a in args.args]
+        if any(isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef,
+                              ast.Global, ast.Nonlocal))
+               for stmt in fn.body for n in ast.walk(stmt)):
+            continue
+        if any(isinstance(n, ast.Name) and n.id in params and not isinstance(n.ctx, ast.Load)
+               for n in ast.walk(fn)):
+            continue
+        calls = [n for n in ast.walk(fn) if isinstance(n, ast.Call)
+                 and isinstance(n.func, ast.Name) and n.func.id == fn.name]
+        returns: List[ast.Return] = []
+        if not calls or not _recursive_returns(fn.body, returns):
+            continue
+        tail: List[ast.Return] = []
+        shapes = set()
+        for ret in returns:
+            value = ret.value
+            if isinstance(value, ast.Call) and value in calls:
+                tail.append(ret)
+                shapes.add(None)
+            elif (isinstance(value, ast.BinOp) and isinstance(value.op, (ast.Add, ast.Mult))
+                    and (value.left in calls) != (value.right in calls)):
+                tail.append(ret)
+                shapes.add((type(value.op), value.right in calls))
+        if len(tail) != len(calls) or len(shapes) != 1:
+            continue
+        if any(len(call.args) != len(params) or call.keywords
+               or any(isinstance(a, ast.Starred) for a in call.args)
+               or any(c in calls for a in call.args for c in ast.walk(a))
+               for call in calls):
+            continue
+        shape = shapes.pop()
+        if shape is not None:
+            ret_ann = _annotation_to_str(fn.returns) if fn.returns is not None else ""
+            allowed = {"int", "float", "str"} if shape[0] is ast.Add else {"int", "float"}
+            if ret_ann not in allowed:
+                continue
+            if any(r.value is None for r in returns):
+                continue
+            if not shape[1] and any(isinstance(n, ast.Call) for r in tail
+                                    for n in ast.walk(r.value.right)):
+                # Python evaluates a right operand after the recursive call;
+                # the loop folds it first, so it must be free of side effects.
+                continue
+        loop_params = [
+            name for i, name in enumerate(params)
+            if any(not (isinstance(call.args[i], ast.Name) and call.args[i].id == name)
+                   for call in calls)
+        ]
+        if any(a.annotation is None or _annotation_to_str(a.annotation) not in _SCALAR_ANNOTATIONS
+               for a in args.args if a.arg in loop_params):
+            continue
+        fn._recursion_loop = "tail" if shape is None else "accumulate"
+        fn._loop_params = loop_params
+        if shape is not None:
+            fn._accumulator_op = "+" if shape[0] is ast.Add else "*"
+            fn._acc_prepend = not shape[1]
+        for ret in returns:
+            ret._recursion = "tail" if ret in tail else "base"
+
+
+_PARALLEL_PRAGMA = "py2v: parallel"
+_BUFFERED_OUTPUT_PRAGMA = "py2v: buffered-output"
+_PURE_BUILTINS = {"abs", "bool", "divmod", "float", "int", "len", "max", "min", "pow",
+                  "round", "str", "sum"}
+
+
+def _pragma_lines(source: str, pragma: str) -> Set[int]:
+    """Lines a ``# py2v: ...`` pragma comment applies to: its own line, and
+    the next one when the comment stands on a line by itself."""
+    lines: Set[int] = set()
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(source).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return lines
+    for tok in tokens:
+        if tok.type != tokenize.COMMENT or tok.string.lstrip("#").strip() != pragma:
+            continue
+        lines.add(tok.start[0])
+        if not tok.line[:tok.start[1]].strip():
+            lines.add(tok.start[0] + 1)
+    return lines
+
+
+def _parallel_loop_value(node: ast.AST) -> Optional[ast.expr]:
+    """The per-item expression of a loop that can run its iterations in
+    parallel, or None.
+
+    Comprehensions need one unfiltered generator over a plain name; ``for``
+    loops must be ``for i in range(...): out[i] = expr`` with ``expr`` not
+    reading ``out``.
+    """
+    if isinstance(node, (ast.ListComp, ast.GeneratorExp)):
+        if len(node.generators) != 1:
+            return None
+        gen = node.generators[0]
+        if gen.ifs or gen.is_async or not isinstance(gen.target, ast.Name):
+            return None
+        value = node.elt
+    elif isinstance(node, ast.For):
+        call = node.iter
+        if (node.orelse or len(node.body) != 1 or not isinstance(node.target, ast.Name)
+                or not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name)
+                or call.func.id != "range" or not 1 <= len(call.args) <= 2 or call.keywords):
+            return None
+        stmt = node.body[0]
+        if not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1:
+            return None
+        target = stmt.targets[0]
+        if (not isinstance(target, ast.Subscript) or not isinstance(target.value, ast.Name)
+                or not isinstance(target.slice, ast.Name)
+                or target.slice.id != node.target.id):
+            return None
+        out = target.value.id
+        if any(isinstance(n, ast.Name) and n.id == out for n in ast.walk(stmt.value)):
+            return None
+        value = stmt.value
+    else:
+        return None
+    if any(isinstance(n, (ast.NamedExpr, ast.Await, ast.Yield, ast.YieldFrom))
+           for n in ast.walk(value)):
+        return None
+    return value
+
+
+def _pure_functions(tree: ast.Module) -> Set[str]:
+    """Module-level functions without side effects: they store nothing but
+    local names and only call pure functions, ``math`` or pure builtins."""
+    candidates = {fn.name: fn for fn in tree.body
+                  if isinstance(fn, ast.FunctionDef) and not fn.decorator_list
+                  and not _is_generator(fn)}
+    pure = set(candidates)
+    changed = True
+    while changed:
+        changed = False
+        for name in sorted(pure):
+            fn = candidates[name]
+            for node in ast.walk(fn):
+                if node is fn:
+                    continue
+                if isinstance(node, (ast.Global, ast.Nonlocal, ast.Delete, ast.FunctionDef,
+                                     ast.AsyncFunctionDef, ast.ClassDef, ast.Await)):
+                    break
+                if (isinstance(node, (ast.Attribute, ast.Subscript))
+                        and not isinstance(node.ctx, ast.Load)):
+                    break
+                if isinstance(node, ast.Call) and not _is_pure_call(node, pure):
+                    break
+            else:
+                continue
+            pure.discard(name)
+            changed = True
+    return pure
+
+
+def _is_pure_call(call: ast.Call, pure: Set[str]) -> bool:
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id in _PURE_BUILTINS or func.id in pure
+    return (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+            and func.value.id == "math")
+
+
+def _detect_parallel_loops(tree: ast.Module, source: str, auto: bool):
+    """Mark loops and comprehensions to run their iterations on worker
+    threads, as ``_parallel``.
+
+    A loop qualifies when its shape allows it (see ``_parallel_loop_value``)
+    and it carries a ``# py2v: parallel`` pragma, or, with ``auto``, when its
+    per-item expression calls a module function and only pure functions.
+    Generator expressions are left to the pragma, as any()/all()/next()
+    stop consuming them early.
+    """
+    pragma_lines = _pragma_lines(source, _PARALLEL_PRAGMA)
+    if not pragma_lines and not auto:
+        return
+    pure = _pure_functions(tree) if auto else set()
+    for node in ast.walk(tree):
+        value = _parallel_loop_value(node)
+        if value is None:
+            continue
+        if node.lineno in pragma_lines:
+            node._parallel = True
+        elif auto and not isinstance(node, ast.GeneratorExp):
+            calls = [n for n in ast.walk(value) if isinstance(n, ast.Call)]
+            if (any(isinstance(c.func, ast.Name) and c.func.id in pure for c in calls)
+                    and all(_is_pure_call(c, pure) for c in calls)):
+                node._parallel = True
+
+
+# Calls that give the same result whether or not their receiver still ends
+# in a line terminator, mapped to the arguments they may take
+_LINE_END_TRIMS = {"strip": ("\n", "\r\n"), "rstrip": ("\n", "\r\n"), "split": (),
+                   "splitlines": ()}
+
+
+def _trims_line_end(node: ast.AST, name: str) -> bool:
+    """Whether ``node`` is a call like ``name.rstrip()`` or ``name.split()``
+    that drops the trailing newline of ``name``."""
+    if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name) and node.func.value.id == name
+            and node.func.attr in _LINE_END_TRIMS and not node.keywords):
+        return False
+    if not node.args:
+        return True
+    return (len(node.args) == 1 and isinstance(node.args[0], ast.Constant)
+            and node.args[0].value in _LINE_END_TRIMS[node.func.attr])
+
+
+def _detect_line_loops(tree: ast.Module):
+    """Mark loops over lines (of a file, ``sys.stdin`` or ``readlines()``)
+    whose body never sees the line terminator, as ``_line_end_unused``: the
+    line is trimmed before any other use.
+    """
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.For) and isinstance(node.target, ast.Name)
+                and node.body):
+            continue
+        it = node.iter
+        if not (isinstance(it, (ast.Name, ast.Attribute))
+                or (isinstance(it, ast.Call) and isinstance(it.func, ast.Name)
+                    and it.func.id == "open")
+                or (isinstance(it, ast.Call) and isinstance(it.func, ast.Attribute)
+                    and it.func.attr == "readlines")):
+            continue
+        name = node.target.id
+        first = node.body[0]
+        # `line = line.rstrip()` up front hides the newline from the rest
+        if (isinstance(first, ast.Assign) and len(first.targets) == 1
+                and isinstance(first.targets[0], ast.Name) and first.targets[0].id == name
+                and _trims_line_end(first.value, name)):
+            node._line_end_unused = True
+            continue
+        trimmed = set()
+        uses = []
+        for stmt in node.body:
+            for n in ast.walk(stmt):
+                if _trims_line_end(n, name):
+                    trimmed.add(id(n.func.value))
+                elif isinstance(n, ast.Name) and n.id == name:
+                    uses.append(n)
+        if uses and all(id(n) in trimmed for n in uses):
+            node._line_end_unused = True
+
+
+_STR_METHODS = {"lower", "upper", "strip", "lstrip", "rstrip", "replace", "title",
+                "casefold", "capitalize", "join"}
+_DEFAULT_FACTORY_TYPES = {"int": "int", "float": "float", "str": "str", "bool": "bool",
+                          "list": "list", "set": "set"}
+
+
+def _local_expr_type(node: ast.AST, env: Dict[str, str]) -> str:
+    """Best-effort Python type string of an expression from annotations,
+    literals and loop variables recorded in ``env``."""
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool):
+            return "bool"
+        for py_type in (int, float, str):
+            if isinstance(node.value, py_type):
+                return py_type.__name__
+        return ""
+    if isinstance(node, ast.Name):
+        return env.get(node.id, "")
+    if isinstance(node, ast.JoinedStr):
+        return "str"
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name) and node.func.id in ("str", "int", "float", "len", "bool"):
+            return "int" if node.func.id == "len" else node.func.id
+        if isinstance(node.func, ast.Attribute):
+            if node.func.attr in ("split", "splitlines"):
+                return "list[str]"
+            if node.func.attr in _STR_METHODS and _local_expr_type(node.func.value, env) == "str":
+                return "str"
+        return ""
+    if isinstance(node, ast.Subscript):
+        coll = _local_expr_type(node.value, env)
+        if coll == "str":
+            return "str"
+        if isinstance(node.slice, ast.Slice):
+            return coll
+        if coll.startswith(("list[", "List[")):
+            return coll[coll.index("[") + 1:-1]
+        return ""
+    if isinstance(node, ast.BinOp):
+        left = _local_expr_type(node.left, env)
+        if left == "str" and isinstance(node.op, (ast.Add, ast.Mod)):
+            return "str"
+        right = _local_expr_type(node.right, env)
+        if left == right == "int":
+            return "float" if isinstance(node.op, ast.Div) else "int"
+        if {left, right} <= {"int", "float"} and "float" in (left, right):
+            return "float"
+        return ""
+    return ""
+
+
+def _iter_elem_type(node: ast.AST, env: Dict[str, str]) -> str:
+    """Element type produced by iterating ``node``."""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "range":
+        return "int"
+    coll = _local_expr_type(node, env)
+    if coll == "str":
+        return "str"
+    for prefix in ("list[", "List[", "set[", "Set["):
+        if coll.startswith(prefix):
+            return coll[len(prefix):-1]
+    if isinstance(node, (ast.List, ast.Set, ast.Tuple)) and node.elts:
+        return _local_expr_type(node.elts[0], env)
+    return ""
+
+
+def _is_queue_constructor(func: ast.expr) -> bool:
+    """True for ``Queue`` / ``asyncio.Queue`` / ``queue.Queue`` callees."""
+    if isinstance(func, ast.Attribute):
+        return (func.attr == "Queue" and isinstance(func.value, ast.Name)
+                and func.value.id in ("asyncio", "queue"))
+    return isinstance(func, ast.Name) and func.id == "Queue"
+
+
+def _is_empty_set_call(node: ast.AST) -> bool:
+    """True for a bare ``set()`` call."""
+    return (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id == "set" and not node.args and not node.keywords)
+
+
+def _set_item_type(uses: List[tuple], is_target) -> str:
+    """Element type of a set, from the first ``add``/``update`` on it.
+
+    ``uses`` pairs nodes with the type environment of their scope;
+    ``is_target`` picks the expressions that denote the set.
+    """
+    calls = [(use, env) for use, env in uses
+             if isinstance(use, ast.Call) and isinstance(use.func, ast.Attribute)
+             and use.func.attr in ("add", "update") and len(use.args) == 1
+             and is_target(use.func.value)]
+    calls.sort(key=lambda c: (c[0].lineno, c[0].col_offset))
+    for use, env in calls:
+        if use.func.attr == "add":
+            typ = _local_expr_type(use.args[0], env)
+        else:
+            typ = _iter_elem_type(use.args[0], env)
+        if typ:
+            return typ
+    return ""
+
+
+def _is_self_attr(node: ast.AST, attr: str) -> bool:
+    return (isinstance(node, ast.Attribute) and node.attr == attr
+            and isinstance(node.value, ast.Name) and node.value.id == "self")
+
+
+def _detect_counting_containers(tree: ast.Module):
+    """Type ``defaultdict(...)`` / ``Counter(...)`` constructors from usage.
+
+    Keys come from the subscripts, ``get``/``update`` calls and the counted
+    iterable; list/set values from what is appended/added to them. The
+    resulting ``dict[K, V]`` is stored on the constructor call as
+    ``_container_type`` (serialized as its v_annotation). Queue
+    constructors get ``Queue[T]`` from the items ``put`` into them, and
+    empty ``set()`` constructors, in locals or ``self`` attributes,
+    ``set[T]`` from the first item added to them.
+    """
+    scopes: List[ast.AST] = [tree] + [n for n in ast.walk(tree)
+                                      if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    scope_uses: Dict[int, List[tuple]] = {}
+    for scope in scopes:
+        own: List[ast.AST] = []
+        stack = list(scope.body)
+        while stack:
+            node = stack.pop(0)
+            own.append(node)
+            for child in ast.iter_child_nodes(node):
+                if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef,
+                                          ast.ClassDef, ast.Lambda)):
+                    stack.append(child)
+        env: Dict[str, str] = {}
+        if isinstance(scope, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for a in scope.args.args + scope.args.kwonlyargs:
+                if a.annotation is not None:
+                    env[a.arg] = _annotation_to_str(a.annotation)
+        # Two rounds so loop variables over earlier-typed names resolve.
+        for _ in range(2):
+            for node in own:
+                if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                    env[node.target.id] = _annotation_to_str(node.annotation)
+                elif (isinstance(node, ast.Assign) and len(node.targets) == 1
+                      and isinstance(node.targets[0], ast.Name)):
+                    typ = _local_expr_type(node.value, env)
+                    if typ:
+                        env.setdefault(node.targets[0].id, typ)
+                elif isinstance(node, (ast.For, ast.comprehension)):
+                    elem = _iter_elem_type(node.iter, env)
+                    if isinstance(node.target, ast.Name) and elem:
+                        env.setdefault(node.target.id, elem)
+                    elif (isinstance(node.target, ast.Tuple) and len(node.target.elts) == 2
+                          and isinstance(node.iter, ast.Call)
+                          and isinstance(node.iter.func, ast.Name)
+                          and node.iter.func.id == "enumerate" and node.iter.args):
+                        idx, val = node.target.elts
+                        if isinstance(idx, ast.Name):
+                            env.setdefault(idx.id, "int")
+                        val_type = _iter_elem_type(node.iter.args[0], env)
+                        if isinstance(val, ast.Name) and val_type:
+                            env.setdefault(val.id, val_type)
+        scope_uses[id(scope)] = [(node, env) for node in own]
+
+        for node in own:
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)
+                    and _is_empty_set_call(node.value)):
+                name = node.targets[0].id
+                item_type = _set_item_type(scope_uses[id(scope)],
+                                           lambda e: isinstance(e, ast.Name) and e.id == name)
+                if item_type:
+                    node.value._container_type = f"set[{item_type}]"
+                continue
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)
+                    and isinstance(node.value, ast.Call)
+                    and _is_queue_constructor(node.value.func)):
+                name = node.targets[0].id
+                item_types = {_local_expr_type(use.args[0], env) for use in own
+                              if isinstance(use, ast.Call) and isinstance(use.func, ast.Attribute)
+                              and use.func.attr in ("put", "put_nowait") and use.args
+                              and isinstance(use.func.value, ast.Name)
+                              and use.func.value.id == name}
+                item_types.discard("")
+                if len(item_types) == 1:
+                    node.value._container_type = f"Queue[{item_types.pop()}]"
+                continue
+            if not (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)
+                    and isinstance(node.value, ast.Call)
+                    and isinstance(node.value.func, ast.Name)
+                    and node.value.func.id in ("defaultdict", "Counter")):
+                continue
+            name = node.targets[0].id
+            call = node.value
+            key_types: List[str] = []
+            elem_types: List[str] = []
+            if call.func.id == "Counter":
+                value_type = "int"
+                if call.args:
+                    key_types.append(_iter_elem_type(call.args[0], env))
+            else:
+                factory = call.args[0] if call.args else None
+                value_type = ""
+                if isinstance(factory, ast.Name):
+                    value_type = _DEFAULT_FACTORY_TYPES.get(factory.id, "")
+                if not value_type:
+                    continue
+            for use in own:
+                if (isinstance(use, ast.Subscript) and isinstance(use.value, ast.Name)
+                        and use.value.id == name):
+                    key_types.append(_local_expr_type(use.slice, env))
+                elif (isinstance(use, ast.Call) and isinstance(use.func, ast.Attribute)
+                      and isinstance(use.func.value, ast.Name) and use.func.value.id == name
+                      and use.args):
+                    if use.func.attr == "get":
+                        key_types.append(_local_expr_type(use.args[0], env))
+                    elif use.func.attr == "update" and call.func.id == "Counter":
+                        key_types.append(_iter_elem_type(use.args[0], env))
+                elif (isinstance(use, ast.Call) and isinstance(use.func, ast.Attribute)
+                      and use.func.attr in ("append", "add") and use.args
+                      and isinstance(use.func.value, ast.Subscript)
+                      and isinstance(use.func.value.value, ast.Name)
+                      and use.func.value.value.id == name):
+                    elem_types.append(_local_expr_type(use.args[0], env))
+            known_keys = {k for k in key_types if k}
+            key_type = known_keys.pop() if len(known_keys) == 1 else "str"
+            if value_type in ("list", "set"):
+                known_elems = {e for e in elem_types if e}
+                if len(known_elems) != 1:
+                    continue
+                value_type = f"{value_type}[{known_elems.pop()}]"
+            call._container_type = f"dict[{key_type}, {value_type}]"
+
+    # Sets held in attributes are filled by any method of their class.
+    for cls in ast.walk(tree):
+        if not isinstance(cls, ast.ClassDef):
+            continue
+        methods = [m for m in cls.body if isinstance(m, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        uses = [u for m in methods for u in scope_uses.get(id(m), [])]
+        for node, _ in uses:
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Attribute)
+                    and _is_self_attr(node.targets[0], node.targets[0].attr)
+                    and _is_empty_set_call(node.value)):
+                attr = node.targets[0].attr
+                item_type = _set_item_type(uses, lambda e: _is_self_attr(e, attr))
+                if item_type:
+                    node.value._container_type = f"set[{item_type}]"
+
 
 def _extract_class_declarations(node: ast.ClassDef) -> Dict[str, str]:
     """Extract field declarations from a class body (AnnAssign, Assign, or __init__)."""
@@ -695,7 +1943,11 @@ def _extract_class_declarations(node: ast.ClassDef) -> Dict[str, str]:
                       and isinstance(stmt.targets[0], ast.Attribute)
                       and isinstance(stmt.targets[0].value, ast.Name)
                       and stmt.targets[0].value.id == "self"):
+                    # An empty set() field is typed from what is added to it
                     decls[stmt.targets[0].attr] = ""
+                    if _is_empty_set_call(stmt.value):
+                        decls[stmt.targets[0].attr] = getattr(
+                            stmt.value, "_container_type", "set[str]")
     return decls
 
 
@@ -777,12 +2029,14 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
         docstring = _extract_docstring(node)
         if docstring:
             result["docstring_comment"] = docstring
+        if getattr(node, "_buffered_output", False):
+            result["buffered_output"] = True
 
     elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
         result["name"] = node.name
 
         # Compute mutable vars within this function FIRST
-        tracker = ScopeTracker()
+        tracker = ScopeTracker(ctx.cached_properties, ctx.in_place_calls)
         tracker.visit(node)
         func_mutable = tracker.mutable
         result["mutable_vars"] = sorted(func_mutable)
@@ -838,7 +2092,7 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
                     elif typ != '':
                         local_ann[tgt] = typ
 
-        result["body"] = [_node_to_dict(n, func_mutable, redefined, AnalysisContext(local_ann, ctx.func_ret_annotations)) for n in node.body]
+        result["body"] = [_node_to_dict(n, func_mutable, redefined, AnalysisContext(local_ann, ctx.func_ret_annotations, ctx.cached_properties, ctx.in_place_calls)) for n in node.body]
         result["decorator_list"] = [_node_to_dict(d, mutable_vars, redefined, ctx) for d in node.decorator_list]
         result["returns"] = _node_to_dict(node.returns, mutable_vars, redefined, ctx) if node.returns else None
         result["type_comment"] = getattr(node, "type_comment", None)
@@ -848,7 +2102,14 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
         result["class_name"] = getattr(node, "_class_name", "")
         result["decorator_kind"] = _detect_decorator_kind(node.decorator_list)
         result["dunder_op"] = _dunder_to_v_op(node.name)
-        inferred_ret = _infer_return_type(node)
+        result["multi_return"] = getattr(node, "_multi_return", False)
+        if getattr(node, "_recursion_loop", ""):
+            result["recursion_loop"] = node._recursion_loop
+            result["loop_params"] = node._loop_params
+            result["accumulator_op"] = getattr(node, "_accumulator_op", "")
+            result["acc_prepend"] = getattr(node, "_acc_prepend", False)
+        inferred_ret = _infer_return_type(node) or _normalize_inferred_type_name(
+            getattr(node, "_inferred_return", ""))
         if inferred_ret:
             result["v_annotation"] = inferred_ret
 
@@ -871,6 +2132,8 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
 
     elif isinstance(node, ast.Return):
         result["value"] = _node_to_dict(node.value, mutable_vars, redefined, ctx) if node.value else None
+        if getattr(node, "_recursion", ""):
+            result["recursion"] = node._recursion
 
     elif isinstance(node, ast.Delete):
         result["targets"] = [_node_to_dict(t, mutable_vars, redefined, ctx) for t in node.targets]
@@ -882,6 +2145,8 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
         redef = redefined.get(id(node), [])
         if redef:
             result["redefined_targets"] = redef
+        if getattr(node, "_string_builder", False):
+            result["string_builder"] = True
         # Mark TypeVar assignments so the backend can skip them
         if (isinstance(node.value, ast.Call)
                 and isinstance(node.value.func, (ast.Name, ast.Attribute))):
@@ -917,6 +2182,8 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
         result["target"] = _node_to_dict(node.target, mutable_vars, redefined, ctx)
         result["op"] = {"_type": type(node.op).__name__}
         result["value"] = _node_to_dict(node.value, mutable_vars, redefined, ctx)
+        if getattr(node, "_string_builder", False):
+            result["string_builder"] = True
 
     elif isinstance(node, ast.AnnAssign):
         result["target"] = _node_to_dict(node.target, mutable_vars, redefined, ctx)
@@ -931,12 +2198,18 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
         result["orelse"] = [_node_to_dict(n, mutable_vars, redefined, ctx) for n in node.orelse]
         result["type_comment"] = getattr(node, "type_comment", None)
         result["level"] = getattr(node, "_level", 0)
+        result["builder_flush"] = getattr(node, "_builder_flush", [])
+        if getattr(node, "_parallel", False):
+            result["parallel"] = True
+        if getattr(node, "_line_end_unused", False):
+            result["line_end_unused"] = True
 
     elif isinstance(node, ast.While):
         result["test"] = _node_to_dict(node.test, mutable_vars, redefined, ctx)
         result["body"] = [_node_to_dict(n, mutable_vars, redefined, ctx) for n in node.body]
         result["orelse"] = [_node_to_dict(n, mutable_vars, redefined, ctx) for n in node.orelse]
         result["level"] = getattr(node, "_level", 0)
+        result["builder_flush"] = getattr(node, "_builder_flush", [])
 
     elif isinstance(node, ast.If):
         result["test"] = _node_to_dict(node.test, mutable_vars, redefined, ctx)
@@ -1053,6 +2326,8 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
     elif isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp)):
         result["elt"] = _node_to_dict(node.elt, mutable_vars, redefined, ctx)
         result["generators"] = [_comprehension_to_dict(g, mutable_vars, redefined, ctx) for g in node.generators]
+        if getattr(node, "_parallel", False):
+            result["parallel"] = True
 
     elif isinstance(node, ast.DictComp):
         result["key"] = _node_to_dict(node.key, mutable_vars, redefined, ctx)
@@ -1083,6 +2358,8 @@ def _node_to_dict(node: ast.AST, mutable_vars: Set[str],
             fname = node.func.id
             if fname in ctx.func_ret_annotations:
                 result["v_annotation"] = ctx.func_ret_annotations[fname]
+        if getattr(node, "_container_type", ""):
+            result["v_annotation"] = node._container_type
 
     elif isinstance(node, ast.FormattedValue):
         result["value"] = _node_to_dict(node.value, mutable_vars, redefined, ctx)
@@ -1209,6 +2486,39 @@ def _gather_func_return_annotations(tree: ast.Module) -> Dict[str, str]:
     return ret
 
 
+def _gather_in_place_calls(tree: ast.Module) -> Set[str]:
+    """Collect how the in-place heapq/bisect functions are spelled in this
+    module: bare names from ``from heapq import heappush [as push]`` and
+    dotted names such as ``heapq.heappush`` or ``hq.heappush``."""
+    calls: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module in _IN_PLACE_FUNCS:
+            for alias in node.names:
+                if alias.name in _IN_PLACE_FUNCS[node.module]:
+                    calls.add(alias.asname or alias.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                for func in _IN_PLACE_FUNCS.get(alias.name, ()):
+                    calls.add(f"{alias.asname or alias.name}.{func}")
+    return calls
+
+
+def _gather_cached_properties(tree: ast.Module) -> Set[str]:
+    """Collect the names of methods decorated with @functools.cached_property."""
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for item in node.body:
+            if not isinstance(item, ast.FunctionDef):
+                continue
+            for d in item.decorator_list:
+                if (isinstance(d, ast.Name) and d.id == "cached_property") or (
+                        isinstance(d, ast.Attribute) and d.attr == "cached_property"):
+                    names.add(item.name)
+    return names
+
+
 def _arguments_to_dict(args: ast.arguments, mutable_vars: Set[str]) -> Dict[str, Any]:
     return {
         "_type": "arguments",
@@ -1319,8 +2629,12 @@ def _comprehension_to_dict(comp: ast.comprehension, mutable_vars: Set[str],
 # Main entry point
 # ---------------------------------------------------------------------------
 
-def process_file(file_path: str) -> str:
-    """Parse, analyze, and return enriched JSON AST."""
+def process_file(file_path: str, auto_parallel: bool = False) -> str:
+    """Parse, analyze, and return enriched JSON AST.
+
+    ``auto_parallel`` also marks loops whose per-item work is pure to run in
+    parallel, not only those with a ``# py2v: parallel`` pragma.
+    """
     with open(file_path, "r", encoding="utf-8") as f:
         source = f.read()
 
@@ -1332,11 +2646,38 @@ def process_file(file_path: str) -> str:
     # Detect class methods
     _detect_class_methods(tree)
 
+    # Detect tuple-returning functions that can use V multi-return
+    _detect_multi_return_functions(tree)
+
+    # Detect string accumulators that can use a strings.Builder
+    _detect_string_builders(tree)
+
+    # Detect self-recursive functions that can be emitted as loops
+    _detect_recursion_loops(tree)
+
+    # Detect loops and comprehensions whose iterations can run in parallel
+    _detect_parallel_loops(tree, source, auto_parallel)
+
+    # Detect line loops whose body never sees the line terminator
+    _detect_line_loops(tree)
+
+    # A `# py2v: buffered-output` pragma anywhere buffers all prints
+    if _pragma_lines(source, _BUFFERED_OUTPUT_PRAGMA):
+        tree._buffered_output = True
+
+    # Type defaultdict / Counter constructors from how they are used
+    _detect_counting_containers(tree)
+
+    # Propagate scalar types through function returns and call sites
+    _propagate_module_types(tree)
+
     # Detect nesting levels
     _detect_nesting_levels(tree)
 
     # Track mutability
-    tracker = ScopeTracker()
+    cached_properties = _gather_cached_properties(tree)
+    in_place_calls = _gather_in_place_calls(tree)
+    tracker = ScopeTracker(cached_properties, in_place_calls)
     tracker.visit(tree)
     mutable_vars = tracker.mutable
 
@@ -1348,6 +2689,8 @@ def process_file(file_path: str) -> str:
     ctx = AnalysisContext(
         var_annotations=_gather_var_annotations(tree),
         func_ret_annotations=_gather_func_return_annotations(tree),
+        cached_properties=cached_properties,
+        in_place_calls=in_place_calls,
     )
 
     result = _node_to_dict(tree, mutable_vars, redefined, ctx)
@@ -1411,17 +2754,21 @@ def _match_case_to_dict(case, mutable_vars, redefined, ctx):
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python frontend/ast_dump.py <source.py>", file=sys.stderr)
+    args = sys.argv[1:]
+    auto_parallel = "--auto-parallel" in args
+    if auto_parallel:
+        args.remove("--auto-parallel")
+    if len(args) != 1:
+        print("Usage: python frontend/ast_dump.py [--auto-parallel] <source.py>", file=sys.stderr)
         sys.exit(1)
 
-    file_path = sys.argv[1]
+    file_path = args[0]
     if not os.path.isfile(file_path):
         print(f"Error: File '{file_path}' does not exist.", file=sys.stderr)
         sys.exit(1)
 
     try:
-        print(process_file(file_path))
+        print(process_file(file_path, auto_parallel))
     except SyntaxError as e:
         print(f"SyntaxError in '{file_path}': {e}", file=sys.stderr)
         sys.exit(1)
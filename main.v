@@ -11,8 +11,11 @@ fn main() {
 		eprintln('Transpiles Python source code to V.')
 		eprintln('')
 		eprintln('Options:')
-		eprintln('  -o <file>    Write output to file instead of stdout')
-		eprintln('  -h, --help       Show this help message')
+		eprintln('  -o <file>          Write output to file instead of stdout')
+		eprintln('  --report           List the conversions applied (on stderr)')
+		eprintln('  --auto-parallel    Run pure loops and comprehensions on worker threads')
+		eprintln('  --buffered-output  Buffer print() output and write it in large chunks')
+		eprintln('  -h, --help         Show this help message')
 		exit(1)
 	}
 
@@ -20,6 +23,9 @@ fn main() {
 	mut input_file := ''
 	mut output_file := ''
 	mut module_name := 'main'
+	mut report := false
+	mut auto_parallel := false
+	mut buffered_output := false
 	mut i := 0
 
 	for i < args.len {
@@ -27,14 +33,26 @@ fn main() {
 		if arg == '-o' && i + 1 < args.len {
 			output_file = args[i + 1]
 			i += 2
+		} else if arg == '--report' {
+			report = true
+			i++
+		} else if arg == '--auto-parallel' {
+			auto_parallel = true
+			i++
+		} else if arg == '--buffered-output' {
+			buffered_output = true
+			i++
 		} else if arg == '-h' || arg == '--help' {
 			eprintln('Usage: py2v <input.py> [-o output.v]')
 			eprintln('')
 			eprintln('Transpiles Python source code to V.')
 			eprintln('')
 			eprintln('Options:')
-			eprintln('  -o <file>    Write output to file instead of stdout')
-			eprintln('  -h, --help       Show this help message')
+			eprintln('  -o <file>          Write output to file instead of stdout')
+			eprintln('  --report           List the conversions applied (on stderr)')
+			eprintln('  --auto-parallel    Run pure loops and comprehensions on worker threads')
+			eprintln('  --buffered-output  Buffer print() output and write it in large chunks')
+			eprintln('  -h, --help         Show this help message')
 			exit(0)
 		} else if !arg.starts_with('-') {
 			input_file = arg
@@ -82,7 +100,8 @@ fn main() {
 
 	// Run Python frontend to get JSON AST
 	python_cmd := $if windows { 'python' } $else { 'python3' }
-	result := os.execute('${python_cmd} "${ast_dump_path}" "${input_file}"')
+	frontend_flags := if auto_parallel { '--auto-parallel ' } else { '' }
+	result := os.execute('${python_cmd} "${ast_dump_path}" ${frontend_flags}"${input_file}"')
 	if result.exit_code != 0 {
 		eprintln('Error running Python frontend:')
 		eprintln(result.output)
@@ -100,7 +119,13 @@ fn main() {
 	// Transpile to V
 	mut transpiler := new_transpiler()
 	transpiler.module_name = module_name
+	transpiler.buffered_output = buffered_output
 	v_code := transpiler.visit_module(ast)
+	if report {
+		for line in transpiler.report {
+			eprintln(line)
+		}
+	}
 
 	// Format with vfmt
 	formatted_code := format_v_code(v_code)
@@ -91,6 +91,7 @@ fn parse_module(m map[string]json2.Any) !Module {
 		body:              body
 		loc:               parse_location(m)
 		docstring_comment: docstring
+		buffered_output:   m['buffered_output'] or { json2.Any(false) }.bool()
 	}
 }
 
@@ -291,6 +292,11 @@ fn parse_function_def(m map[string]json2.Any) FunctionDef {
 		decorator_kind:  m['decorator_kind'] or { json2.Any('') }.str()
 		dunder_op:       m['dunder_op'] or { json2.Any('') }.str()
 		v_annotation:    m['v_annotation'] or { json2.Any('') }.str()
+		multi_return:    m['multi_return'] or { json2.Any(false) }.bool()
+		recursion_loop:  m['recursion_loop'] or { json2.Any('') }.str()
+		loop_params:     (m['loop_params'] or { json2.Any([]json2.Any{}) }).as_array().map(it.str())
+		accumulator_op:  m['accumulator_op'] or { json2.Any('') }.str()
+		acc_prepend:     m['acc_prepend'] or { json2.Any(false) }.bool()
 	}
 }
 
@@ -313,6 +319,11 @@ fn parse_async_function_def(m map[string]json2.Any) AsyncFunctionDef {
 		decorator_kind:  fd.decorator_kind
 		dunder_op:       fd.dunder_op
 		v_annotation:    fd.v_annotation
+		multi_return:    fd.multi_return
+		recursion_loop:  fd.recursion_loop
+		loop_params:     fd.loop_params
+		accumulator_op:  fd.accumulator_op
+		acc_prepend:     fd.acc_prepend
 	}
 }
 
@@ -473,8 +484,9 @@ fn parse_keyword(m map[string]json2.Any) Keyword {
 // Parse Return
 fn parse_return(m map[string]json2.Any) Return {
 	return Return{
-		value: parse_optional_expr(m['value'] or { json2.Any(json2.Null{}) })
-		loc:   parse_location(m)
+		value:     parse_optional_expr(m['value'] or { json2.Any(json2.Null{}) })
+		loc:       parse_location(m)
+		recursion: m['recursion'] or { json2.Any('') }.str()
 	}
 }
 
@@ -523,20 +535,22 @@ fn parse_assign(m map[string]json2.Any) Assign {
 		is_typevar_assign: m['is_typevar_assign'] or { json2.Any(false) }.bool()
 		literal_values:    (m['literal_values'] or { json2.Any([]json2.Any{}) }).as_array().map(it.str())
 		literal_name:      m['literal_name'] or { json2.Any('') }.str()
+		string_builder:    m['string_builder'] or { json2.Any(false) }.bool()
 	}
 }
 
 // Parse AugAssign
 fn parse_aug_assign(m map[string]json2.Any) AugAssign {
 	return AugAssign{
-		target: parse_expr(map_field(m, 'target')) or { Expr(Constant{
+		target:         parse_expr(map_field(m, 'target')) or { Expr(Constant{
 			value: NoneValue{}
 		}) }
-		op:     parse_operator(map_field(m, 'op'))
-		value:  parse_expr(map_field(m, 'value')) or { Expr(Constant{
+		op:             parse_operator(map_field(m, 'op'))
+		value:          parse_expr(map_field(m, 'value')) or { Expr(Constant{
 			value: NoneValue{}
 		}) }
-		loc:    parse_location(m)
+		loc:            parse_location(m)
+		string_builder: m['string_builder'] or { json2.Any(false) }.bool()
 	}
 }
 
@@ -578,21 +592,24 @@ fn parse_for(m map[string]json2.Any) For {
 		}
 	}
 	return For{
-		target:       parse_expr(map_field(m, 'target')) or {
+		target:          parse_expr(map_field(m, 'target')) or {
 			Expr(Constant{
 				value: NoneValue{}
 			})
 		}
-		iter:         parse_expr(map_field(m, 'iter')) or {
+		iter:            parse_expr(map_field(m, 'iter')) or {
 			Expr(Constant{
 				value: NoneValue{}
 			})
 		}
-		body:         body
-		orelse:       orelse
-		type_comment: parse_optional_string(m['type_comment'] or { json2.Any(json2.Null{}) })
-		loc:          parse_location(m)
-		level:        m['level'] or { json2.Any(0) }.int()
+		body:            body
+		orelse:          orelse
+		type_comment:    parse_optional_string(m['type_comment'] or { json2.Any(json2.Null{}) })
+		loc:             parse_location(m)
+		level:           m['level'] or { json2.Any(0) }.int()
+		builder_flush:   (m['builder_flush'] or { json2.Any([]json2.Any{}) }).as_array().map(it.str())
+		parallel:        m['parallel'] or { json2.Any(false) }.bool()
+		line_end_unused: m['line_end_unused'] or { json2.Any(false) }.bool()
 	}
 }
 
@@ -629,13 +646,14 @@ fn parse_while(m map[string]json2.Any) While {
 		}
 	}
 	return While{
-		test:   parse_expr(map_field(m, 'test')) or { Expr(Constant{
+		test:          parse_expr(map_field(m, 'test')) or { Expr(Constant{
 			value: NoneValue{}
 		}) }
-		body:   body
-		orelse: orelse
-		loc:    parse_location(m)
-		level:  m['level'] or { json2.Any(0) }.int()
+		body:          body
+		orelse:        orelse
+		loc:           parse_location(m)
+		level:         m['level'] or { json2.Any(0) }.int()
+		builder_flush: (m['builder_flush'] or { json2.Any([]json2.Any{}) }).as_array().map(it.str())
 	}
 }
 
@@ -1302,6 +1320,7 @@ fn parse_list_comp(m map[string]json2.Any) ListComp {
 		}) }
 		generators: generators
 		loc:        parse_location(m)
+		parallel:   m['parallel'] or { json2.Any(false) }.bool()
 	}
 }
 
@@ -1358,6 +1377,7 @@ fn parse_generator_exp(m map[string]json2.Any) GeneratorExp {
 		}) }
 		generators: generators
 		loc:        parse_location(m)
+		parallel:   m['parallel'] or { json2.Any(false) }.bool()
 	}
 }
 
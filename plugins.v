@@ -21,6 +21,9 @@ fn visit_range(args []string) (string, bool) {
 
 // Handle print() call
 fn visit_print(mut t VTranspiler, node Call, args []string) (string, bool) {
+	if t.buffered_output && print_file(node) == 'sys.stdout' {
+		return visit_buffered_print(mut t, node, args), true
+	}
 	if args.len == 0 {
 		return "println('')", true
 	}
@@ -179,6 +182,11 @@ fn visit_print(mut t VTranspiler, node Call, args []string) (string, bool) {
 			parts << bool_to_python_str(arg_str)
 			continue
 		}
+		// Map-backed sets print their elements rather than the key: true pairs
+		if t.is_set_expr(arg) {
+			parts << '${arg_str}.keys()'
+			continue
+		}
 
 		// Non-string: emit expression as-is so printing relies on V's default
 		// formatting/printing behavior.
@@ -199,6 +207,107 @@ fn visit_print(mut t VTranspiler, node Call, args []string) (string, bool) {
 	return println_code, true
 }
 
+// stdout_int_types are written to the stdout buffer as digits directly
+const stdout_int_types = ['int', 'i64', 'i32', 'i16', 'i8', 'u32', 'u16', 'u8', 'byte']
+
+// print_file returns the `file=` a print() call writes to, like
+// `sys.stderr`, or 'sys.stdout' when it has none.
+fn print_file(node Call) string {
+	for kw in node.keywords {
+		if (kw.arg or { '' }) == 'file' {
+			return module_path(kw.value)
+		}
+	}
+	return 'sys.stdout'
+}
+
+// Handle print() under --buffered-output: each argument is written to the
+// stdout buffer, adjacent literal text in a single write and integers as
+// digits, without building the line as one string first.
+fn visit_buffered_print(mut t VTranspiler, node Call, args []string) string {
+	mut sep := "' '"
+	mut sep_literal := true
+	mut end := "'\\n'"
+	mut end_literal := true
+	mut flush := 'false'
+	for kw in node.keywords {
+		if kw.value is Constant && (kw.value as Constant).value is NoneValue {
+			continue
+		}
+		literal := kw.value is Constant && (kw.value as Constant).value is string
+		match kw.arg or { '' } {
+			'sep' {
+				sep = t.visit_expr(kw.value)
+				sep_literal = literal
+			}
+			'end' {
+				end = t.visit_expr(kw.value)
+				end_literal = literal
+			}
+			'flush' {
+				flush = t.visit_expr(kw.value)
+			}
+			else {}
+		}
+	}
+
+	mut writes := []string{}
+	mut text := []string{}
+	for i, arg in node.args {
+		if i > 0 {
+			write_stdout_str(mut writes, mut text, sep, sep_literal)
+		}
+		if arg is Constant && (arg as Constant).value is string {
+			write_stdout_str(mut writes, mut text, args[i], true)
+			continue
+		}
+		typ := t.infer_expr_type(arg)
+		if typ in stdout_int_types {
+			flush_stdout_text(mut writes, mut text)
+			writes << 'write_stdout_int(${args[i]})'
+		} else if typ == 'string' || get_v_annotation(arg) == 'string' {
+			write_stdout_str(mut writes, mut text, args[i], false)
+		} else if typ == 'bool' || is_bool_expr(arg) {
+			write_stdout_str(mut writes, mut text, bool_to_python_str(args[i]), false)
+		} else if t.is_set_expr(arg) {
+			write_stdout_str(mut writes, mut text, "'\${${args[i]}.keys()}'", false)
+		} else {
+			write_stdout_str(mut writes, mut text, "'\${${args[i]}}'", false)
+		}
+	}
+	write_stdout_str(mut writes, mut text, end, end_literal)
+	flush_stdout_text(mut writes, mut text)
+	if flush == 'true' {
+		writes << 'flush_stdout()'
+	} else if flush != 'false' {
+		writes << 'if ${flush} {\n\tflush_stdout()\n}'
+	}
+	if writes.len == 0 {
+		return ''
+	}
+	return t.stdout_buffer_call(writes.join('\n'))
+}
+
+// write_stdout_str adds the write of the V string `s` to `writes`; string
+// literals are held back in `text` to be merged with the ones around them.
+fn write_stdout_str(mut writes []string, mut text []string, s string, literal bool) {
+	if literal && s.len >= 2 && s.starts_with("'") && s.ends_with("'") {
+		text << s[1..s.len - 1]
+		return
+	}
+	flush_stdout_text(mut writes, mut text)
+	writes << 'write_stdout(${s})'
+}
+
+// flush_stdout_text adds one write for the literal text held in `text`.
+fn flush_stdout_text(mut writes []string, mut text []string) {
+	joined := text.join('')
+	if joined != '' {
+		writes << "write_stdout('${joined}')"
+	}
+	text.clear()
+}
+
 // Handle bool() call
 fn visit_bool(mut t VTranspiler, node Call, args []string) (string, bool) {
 	if args.len == 0 {
@@ -350,9 +459,203 @@ fn visit_sum(args []string) (string, bool, string) {
 	return 'arrays.sum(${args[0]}) or { 0 }', true, 'arrays'
 }
 
-// Handle sorted() call
-fn visit_sorted(args []string) (string, bool) {
-	return '(fn (a []Any) []Any { mut b := a.clone(); b.sort(); return b }(${args[0]}))', true
+// Handle sorted() call. Plain sorts use V's built-in comparison; key=
+// sorts go through decorate-sort-undecorate so each key is evaluated once
+// and ties keep their input order.
+fn visit_sorted(mut t VTranspiler, node Call, args []string) (string, bool) {
+	if args.len == 0 {
+		return '', false
+	}
+	src := t.infer_expr_type(node.args[0])
+	mut base := args[0]
+	mut elem_type := t.infer_iter_elem_type(node.args[0])
+	if src == 'string' {
+		base = "${args[0]}.split('')"
+		elem_type = 'string'
+	} else if src.starts_with('map[') {
+		base = '${args[0]}.keys()'
+		key_end := src.index(']') or { 4 }
+		elem_type = src[4..key_end]
+	}
+	rev := sort_reverse_flag(mut t, node)
+	key := sort_keyword(node, 'key') or {
+		if fields := t.tuple_structs[elem_type] {
+			if code := sort_tuple_structs(base, 'sorted', elem_type, fields.len, rev) {
+				return code, true
+			}
+		}
+		return sort_by_operator(base, 'sorted', rev), true
+	}
+	if elem_type != '' {
+		if code := sort_with_key(mut t, base, elem_type, key, rev, false) {
+			return code, true
+		}
+	}
+	t.pending_type_notes << '// NOTE: sorted(key=...) left untranslated — element type or key unknown'
+	return '', false
+}
+
+// visit_list_sort lowers list.sort(key=..., reverse=...) in place, or
+// returns none when the key cannot be lowered.
+fn visit_list_sort(mut t VTranspiler, node Call, obj_node Expr, obj string) ?string {
+	rev := sort_reverse_flag(mut t, node)
+	elem_type := t.infer_iter_elem_type(obj_node)
+	key := sort_keyword(node, 'key') or {
+		if fields := t.tuple_structs[elem_type] {
+			if code := sort_tuple_structs(obj, 'sort', elem_type, fields.len, rev) {
+				return code
+			}
+		}
+		return sort_by_operator(obj, 'sort', rev)
+	}
+	if elem_type != '' {
+		if code := sort_with_key(mut t, obj, elem_type, key, rev, true) {
+			return code
+		}
+	}
+	t.pending_type_notes << '// NOTE: ${obj}.sort(key=...) left untranslated — element type or key unknown'
+	return none
+}
+
+// sort_keyword returns the value of keyword argument `name` of a call.
+fn sort_keyword(node Call, name string) ?Expr {
+	for kw in node.keywords {
+		if arg := kw.arg {
+			if arg == name {
+				return kw.value
+			}
+		}
+	}
+	return none
+}
+
+// sort_reverse_flag renders the reverse= argument of a sort call, or
+// 'false' when it is absent.
+fn sort_reverse_flag(mut t VTranspiler, node Call) string {
+	rev := sort_keyword(node, 'reverse') or { return 'false' }
+	return t.visit_expr(rev)
+}
+
+// sort_by_operator sorts with V's built-in ordering, ascending or by a
+// reverse flag.
+fn sort_by_operator(obj string, method string, rev string) string {
+	match rev {
+		'false' { return '${obj}.${method}(a < b)' }
+		'true' { return '${obj}.${method}(a > b)' }
+		else { return 'if ${rev} { ${obj}.${method}(a > b) } else { ${obj}.${method}(a < b) }' }
+	}
+}
+
+// sort_tuple_structs sorts tuple structs field by field, the way Python
+// orders tuples. A runtime reverse flag is left to sort_by_operator.
+fn sort_tuple_structs(obj string, method string, elem_type string, fields int, rev string) ?string {
+	if rev !in ['true', 'false'] {
+		return none
+	}
+	mut lt := '-1'
+	mut gt := '1'
+	if rev == 'true' {
+		lt, gt = '1', '-1'
+	}
+	mut checks := []string{}
+	for i in 0 .. fields {
+		checks << 'if a.f${i} < b.f${i} {\nreturn ${lt}\n}\nif a.f${i} > b.f${i} {\nreturn ${gt}\n}'
+	}
+	return '${obj}.${method}_with_compare(fn (a &${elem_type}, b &${elem_type}) int {\n${checks.join('\n')}\nreturn 0\n})'
+}
+
+// sort_with_key emits a key= sort of `obj` with elements of `elem_type`.
+// Keys are computed once per element and the sort runs over indices,
+// breaking ties by position: V's sort is not stable, Python's is.
+fn sort_with_key(mut t VTranspiler, obj string, elem_type string, key Expr, rev string, in_place bool) ?string {
+	dynamic_rev := rev !in ['true', 'false']
+	// A runtime reverse flag is captured by the comparator, so it has to be
+	// a plain variable.
+	if dynamic_rev && !is_simple_identifier(rev) {
+		return none
+	}
+	mut captures := sort_key_captures(t, key)
+	if dynamic_rev && rev !in captures {
+		captures << rev
+	}
+	capture_list := if captures.len > 0 { '[${captures.join(', ')}] ' } else { '' }
+	mut lt := '-1'
+	mut gt := '1'
+	if rev == 'true' {
+		lt, gt = '1', '-1'
+	} else if dynamic_rev {
+		lt, gt = 'if ${rev} { 1 } else { -1 }', 'if ${rev} { -1 } else { 1 }'
+	}
+	key_code := sort_key_expr(mut t, key, elem_type, 'it')?
+	mut order_captures := ['keys']
+	if dynamic_rev {
+		order_captures << rev
+	}
+	sorted_code := '(fn ${capture_list}(src []${elem_type}) []${elem_type} {\nkeys := src.map(${key_code})\nmut order := []int{len: src.len, init: index}\norder.sort_with_compare(fn [${order_captures.join(', ')}] (i &int, j &int) int {\nif keys[*i] < keys[*j] {\nreturn ${lt}\n}\nif keys[*i] > keys[*j] {\nreturn ${gt}\n}\nreturn *i - *j\n})\nreturn order.map(src[it])\n}(${obj}))'
+	if in_place {
+		return '${obj} = ${sorted_code}'
+	}
+	return sorted_code
+}
+
+// sort_key_expr renders a key= function applied to `val`.
+fn sort_key_expr(mut t VTranspiler, key Expr, elem_type string, val string) ?string {
+	match key {
+		Lambda {
+			if key.args.args.len != 1 || key.body is Tuple {
+				return none
+			}
+			param := key.args.args[0].arg
+			saved_types := t.var_types.clone()
+			saved_overrides := t.name_overrides.clone()
+			t.var_types[param] = elem_type
+			t.name_overrides[param] = val
+			code := strip_outer_parens(t.visit_expr(key.body))
+			t.var_types = saved_types.clone()
+			t.name_overrides = saved_overrides.clone()
+			return code
+		}
+		Name {
+			if key.id == 'len' {
+				return '${val}.len'
+			}
+			if key.id in t.func_return_types {
+				return '${key.id}(${val})'
+			}
+		}
+		Attribute {
+			if key.value is Name && (key.value as Name).id == 'str' {
+				if key.attr == 'lower' {
+					return '${val}.to_lower()'
+				}
+				if key.attr == 'upper' {
+					return '${val}.to_upper()'
+				}
+			}
+		}
+		else {}
+	}
+	return none
+}
+
+// sort_key_captures lists the local variables a key lambda reads, which
+// the generated V closures must capture.
+fn sort_key_captures(t VTranspiler, key Expr) []string {
+	if key !is Lambda {
+		return []string{}
+	}
+	lam := key as Lambda
+	params := lam.args.args.map(it.arg)
+	mut names := map[string]bool{}
+	collect_expr_names(lam.body, mut names)
+	mut captures := []string{}
+	for name, _ in names {
+		if name !in params && name in t.var_types
+			&& !(t.global_vars[name] or { false }) {
+			captures << name
+		}
+	}
+	return captures
 }
 
 // Handle map() call (not V's map data structure)
@@ -456,16 +759,68 @@ fn visit_zip(args []string) (string, bool) {
 }
 
 // Handle open() call
-fn visit_open(args []string) (string, bool, string) {
-	if args.len > 1 {
-		mode := args[1].replace("'", '').replace('"', '')
-		if mode.contains('w') {
-			return 'os.create(${args[0]}) or { panic(err) }', true, 'os'
+fn visit_open(node Call, args []string) (string, bool, string) {
+	mode := open_mode(node)
+	binary := if mode.contains('b') { 'b' } else { '' }
+	if mode.contains('x') {
+		// Exclusive creation fails when the file already exists: O_EXCL makes
+		// the check and the creation one atomic open(2); the new, empty file
+		// is then reopened for writing without truncation
+		return "(fn (path string) os.File {\nfd := C.open(&char(path.str), os.o_wronly | os.o_create | os.o_excl, 0o666)\nif fd == -1 {\npanic('\${path}: \${os.posix_get_error_msg(C.errno)}')\n}\nC.close(fd)\nreturn os.open_file(path, 'r+${binary}') or { panic(err) }\n}(${args[0]}))", true, 'os'
+	}
+	if mode.contains('+') {
+		// Updating modes read and write through one handle
+		base := if mode.contains('w') {
+			'w'
+		} else if mode.contains('a') {
+			'a'
+		} else {
+			'r'
 		}
+		return "os.open_file(${args[0]}, '${base}+${binary}') or { panic(err) }", true, 'os'
+	}
+	if mode.contains('w') {
+		return 'os.create(${args[0]}) or { panic(err) }', true, 'os'
+	}
+	if mode.contains('a') {
+		return 'os.open_append(${args[0]}) or { panic(err) }', true, 'os'
 	}
 	return 'os.open(${args[0]}) or { panic(err) }', true, 'os'
 }
 
+// open_mode returns the mode of an open() call, given positionally or as
+// `mode=`; 'r' when it is not a string literal.
+fn open_mode(node Call) string {
+	mut mode := if node.args.len > 1 { node.args[1] } else { Expr(Constant{
+			value: NoneValue{}
+		}) }
+	for kw in node.keywords {
+		if (kw.arg or { '' }) == 'mode' {
+			mode = kw.value
+		}
+	}
+	if mode is Constant && (mode as Constant).value is string {
+		return (mode as Constant).value as string
+	}
+	return 'r'
+}
+
+// Handle bytes() / bytearray() calls: a size allocates a zeroed []u8, a
+// string is encoded and any other buffer is copied.
+fn visit_bytes(mut t VTranspiler, node Call, args []string) (string, bool) {
+	if args.len == 0 {
+		return '[]u8{}', true
+	}
+	arg_type := t.infer_expr_type(node.args[0])
+	if arg_type == 'int' {
+		return '[]u8{len: ${args[0]}}', true
+	}
+	if arg_type == 'string' {
+		return '${args[0]}.bytes()', true
+	}
+	return '${args[0]}.clone()', true
+}
+
 // Handle input() call
 fn visit_input(args []string) (string, bool, string) {
 	if args.len > 0 {
@@ -556,11 +911,25 @@ fn visit_tuple_fn(args []string) (string, bool) {
 }
 
 // Handle set() call
-fn visit_set_fn(args []string) (string, bool) {
+fn visit_set_fn(mut t VTranspiler, node Call, args []string) (string, bool) {
+	set_type := t.infer_expr_type(node)
 	if args.len == 0 {
-		return '[]', true
+		return '${set_type}{}', true
 	}
-	return args[0], true
+	src_type := t.infer_expr_type(node.args[0])
+	if t.is_set_expr(node.args[0]) {
+		return '${args[0]}.clone()', true
+	}
+	elem_type := set_elem_type(set_type)
+	items := if src_type == 'string' {
+		'${args[0]}.bytes()'
+	} else if src_type.starts_with('map[') {
+		// set(d) collects the keys of a dict
+		'${args[0]}.keys()'
+	} else {
+		args[0]
+	}
+	return '(fn (items []${elem_type}) ${set_type} {\n\tmut s := ${set_type}{}\n\tfor item in items {\n\t\ts[item] = true\n\t}\n\treturn s\n}(${items}))', true
 }
 
 // Handle dict() call
@@ -638,6 +1007,9 @@ fn dispatch_builtin_impl(mut t VTranspiler, fname string, node Call, args []stri
 		}
 		'print' {
 			code, handled := visit_print(mut t, node, args)
+			if print_file(node) == 'sys.stderr' && code.starts_with('println(') {
+				return DispatchResult{'e${code}', handled, ''}
+			}
 			return DispatchResult{code, handled, ''}
 		}
 		'bool' {
@@ -689,7 +1061,7 @@ fn dispatch_builtin_impl(mut t VTranspiler, fname string, node Call, args []stri
 			return DispatchResult{code, handled, using}
 		}
 		'sorted' {
-			code, handled := visit_sorted(args)
+			code, handled := visit_sorted(mut t, node, args)
 			return DispatchResult{code, handled, ''}
 		}
 		'map' {
@@ -742,9 +1114,20 @@ fn dispatch_builtin_impl(mut t VTranspiler, fname string, node Call, args []stri
 			return DispatchResult{code, handled, 'arrays'}
 		}
 		'open' {
-			code, handled, using := visit_open(args)
+			code, handled, using := visit_open(node, args)
 			return DispatchResult{code, handled, using}
 		}
+		'bytes', 'bytearray' {
+			code, handled := visit_bytes(mut t, node, args)
+			return DispatchResult{code, handled, ''}
+		}
+		'memoryview' {
+			// V slices of an array share its memory already
+			if args.len > 0 {
+				return DispatchResult{args[0], true, ''}
+			}
+			return DispatchResult{'', false, ''}
+		}
 		'input' {
 			code, handled, using := visit_input(args)
 			return DispatchResult{code, handled, using}
@@ -782,7 +1165,7 @@ fn dispatch_builtin_impl(mut t VTranspiler, fname string, node Call, args []stri
 			return DispatchResult{code, handled, ''}
 		}
 		'set' {
-			code, handled := visit_set_fn(args)
+			code, handled := visit_set_fn(mut t, node, args)
 			return DispatchResult{code, handled, ''}
 		}
 		'dict' {
@@ -0,0 +1,27 @@
+import asyncio
+
+
+async def consume(queue: asyncio.Queue[int]) -> int:
+    item = await queue.get()
+    return item * 2
+
+
+async def produce(queue: asyncio.Queue[int], count: int) -> int:
+    for i in range(count):
+        await queue.put(i)
+    return count
+
+
+async def run_consumers() -> None:
+    queue = asyncio.Queue()
+    consumers = [asyncio.create_task(consume(queue)) for _ in range(64)]
+    producer = asyncio.create_task(produce(queue, 63))
+    print(await producer)
+    await queue.put(63)
+    results = await asyncio.gather(*consumers)
+    print(len(results))
+    print(results[63])
+
+
+if __name__ == "__main__":
+    asyncio.run(run_consumers())
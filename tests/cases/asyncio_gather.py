@@ -0,0 +1,27 @@
+import asyncio
+
+
+async def square(n: int) -> int:
+    return n * n
+
+
+async def label(n: int) -> str:
+    return f"item-{n}"
+
+
+async def run_all() -> None:
+    results = await asyncio.gather(square(2), square(3), square(4))
+    print(results)
+    squares = await asyncio.gather(*[square(n) for n in range(5)])
+    print(squares)
+    total, name = await asyncio.gather(square(5), label(5))
+    print(f"{total} {name}")
+    for fut in asyncio.as_completed([square(6), square(7)]):
+        print(await fut)
+    done, _ = await asyncio.wait([square(8), square(9)])
+    for task in done:
+        print(task.result())
+
+
+if __name__ == "__main__":
+    asyncio.run(run_all())
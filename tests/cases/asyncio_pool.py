@@ -0,0 +1,35 @@
+import asyncio
+
+
+async def work(n: int) -> int:
+    await asyncio.sleep(0.01)
+    return n * 2
+
+
+async def limited(sem: asyncio.Semaphore, n: int) -> None:
+    async with sem:
+        print(await work(n))
+
+
+async def producer(queue: asyncio.Queue[int], count: int) -> None:
+    for i in range(count):
+        await queue.put(i)
+
+
+async def run_pool() -> None:
+    task = asyncio.create_task(work(21))
+    print(await task)
+    tasks = [asyncio.create_task(work(n)) for n in range(4)]
+    print(await asyncio.gather(*tasks))
+    sem = asyncio.Semaphore(2)
+    await limited(sem, 5)
+    queue = asyncio.Queue(maxsize=8)
+    await producer(queue, 3)
+    await queue.put(99)
+    print(queue.qsize())
+    first = await queue.get()
+    print(first)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_pool())
@@ -0,0 +1,35 @@
+def copy_file(src: str, dst: str) -> int:
+    total = 0
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        while True:
+            chunk = fin.read(65536)
+            if not chunk:
+                break
+            fout.write(chunk)
+            total += len(chunk)
+    return total
+
+
+def checksum(path: str) -> int:
+    buf = bytearray(4096)
+    view = memoryview(buf)
+    total = 0
+    with open(path, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if n == 0:
+                break
+            for b in view[:n]:
+                total += b
+    return total % 256
+
+
+def append_log(path: str, message: str) -> None:
+    with open(path, "a") as f:
+        f.write(message)
+
+
+if __name__ == "__main__":
+    print(copy_file("in.bin", "out.bin"))
+    print(checksum("out.bin"))
+    append_log("log.txt", "copied\n")
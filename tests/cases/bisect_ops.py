@@ -0,0 +1,29 @@
+import bisect
+from bisect import insort
+
+
+def grade(score: int, breakpoints: list[int], grades: list[str]) -> str:
+    i = bisect.bisect_right(breakpoints, score)
+    return grades[i]
+
+
+def count_between(values: list[int], low: int, high: int) -> int:
+    return bisect.bisect_right(values, high) - bisect.bisect_left(values, low)
+
+
+def sorted_insert(values: list[int]) -> list[int]:
+    out: list[int] = []
+    for v in values:
+        insort(out, v)
+    return out
+
+
+def first_of_length(words: list[str], n: int) -> int:
+    return bisect.bisect_left(words, n, key=len)
+
+
+if __name__ == "__main__":
+    print(grade(85, [60, 70, 80, 90], ["F", "D", "C", "B", "A"]))
+    print(count_between([1, 3, 5, 7, 9], 3, 7))
+    print(sorted_insert([5, 1, 4, 2]))
+    print(first_of_length(["a", "bb", "ccc"], 2))
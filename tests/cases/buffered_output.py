@@ -0,0 +1,18 @@
+# py2v: buffered-output
+import sys
+
+
+def report(names: list[str], total: int, ok: bool) -> None:
+    print("report")
+    for i in range(total):
+        print("row", i, names[i], sep=", ")
+    print("ok:", ok, end="")
+    print()
+    sys.stdout.write("done\n")
+    print("progress", total, flush=True)
+    print("warning", file=sys.stderr)
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    report(["a", "b"], 2, True)
@@ -0,0 +1,28 @@
+from collections import Counter, defaultdict
+
+
+def tally(words: list[str]) -> dict[str, int]:
+    counts = defaultdict(int)
+    for w in words:
+        counts[w] += 1
+    return counts
+
+
+def group_by_rest(nums: list[int]) -> dict[int, list[int]]:
+    groups = defaultdict(list)
+    for n in nums:
+        groups[n % 3].append(n)
+    return groups
+
+
+def top_words(text: str, k: int) -> None:
+    c = Counter(text.split())
+    c.update(["extra", "extra"])
+    print(c.most_common(k))
+    print(c.most_common())
+
+
+if __name__ == "__main__":
+    print(tally(["a", "b", "a"]))
+    print(group_by_rest([1, 2, 3, 4]))
+    top_words("the cat and the hat", 2)
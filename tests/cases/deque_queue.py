@@ -0,0 +1,29 @@
+from collections import deque
+
+
+def bfs_order(start: int, limit: int) -> list[int]:
+    order: list[int] = []
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for nxt in [node * 2, node * 2 + 1]:
+            if nxt <= limit:
+                queue.append(nxt)
+    return order
+
+
+def window_sum(values: list[int]) -> int:
+    window: deque[int] = deque(maxlen=3)
+    for v in values:
+        window.append(v)
+    window.appendleft(0)
+    total = 0
+    for v in window:
+        total += v
+    return total + window[0] + window[-1]
+
+
+if __name__ == "__main__":
+    print(bfs_order(1, 6))
+    print(window_sum([1, 2, 3, 4, 5]))
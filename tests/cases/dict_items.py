@@ -0,0 +1,22 @@
+def report(totals: dict[str, int]) -> None:
+    for name, total in totals.items():
+        print(f"{name}: {total}")
+
+
+def ranked(totals: dict[str, int]) -> list[str]:
+    out: list[str] = []
+    ordered = sorted(totals.items())
+    for name, total in ordered:
+        out.append(f"{name}={total}")
+    return out
+
+
+def pairs(totals: dict[str, int]) -> list[tuple[str, int]]:
+    return list(totals.items())
+
+
+if __name__ == "__main__":
+    totals = {"b": 2, "a": 1}
+    report(totals)
+    print(ranked(totals))
+    print(len(pairs(totals)))
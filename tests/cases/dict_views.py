@@ -0,0 +1,22 @@
+def has_user(ages: dict[str, int], name: str) -> bool:
+    return name in ages.keys()
+
+
+def has_age(ages: dict[str, int], age: int) -> bool:
+    return age in ages.values()
+
+
+def missing_age(ages: dict[str, int], age: int) -> bool:
+    return age not in ages.values()
+
+
+def has_entry(ages: dict[str, int], name: str, age: int) -> bool:
+    return (name, age) in ages.items()
+
+
+if __name__ == "__main__":
+    ages = {"ann": 31, "bob": 27}
+    print(has_user(ages, "ann"))
+    print(has_age(ages, 27))
+    print(missing_age(ages, 40))
+    print(has_entry(ages, "bob", 31))
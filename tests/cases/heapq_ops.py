@@ -0,0 +1,38 @@
+import heapq
+from heapq import heappush
+
+
+def schedule(names: list[str]) -> list[str]:
+    heap: list[tuple[int, str]] = []
+    for name in names:
+        job = (len(name), name)
+        heappush(heap, job)
+    order: list[str] = []
+    while heap:
+        size, label = heapq.heappop(heap)
+        order.append(f"{label}:{size}")
+    return order
+
+
+def smallest_three() -> list[int]:
+    heap = [9, 4, 7, 1, 8]
+    heapq.heapify(heap)
+    out: list[int] = []
+    for _ in range(3):
+        out.append(heapq.heappop(heap))
+    return out
+
+
+def top_k(scores: list[int], k: int) -> list[int]:
+    return heapq.nlargest(k, scores)
+
+
+def bottom_k(scores: list[int], k: int) -> list[int]:
+    return heapq.nsmallest(k, scores)
+
+
+if __name__ == "__main__":
+    print(schedule(["ccc", "a", "bb"]))
+    print(smallest_three())
+    print(top_k([5, 1, 9, 3, 7], 3))
+    print(bottom_k([5, 1, 9, 3, 7], 2))
@@ -0,0 +1,31 @@
+def squares(n: int) -> list[int]:
+    return [i * i for i in range(n)]
+
+
+def numbered(names: list[str]) -> None:
+    for n, name in enumerate(names, start=1):
+        print(f"{n}. {name}")
+
+
+def weighted_total(prices: list[int], counts: list[int], n: int) -> int:
+    total = 0
+    for price, count, square in zip(prices, counts, squares(n)):
+        total += price * count + square
+    return total
+
+
+def countdown(n: int) -> None:
+    for i in reversed(range(n)):
+        print(i)
+
+
+def last_squares(n: int) -> None:
+    for sq in reversed(squares(n)):
+        print(sq)
+
+
+if __name__ == "__main__":
+    numbered(["ann", "bob"])
+    print(weighted_total([3, 5], [2, 1], 2))
+    countdown(3)
+    last_squares(3)
@@ -0,0 +1,29 @@
+def fact(n):
+    if n <= 1:
+        return 1
+    return n * fact(n - 1)
+
+
+def repeat_len(word, times):
+    total = 0
+    i = 0
+    while i < times:
+        total += len(word)
+        i += 1
+    return total
+
+
+def describe(count):
+    size = "big" if count > 5 else "small"
+    return f"{size} {count}"
+
+
+def half(x):
+    return x / 2
+
+
+if __name__ == "__main__":
+    print(fact(5))
+    print(repeat_len("abc", 3))
+    print(describe(repeat_len("ab", 2)))
+    print(half(3))
@@ -0,0 +1,37 @@
+import sys
+
+
+def count_errors(path: str) -> int:
+    errors = 0
+    with open(path) as f:
+        for line in f:
+            if line.startswith("ERROR"):
+                errors += 1
+    return errors
+
+
+def echo_stdin() -> None:
+    for line in sys.stdin:
+        print(line.rstrip("\n"))
+
+
+def longest_line(path: str) -> int:
+    longest = 0
+    with open(path) as f:
+        for line in f.readlines():
+            line = line.strip()
+            if len(line) > longest:
+                longest = len(line)
+    return longest
+
+
+def count_lines(path: str) -> None:
+    with open(path) as f:
+        print(len(f.readlines()))
+
+
+if __name__ == "__main__":
+    print(count_errors("app.log"))
+    print(longest_line("app.log"))
+    count_lines("app.log")
+    echo_stdin()
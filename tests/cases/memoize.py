@@ -0,0 +1,31 @@
+from functools import cached_property, lru_cache
+
+
+@lru_cache(maxsize=None)
+def grid_paths(rows: int, cols: int) -> int:
+    if rows == 0 or cols == 0:
+        return 1
+    return grid_paths(rows - 1, cols) + grid_paths(rows, cols - 1)
+
+
+@lru_cache(maxsize=32)
+def weight(word: str, n: int) -> int:
+    return len(word) * n
+
+
+class Circle:
+    def __init__(self, radius: float):
+        self.radius: float = radius
+
+    @cached_property
+    def area(self) -> float:
+        return 3.14159 * self.radius * self.radius
+
+
+if __name__ == "__main__":
+    print(grid_paths(8, 8))
+    print(weight("a|b", 2))
+    print(weight("a", 2))
+    c = Circle(2.5)
+    print(c.area)
+    print(c.area)
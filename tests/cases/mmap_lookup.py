@@ -0,0 +1,28 @@
+import mmap
+
+
+def count_key(path: str, key: bytes) -> int:
+    count = 0
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(key)
+            while pos >= 0:
+                count += 1
+                pos = mm.find(key, pos + len(key))
+            print(len(mm))
+            print(mm[-1])
+    return count
+
+
+def header(path: str) -> None:
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic = mm[:4]
+        print(magic)
+        print(mm.rfind(b"\n"))
+        mm.close()
+
+
+if __name__ == "__main__":
+    print(count_key("index.bin", b"key"))
+    header("index.bin")
@@ -0,0 +1,30 @@
+from multiprocessing import Pool
+from typing import Tuple
+
+
+def cube(n: int) -> int:
+    return n * n * n
+
+
+def label(word: str, times: int) -> str:
+    return f"{word}:{times}"
+
+
+def make_pair(word: str, times: int) -> Tuple[str, int]:
+    return (word, times)
+
+
+def run_pool(nums: list[int], pairs: list[Tuple[str, int]]) -> None:
+    with Pool(processes=4) as pool:
+        print(pool.map(cube, nums, chunksize=2))
+        print(pool.starmap(label, pairs))
+        for value in pool.imap(cube, nums):
+            print(value)
+        total = 0
+        for value in pool.imap_unordered(cube, nums, chunksize=4):
+            total += value
+        print(total)
+
+
+if __name__ == "__main__":
+    run_pool([1, 2, 3], [make_pair("a", 2), make_pair("b", 3)])
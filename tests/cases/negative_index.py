@@ -0,0 +1,30 @@
+def scores() -> list[int]:
+    return [4, 8, 15, 16, 23, 42]
+
+
+def last_score() -> int:
+    return scores()[-1]
+
+
+def second_last(values: list[int]) -> int:
+    return values[-2]
+
+
+def nth_from_end(values: list[int], k: int) -> int:
+    return values[-k]
+
+
+def tail(k: int) -> list[int]:
+    return scores()[-k:]
+
+
+def trimmed(values: list[int], k: int) -> list[int]:
+    return values[1 : -(k + 1)]
+
+
+if __name__ == "__main__":
+    print(last_score())
+    print(second_last([1, 2, 3]))
+    print(nth_from_end([1, 2, 3], 2))
+    print(tail(2))
+    print(trimmed([1, 2, 3, 4, 5], 1))
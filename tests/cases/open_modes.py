@@ -0,0 +1,13 @@
+def update(path: str) -> None:
+    with open(path, "r+") as f:
+        f.write("hi")
+
+
+def create_new(path: str) -> None:
+    with open(path, "x") as f:
+        f.write("new")
+
+
+if __name__ == "__main__":
+    create_new("fresh.txt")
+    update("fresh.txt")
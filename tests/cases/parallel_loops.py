@@ -0,0 +1,18 @@
+def score(x: float) -> float:
+    return x * x + 1.0
+
+
+def run(items: list[float], n: int) -> None:
+    # py2v: parallel
+    results = [score(x) for x in items]
+    print(results)
+    out = [0.0] * n
+    for i in range(n):  # py2v: parallel
+        out[i] = score(items[i])
+    print(out)
+    squares = [i * i for i in range(1, n)]  # py2v: parallel
+    print(squares)
+
+
+if __name__ == "__main__":
+    run([1.0, 2.0, 3.0], 3)
@@ -0,0 +1,37 @@
+def gcd(a: int, b: int) -> int:
+    if b == 0:
+        return a
+    return gcd(b, a % b)
+
+
+def factorial(n: int) -> int:
+    if n <= 1:
+        return 1
+    return n * factorial(n - 1)
+
+
+def count_down(n: int) -> None:
+    if n < 0:
+        return
+    print(n)
+    return count_down(n - 1)
+
+
+def repeat(s: str, n: int) -> str:
+    if n == 0:
+        return ""
+    return repeat(s, n - 1) + s
+
+
+def fib(n: int) -> int:
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+
+if __name__ == "__main__":
+    print(gcd(48, 18))
+    print(factorial(10))
+    count_down(3)
+    print(repeat("ab", 3))
+    print(fib(10))
@@ -0,0 +1,14 @@
+import threading
+
+
+def run_nested() -> None:
+    lock = threading.RLock()
+    total = 0
+    with lock:
+        with lock:
+            total += 1
+    print(total)
+
+
+if __name__ == "__main__":
+    run_nested()
@@ -0,0 +1,24 @@
+class Tracker:
+    def __init__(self):
+        self.seen = set()
+
+    def visit(self, item: int):
+        self.seen.add(item)
+
+    def forget(self, item: int):
+        self.seen.remove(item)
+
+    def known(self, item: int) -> bool:
+        return item in self.seen
+
+
+def main():
+    tracker = Tracker()
+    tracker.visit(3)
+    tracker.visit(5)
+    tracker.forget(3)
+    print(len(tracker.seen))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+def main():
+    seen = set()
+    for word in ["a", "b", "a"]:
+        seen.add(word)
+    print(len(seen))
+
+    seen.discard("a")
+    print("a" in seen)
+
+    nums = [1, 2, 3]
+    squares = {n * n for n in nums}
+    print(squares)
+
+    evens = {n for n in squares if n % 2 == 0}
+    print(len(evens))
+
+    flags = {"a": True, "b": False}
+    print(flags)
+
+
+if __name__ == "__main__":
+    main()
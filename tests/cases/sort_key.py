@@ -0,0 +1,23 @@
+def score(word: str) -> int:
+    return len(word) * 3
+
+
+def main():
+    words = ["pear", "fig", "banana", "kiwi"]
+    by_len = sorted(words, key=len)
+    print(by_len)
+
+    nums = [5, -3, 2, -8]
+    by_square = sorted(nums, key=lambda n: n * n, reverse=True)
+    print(by_square)
+
+    # Named key functions are called once per element
+    by_score = sorted(words, key=score)
+    print(by_score)
+
+    words.sort(key=len)
+    print(words)
+
+
+if __name__ == "__main__":
+    main()
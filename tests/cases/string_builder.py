@@ -0,0 +1,24 @@
+def render(words: list[str]) -> str:
+    out = ""
+    for w in words:
+        out += w
+        out += " "
+    return out
+
+
+def digits(n: int) -> str:
+    text = "#"
+    i = 0
+    while i < n:
+        text += str(i)
+        i += 1
+    return text
+
+
+def csv_row(values: list[int]) -> str:
+    return ", ".join(str(v) for v in values if v > 0)
+
+
+print(render(["a", "b"]))
+print(digits(3))
+print(csv_row([1, -2, 3]))
@@ -0,0 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def square(n: int) -> int:
+    return n * n
+
+
+def run_executor(nums: list[int]) -> None:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        print(list(executor.map(square, nums)))
+        future = executor.submit(square, 7)
+        print(future.result())
+        futures = [executor.submit(square, n) for n in nums]
+        for fut in as_completed(futures):
+            print(fut.result())
+
+
+if __name__ == "__main__":
+    run_executor([1, 2, 3])
@@ -0,0 +1,36 @@
+import queue
+import threading
+
+
+def produce(jobs: queue.Queue[int], start: int, count: int) -> None:
+    for i in range(start, start + count):
+        jobs.put(i)
+
+
+def run_threads() -> None:
+    lock = threading.Lock()
+    cond = threading.Condition(lock)
+    ready = threading.Event()
+    jobs = queue.Queue(maxsize=4)
+    jobs.put(100)
+    producer = threading.Thread(target=produce, args=(jobs, 0, 2))
+    producer.start()
+    workers = [threading.Thread(target=produce, args=(jobs, n * 10, 1)) for n in range(2)]
+    for worker in workers:
+        worker.start()
+    total = 0
+    for _ in range(5):
+        with lock:
+            total += jobs.get()
+    producer.join()
+    for worker in workers:
+        worker.join()
+    ready.set()
+    with cond:
+        cond.notify_all()
+    print(total)
+    print(ready.is_set())
+
+
+if __name__ == "__main__":
+    run_threads()
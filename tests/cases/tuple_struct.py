@@ -0,0 +1,23 @@
+from typing import Tuple
+
+
+def make_pair(n: int, label: str) -> Tuple[int, str]:
+    return (n, label)
+
+
+def main():
+    pairs = [make_pair(1, "one"), make_pair(2, "two")]
+    first = pairs[0]
+    print(first[0])
+    print(first[1])
+
+    num, name = pairs[1]
+    print(num)
+    print(name)
+
+    point = (3, "three")
+    print(point[1])
+
+
+if __name__ == "__main__":
+    main()
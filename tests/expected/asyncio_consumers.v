@@ -0,0 +1,249 @@
+module main
+
+import sync
+import runtime
+
+// Task is the handle of a queued job; wait() blocks until it has run.
+@[heap]
+pub struct Task[T] {
+	done chan T
+}
+
+// TaskPool runs queued jobs on one running worker thread per core.
+@[heap]
+pub struct TaskPool {
+mut:
+	jobs    chan fn ()
+	mu      &sync.Mutex
+	ids     map[u64]bool // threads of the workers
+	cores   int
+	workers int
+	blocked int // workers inside a blocking call
+}
+
+// AsyncQueue is a FIFO between tasks; join() waits until every item put
+// has been marked done.
+@[heap]
+pub struct AsyncQueue[T] {
+	buf     &QueueBuffer[T]
+	mutex   &sync.Mutex     = sync.new_mutex()
+	ready   &sync.Semaphore = sync.new_semaphore()
+	slots   &sync.Semaphore
+	bounded bool
+	pending &sync.WaitGroup = sync.new_waitgroup()
+}
+
+// QueueBuffer holds the items of an AsyncQueue from `head` on; it grows as
+// needed, so put() on an unbounded queue never blocks.
+@[heap]
+pub struct QueueBuffer[T] {
+mut:
+	items []T
+	head  int
+}
+
+fn consume(queue &AsyncQueue[int]) int {
+	item := queue.get()
+	return item * 2
+}
+
+fn produce(queue &AsyncQueue[int], count int) int {
+	for i in []int{len: count, init: index} {
+		queue.put(i)
+	}
+	return count
+}
+
+fn run_consumers() {
+	queue := new_async_queue[int](0)
+	mut consumers := []&Task[int]{}
+	for _ in 0 .. 64 {
+		consumers << submit_task(fn [queue] () int {
+			return consume(queue)
+		})
+	}
+	producer := submit_task(fn [queue] () int {
+		return produce(queue, 63)
+	})
+	println(producer.wait())
+	queue.put(63)
+	results := consumers.map(it.wait())
+	println(results.len)
+	println(results[63])
+}
+
+// queue_job queues `job` on a pool and returns its handle.
+fn queue_job[T](jobs chan fn (), job fn () T) &Task[T] {
+	task := &Task[T]{
+		done: chan T{cap: 1}
+	}
+	jobs <- fn [task, job] () {
+		task.done <- job()
+	}
+	return task
+}
+
+// wait returns the result of the task; it can be awaited more than once.
+fn (task &Task[T]) wait() T {
+	task_pool_block()
+	result := <-task.done
+	task_pool_unblock()
+	task.done <- result
+	return result
+}
+
+// cancel is a no-op: queued jobs always run to completion.
+fn (task &Task[T]) cancel() {}
+
+// max_spare_workers bounds the workers started for blocked jobs.
+const max_spare_workers = 256
+
+// task_pool is shared by every task; it keeps one worker per core running.
+const task_pool = new_task_pool(runtime.nr_cpus())
+
+fn new_task_pool(cores int) &TaskPool {
+	mut pool := &TaskPool{
+		jobs:  chan fn (){cap: 1024}
+		mu:    sync.new_mutex()
+		cores: cores
+	}
+	for _ in 0 .. cores {
+		pool.start_worker()
+	}
+	return pool
+}
+
+// start_worker adds a worker thread; the caller holds p.mu or still owns p.
+fn (mut p TaskPool) start_worker() {
+	p.workers++
+	spawn run_pool_worker(mut p)
+}
+
+// run_pool_worker runs the jobs of `p` on one worker thread. It retires
+// after a job when a blocked job has resumed and more workers than cores
+// are running.
+fn run_pool_worker(mut p TaskPool) {
+	me := sync.thread_id()
+	p.mu.@lock()
+	p.ids[me] = true
+	p.mu.unlock()
+	for {
+		job := <-p.jobs or { break }
+		job()
+		p.mu.@lock()
+		if p.workers - p.blocked > p.cores {
+			p.workers--
+			p.ids.delete(me)
+			p.mu.unlock()
+			return
+		}
+		p.mu.unlock()
+	}
+}
+
+// task_pool_block marks the calling pool worker as blocked and starts a
+// spare worker in its place. Threads outside the pool are left alone.
+fn task_pool_block() {
+	mut p := task_pool
+	p.mu.@lock()
+	if sync.thread_id() in p.ids {
+		p.blocked++
+		if p.workers - p.blocked < p.cores && p.workers < p.cores + max_spare_workers {
+			p.start_worker()
+		}
+	}
+	p.mu.unlock()
+}
+
+// task_pool_unblock marks the calling pool worker as running again.
+fn task_pool_unblock() {
+	mut p := task_pool
+	p.mu.@lock()
+	if sync.thread_id() in p.ids {
+		p.blocked--
+	}
+	p.mu.unlock()
+}
+
+// submit_task queues `job` on the task pool and returns its handle.
+fn submit_task[T](job fn () T) &Task[T] {
+	return queue_job(task_pool.jobs, job)
+}
+
+// new_async_queue holds at most `maxsize` items; maxsize <= 0 is unbounded.
+fn new_async_queue[T](maxsize int) &AsyncQueue[T] {
+	return &AsyncQueue[T]{
+		buf:     &QueueBuffer[T]{}
+		slots:   sync.new_semaphore_init(u32(if maxsize > 0 { maxsize } else { 0 }))
+		bounded: maxsize > 0
+	}
+}
+
+fn (q &AsyncQueue[T]) put(item T) {
+	mut pending := q.pending
+	pending.add(1)
+	if q.bounded {
+		mut slots := q.slots
+		task_pool_block()
+		slots.wait()
+		task_pool_unblock()
+	}
+	mut mutex := q.mutex
+	mut buf := q.buf
+	mutex.@lock()
+	buf.items << item
+	mutex.unlock()
+	mut ready := q.ready
+	ready.post()
+}
+
+fn (q &AsyncQueue[T]) get() T {
+	mut ready := q.ready
+	task_pool_block()
+	ready.wait()
+	task_pool_unblock()
+	mut mutex := q.mutex
+	mut buf := q.buf
+	mutex.@lock()
+	item := buf.items[buf.head]
+	buf.head++
+	// Drop the consumed prefix once it is half the buffer.
+	if buf.head * 2 >= buf.items.len {
+		buf.items = buf.items[buf.head..].clone()
+		buf.head = 0
+	}
+	mutex.unlock()
+	if q.bounded {
+		mut slots := q.slots
+		slots.post()
+	}
+	return item
+}
+
+fn (q &AsyncQueue[T]) task_done() {
+	mut pending := q.pending
+	pending.done()
+}
+
+fn (q &AsyncQueue[T]) join() {
+	mut pending := q.pending
+	task_pool_block()
+	pending.wait()
+	task_pool_unblock()
+}
+
+fn (q &AsyncQueue[T]) qsize() int {
+	mut mutex := q.mutex
+	mutex.@lock()
+	defer { mutex.unlock() }
+	return q.buf.items.len - q.buf.head
+}
+
+fn (q &AsyncQueue[T]) empty() bool {
+	return q.qsize() == 0
+}
+
+fn main() {
+	// import asyncio: use V goroutines and channels
+	run_consumers()
+}
@@ -0,0 +1,41 @@
+module main
+
+fn square(n int) int {
+	return n * n
+}
+
+fn label(n int) string {
+	return 'item-${n}'
+}
+
+fn run_all() {
+	results := [spawn square(2), spawn square(3), spawn square(4)].wait()
+	println(results)
+	squares := []int{len: 5, init: index}.map(spawn square(it)).wait()
+	println(squares)
+	__thread1 := spawn square(5)
+	__thread2 := spawn label(5)
+	total := __thread1.wait()
+	name := __thread2.wait()
+	println('${total} ${name}')
+	__threads3 := [spawn square(6), spawn square(7)]
+	__done4 := chan int{cap: __threads3.len}
+	for __thread5 in __threads3 {
+		spawn fn (th thread int, out chan int) {
+			out <- th.wait()
+		}(__thread5, __done4)
+	}
+	for _ in 0 .. __threads3.len {
+		fut := <-__done4
+		println(fut)
+	}
+	done := [spawn square(8), spawn square(9)].wait()
+	for task in done {
+		println(task)
+	}
+}
+
+fn main() {
+	// import asyncio: use V goroutines and channels
+	run_all()
+}
@@ -0,0 +1,82 @@
+module main
+
+import os
+
+fn copy_file(src string, dst string) int {
+	mut __chunk1 := []u8{}
+	mut total := 0
+	if true {
+		mut fin := os.open(src) or { panic(err) }
+		defer { fin.close() }
+		mut fout := os.create(dst) or { panic(err) }
+		defer { fout.close() }
+		for {
+			chunk := read_chunk(fin, mut __chunk1, 65536)
+			if chunk.len == 0 {
+				break
+			}
+			fout.write(chunk) or { panic(err) }
+			total += chunk.len
+		}
+	}
+	return total
+}
+
+fn checksum(path string) int {
+	mut buf := []u8{len: 4096}
+	view := buf
+	mut total := 0
+	if true {
+		mut f := os.open(path) or { panic(err) }
+		defer { f.close() }
+		for {
+			n := f.read(mut buf) or {
+				if err is os.Eof {
+					0
+				} else {
+					panic(err)
+				}
+			}
+			if n == 0 {
+				break
+			}
+			for b in view[..n] {
+				total += b
+			}
+		}
+	}
+	return total % 256
+}
+
+fn append_log(path string, message string) {
+	if true {
+		mut f := os.open_append(path) or { panic(err) }
+		defer { f.close() }
+		f.write_string(message) or { panic(err) }
+	}
+}
+
+// read_chunk reads up to `n` bytes from `f` into `buf`, which is only
+// reallocated when n changes, so repeated reads of one size share a buffer.
+// The result is a slice of `buf`, without a copy, valid until the next read
+// into it, and is empty at end of file; other read errors panic. Text-mode
+// read(n) decodes this chunk, so n counts bytes rather than characters.
+fn read_chunk(f os.File, mut buf []u8, n int) []u8 {
+	if buf.len != n {
+		buf = []u8{len: n}
+	}
+	got := f.read(mut buf) or {
+		if err is os.Eof {
+			0
+		} else {
+			panic(err)
+		}
+	}
+	return buf[..got]
+}
+
+fn main() {
+	println(copy_file('in.bin', 'out.bin'))
+	println(checksum('out.bin'))
+	append_log('log.txt', 'copied\n')
+}
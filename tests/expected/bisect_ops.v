@@ -0,0 +1,103 @@
+module main
+
+fn grade(score int, breakpoints []int, grades []string) string {
+	i := bisect_right(breakpoints, score, 0, breakpoints.len)
+	return grades[i]
+}
+
+fn count_between(values []int, low int, high int) int {
+	return bisect_right(values, high, 0, values.len) - bisect_left(values, low, 0, values.len)
+}
+
+fn sorted_insert(values []int) []int {
+	mut out := []int{}
+	for v in values {
+		insort_right(mut out, v, 0, out.len)
+	}
+	return out
+}
+
+fn first_of_length(words []string, n int) int {
+	return bisect_left_key(words, n, 0, words.len, fn (item string) int {
+		return item.len
+	})
+}
+
+fn bisect_left[T](a []T, x T, lo int, hi int) int {
+	mut l := lo
+	mut h := hi
+	for l < h {
+		mid := (l + h) / 2
+		if a[mid] < x {
+			l = mid + 1
+		} else {
+			h = mid
+		}
+	}
+	return l
+}
+
+fn bisect_right[T](a []T, x T, lo int, hi int) int {
+	mut l := lo
+	mut h := hi
+	for l < h {
+		mid := (l + h) / 2
+		if x < a[mid] {
+			h = mid
+		} else {
+			l = mid + 1
+		}
+	}
+	return l
+}
+
+fn insort_left[T](mut a []T, x T, lo int, hi int) {
+	a.insert(bisect_left(a, x, lo, hi), x)
+}
+
+fn insort_right[T](mut a []T, x T, lo int, hi int) {
+	a.insert(bisect_right(a, x, lo, hi), x)
+}
+
+fn bisect_left_key[T, K](a []T, x K, lo int, hi int, key fn (T) K) int {
+	mut l := lo
+	mut h := hi
+	for l < h {
+		mid := (l + h) / 2
+		if key(a[mid]) < x {
+			l = mid + 1
+		} else {
+			h = mid
+		}
+	}
+	return l
+}
+
+fn bisect_right_key[T, K](a []T, x K, lo int, hi int, key fn (T) K) int {
+	mut l := lo
+	mut h := hi
+	for l < h {
+		mid := (l + h) / 2
+		if x < key(a[mid]) {
+			h = mid
+		} else {
+			l = mid + 1
+		}
+	}
+	return l
+}
+
+fn insort_left_key[T, K](mut a []T, x T, lo int, hi int, key fn (T) K) {
+	a.insert(bisect_left_key(a, key(x), lo, hi, key), x)
+}
+
+fn insort_right_key[T, K](mut a []T, x T, lo int, hi int, key fn (T) K) {
+	a.insert(bisect_right_key(a, key(x), lo, hi, key), x)
+}
+
+fn main() {
+	println(grade(85, [60, 70, 80, 90], ['F', 'D', 'C', 'B', 'A']))
+	println(count_between([1, 3, 5, 7, 9], 3, 7))
+	println(sorted_insert([5, 1, 4, 2]))
+	println(first_of_length(['a', 'bb', 'ccc'], 2))
+}
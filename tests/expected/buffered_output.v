@@ -0,0 +1,93 @@
+module main
+
+import os
+import strings
+import sync
+
+// StdoutBuffer collects printed output for stdout; mu guards it against
+// threads and tasks printing at the same time.
+@[heap]
+struct StdoutBuffer {
+mut:
+	mu  &sync.Mutex
+	buf strings.Builder
+}
+
+fn report(names []string, total int, ok bool) {
+	write_stdout('report\n')
+	for i in []int{len: total, init: index} {
+		write_stdout('row, ')
+		write_stdout_int(i)
+		write_stdout(', ')
+		write_stdout(names[i])
+		write_stdout('\n')
+	}
+	write_stdout('ok: ')
+	write_stdout(if ok { 'True' } else { 'False' })
+	write_stdout('\n')
+	write_stdout('done\n')
+	write_stdout('progress ')
+	write_stdout_int(total)
+	write_stdout('\n')
+	flush_stdout()
+	eprintln('warning')
+	flush_stdout()
+}
+
+// stdout_buffer is shared by every print; it is written out once it
+// holds stdout_buffer_size bytes.
+const stdout_buffer_size = 64 * 1024
+const stdout_buffer = &StdoutBuffer{
+	mu:  sync.new_mutex()
+	buf: strings.new_builder(stdout_buffer_size)
+}
+
+fn init() {
+	at_exit(flush_stdout) or {}
+}
+
+// write_stdout buffers `s` for stdout.
+fn write_stdout(s string) {
+	mut out := stdout_buffer
+	out.mu.@lock()
+	out.buf.write_string(s)
+	if out.buf.len >= stdout_buffer_size {
+		out.flush()
+	}
+	out.mu.unlock()
+}
+
+// write_stdout_int buffers the decimal digits of `n` without building a
+// string for them.
+fn write_stdout_int(n i64) {
+	mut out := stdout_buffer
+	out.mu.@lock()
+	out.buf.write_decimal(n)
+	if out.buf.len >= stdout_buffer_size {
+		out.flush()
+	}
+	out.mu.unlock()
+}
+
+// flush_stdout writes the buffered output to stdout.
+fn flush_stdout() {
+	mut out := stdout_buffer
+	out.mu.@lock()
+	out.flush()
+	out.mu.unlock()
+}
+
+// flush writes the buffered output to stdout; the caller holds out.mu.
+fn (mut out StdoutBuffer) flush() {
+	if out.buf.len == 0 {
+		return
+	}
+	mut file := os.stdout()
+	unsafe { file.write_ptr(out.buf.data, out.buf.len) }
+	file.flush()
+	out.buf.clear()
+}
+
+fn main() {
+	report(['a', 'b'], 2, true)
+}
@@ -0,0 +1,82 @@
+module main
+
+pub struct TupleStringInt {
+pub mut:
+	f0 string
+	f1 int
+}
+
+fn tally(words []string) map[string]int {
+	mut counts := map[string]int{}
+	for w in words {
+		counts[w]++
+	}
+	return counts
+}
+
+fn group_by_rest(nums []int) map[int][]int {
+	mut groups := map[int][]int{}
+	for n in nums {
+		groups[n % 3] << n
+	}
+	return groups
+}
+
+fn top_words(text string, k int) {
+	mut c := map[string]int{}
+	for __key1 in text.split(' ') {
+		c[__key1]++
+	}
+	for __key2 in ['extra', 'extra'] {
+		c[__key2]++
+	}
+	println(most_common_string(c, k))
+	println(most_common_string(c, -1))
+}
+
+fn most_common_string(counts map[string]int, n int) []TupleStringInt {
+	if n < 0 || n >= counts.len {
+		mut pairs := []TupleStringInt{cap: counts.len}
+		for key, count in counts {
+			pairs << TupleStringInt{
+				f0: key
+				f1: count
+			}
+		}
+		mut order := []int{len: pairs.len, init: index}
+		order.sort_with_compare(fn [pairs] (i &int, j &int) int {
+			if pairs[*i].f1 != pairs[*j].f1 {
+				return pairs[*j].f1 - pairs[*i].f1
+			}
+			return *i - *j
+		})
+		return order.map(pairs[it])
+	}
+	mut top := []TupleStringInt{cap: n}
+	for key, count in counts {
+		if top.len == n && (n == 0 || count <= top[n - 1].f1) {
+			continue
+		}
+		mut i := top.len
+		if top.len < n {
+			top << TupleStringInt{}
+		} else {
+			i = n - 1
+		}
+		for i > 0 && top[i - 1].f1 < count {
+			top[i] = top[i - 1]
+			i--
+		}
+		top[i] = TupleStringInt{
+			f0: key
+			f1: count
+		}
+	}
+	return top
+}
+
+fn main() {
+	println(tally(['a', 'b', 'a']))
+	println(group_by_rest([1, 2, 3, 4]))
+	top_words('the cat and the hat', 2)
+}
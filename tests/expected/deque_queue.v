@@ -0,0 +1,137 @@
+module main
+
+// Deque is a growable ring buffer with O(1) appends and pops at both ends.
+// With maxlen > 0, appending to a full deque drops an item from the other end.
+pub struct Deque[T] {
+pub mut:
+	buf    []T
+	head   int
+	len    int
+	maxlen int
+}
+
+fn bfs_order(start int, limit int) []int {
+	mut order := []int{}
+	mut queue := new_deque[int]([start], 0)
+	for queue.len > 0 {
+		node := queue.popleft()
+		order << node
+		for nxt in [node * 2, node * 2 + 1] {
+			if nxt <= limit {
+				queue.append(nxt)
+			}
+		}
+	}
+	return order
+}
+
+fn window_sum(values []int) int {
+	mut window := Deque[int]{
+		maxlen: 3
+	}
+	for v in values {
+		window.append(v)
+	}
+	window.appendleft(0)
+	mut total := 0
+	for v in window.to_array() {
+		total += v
+	}
+	return total + window.get(0) + window.get(-1)
+}
+
+fn new_deque[T](items []T, maxlen int) Deque[T] {
+	mut d := Deque[T]{
+		maxlen: maxlen
+	}
+	d.extend(items)
+	return d
+}
+
+fn (mut d Deque[T]) grow() {
+	mut buf := []T{len: if d.buf.len == 0 { 8 } else { d.buf.len * 2 }}
+	for i in 0 .. d.len {
+		buf[i] = d.buf[(d.head + i) % d.buf.len]
+	}
+	d.buf = buf
+	d.head = 0
+}
+
+fn (mut d Deque[T]) append(item T) {
+	if d.maxlen > 0 && d.len == d.maxlen {
+		d.popleft()
+	}
+	if d.len == d.buf.len {
+		d.grow()
+	}
+	d.buf[(d.head + d.len) % d.buf.len] = item
+	d.len++
+}
+
+fn (mut d Deque[T]) appendleft(item T) {
+	if d.maxlen > 0 && d.len == d.maxlen {
+		d.pop()
+	}
+	if d.len == d.buf.len {
+		d.grow()
+	}
+	d.head = (d.head + d.buf.len - 1) % d.buf.len
+	d.buf[d.head] = item
+	d.len++
+}
+
+fn (mut d Deque[T]) pop() T {
+	if d.len == 0 {
+		panic('pop from an empty deque')
+	}
+	d.len--
+	return d.buf[(d.head + d.len) % d.buf.len]
+}
+
+fn (mut d Deque[T]) popleft() T {
+	if d.len == 0 {
+		panic('pop from an empty deque')
+	}
+	item := d.buf[d.head]
+	d.head = (d.head + 1) % d.buf.len
+	d.len--
+	return item
+}
+
+fn (mut d Deque[T]) extend(items []T) {
+	for item in items {
+		d.append(item)
+	}
+}
+
+fn (mut d Deque[T]) extendleft(items []T) {
+	for item in items {
+		d.appendleft(item)
+	}
+}
+
+fn (mut d Deque[T]) clear() {
+	d.head = 0
+	d.len = 0
+}
+
+fn (d Deque[T]) get(i int) T {
+	idx := if i < 0 { i + d.len } else { i }
+	if idx < 0 || idx >= d.len {
+		panic('deque index out of range')
+	}
+	return d.buf[(d.head + idx) % d.buf.len]
+}
+
+fn (d Deque[T]) to_array() []T {
+	mut items := []T{cap: d.len}
+	for i in 0 .. d.len {
+		items << d.buf[(d.head + i) % d.buf.len]
+	}
+	return items
+}
+
+fn main() {
+	println(bfs_order(1, 6))
+	println(window_sum([1, 2, 3, 4, 5]))
+}
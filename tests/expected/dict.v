@@ -11,14 +11,14 @@ fn explicit_keys() bool {
 	CODES := {
 		'KEY': 1
 	}
-	return 'KEY' in CODES.keys()
+	return 'KEY' in CODES
 }
 
 fn dict_values() bool {
 	CODES := {
 		'KEY': 1
 	}
-	return 1 in CODES.keys().map(CODES[it])
+	return map_has_value(CODES, 1)
 }
 
 fn return_dict_index_str(key string) int {
@@ -35,6 +35,15 @@ fn return_dict_index_int(key int) string {
 	return CODES[key]
 }
 
+fn map_has_value[K, V](m map[K]V, value V) bool {
+	for _, v in m {
+		if v == value {
+			return true
+		}
+	}
+	return false
+}
+
 fn main() {
 	assert implicit_keys()
 	assert explicit_keys()
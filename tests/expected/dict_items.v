@@ -0,0 +1,58 @@
+module main
+
+pub struct TupleStringInt {
+pub mut:
+	f0 string
+	f1 int
+}
+
+fn report(totals map[string]int) {
+	for name, total in totals {
+		println('${name}: ${total}')
+	}
+}
+
+fn ranked(totals map[string]int) []string {
+	mut out := []string{}
+	ordered := totals.keys().map(TupleStringInt{
+		f0: it
+		f1: totals[it]
+	}).sorted_with_compare(fn (a &TupleStringInt, b &TupleStringInt) int {
+		if a.f0 < b.f0 {
+			return -1
+		}
+		if a.f0 > b.f0 {
+			return 1
+		}
+		if a.f1 < b.f1 {
+			return -1
+		}
+		if a.f1 > b.f1 {
+			return 1
+		}
+		return 0
+	})
+	for __item1 in ordered {
+		name := __item1.f0
+		total := __item1.f1
+		out << '${name}=${total}'
+	}
+	return out
+}
+
+fn pairs(totals map[string]int) []TupleStringInt {
+	return totals.keys().map(TupleStringInt{
+		f0: it
+		f1: totals[it]
+	})
+}
+
+fn main() {
+	totals := {
+		'b': 2
+		'a': 1
+	}
+	report(totals)
+	println(ranked(totals))
+	println(pairs(totals).len)
+}
@@ -0,0 +1,41 @@
+module main
+
+fn has_user(ages map[string]int, name string) bool {
+	return name in ages
+}
+
+fn has_age(ages map[string]int, age int) bool {
+	return map_has_value(ages, age)
+}
+
+fn missing_age(ages map[string]int, age int) bool {
+	return !map_has_value(ages, age)
+}
+
+fn has_entry(ages map[string]int, name string, age int) bool {
+	return map_has_item(ages, name, age)
+}
+
+fn map_has_value[K, V](m map[K]V, value V) bool {
+	for _, v in m {
+		if v == value {
+			return true
+		}
+	}
+	return false
+}
+
+fn map_has_item[K, V](m map[K]V, key K, value V) bool {
+	return key in m && m[key] == value
+}
+
+fn main() {
+	ages := {
+		'ann': 31
+		'bob': 27
+	}
+	println(has_user(ages, 'ann'))
+	println(has_age(ages, 27))
+	println(missing_age(ages, 40))
+	println(has_entry(ages, 'bob', 31))
+}
@@ -1,5 +1,7 @@
 module main
 
+import math
+
 fn main_func() {
 	fruits := ['apple', 'banana', 'cherry']
 	for i, fruit in fruits {
@@ -8,7 +10,8 @@ fn main_func() {
 	}
 	names := ['Alice', 'Bob']
 	ages := [25, 30]
-	for __zipi1, name in names {
+	for __zipi1 in 0 .. math.min(names.len, ages.len) {
+		name := names[__zipi1]
 		age := ages[__zipi1]
 		println(name)
 		println(age)
@@ -1,19 +1,63 @@
 module main
 
 import arrays
+import sync
 
 type Any = bool | int | i64 | f64 | string | []u8
 
-// @lru_cache: unsupported decorator — remove or implement manually
+// LruCache memoizes results by argument key; maxsize 0 keeps every entry.
+// Each use queues the key with a tick; queue slots older than the last use
+// of their key are stale and skipped on eviction, so hits are O(1). A cache
+// lives as long as the program and mu lets threads share it.
+@[heap]
+pub struct LruCache[K, V] {
+pub mut:
+	mu          &sync.Mutex = sync.new_mutex()
+	maxsize     int
+	entries     map[K]V
+	last_use    map[K]u64
+	queue_keys  []K
+	queue_ticks []u64
+	head        int
+	tick        u64
+}
+
+// fib_cache holds the results of fib for the whole run.
+const fib_cache = &LruCache[int, int]{
+	maxsize: 128
+}
+
 fn fib(n int) int {
+	mut cache := fib_cache
+	if hit := cache.get(n) {
+		return hit
+	}
+	result := fib_uncached(n)
+	cache.put(n, result)
+	return result
+}
+
+fn fib_uncached(n int) int {
 	if n <= 1 {
 		return n
 	}
 	return fib(n - 1) + fib(n - 2)
 }
 
-// @cache: unsupported decorator — remove or implement manually
+// factorial_cache holds the results of factorial for the whole run.
+const factorial_cache = &LruCache[int, int]{}
+
 fn factorial(n int) int {
+	mut cache := factorial_cache
+	if hit := cache.get(n) {
+		return hit
+	}
+	result := factorial_uncached(n)
+	cache.put(n, result)
+	return result
+}
+
+fn factorial_uncached(n int) int {
 	if n == 0 {
 		return 1
 	}
@@ -28,6 +72,68 @@ fn my_decorator(func Any) fn () Any {
 	return wrapper
 }
 
+fn (mut c LruCache[K, V]) get(key K) ?V {
+	c.mu.@lock()
+	defer { c.mu.unlock() }
+	value := c.entries[key] or { return none }
+	if c.maxsize > 0 {
+		c.touch(key)
+	}
+	return value
+}
+
+fn (mut c LruCache[K, V]) put(key K, value V) {
+	c.mu.@lock()
+	defer { c.mu.unlock() }
+	if c.maxsize > 0 {
+		if key !in c.entries && c.entries.len >= c.maxsize {
+			c.evict()
+		}
+		c.touch(key)
+	}
+	c.entries[key] = value
+}
+
+fn (mut c LruCache[K, V]) touch(key K) {
+	c.tick++
+	c.last_use[key] = c.tick
+	c.queue_keys << key
+	c.queue_ticks << c.tick
+	if c.queue_keys.len > 2 * c.maxsize {
+		c.compact()
+	}
+}
+
+fn (mut c LruCache[K, V]) evict() {
+	for c.head < c.queue_keys.len {
+		key := c.queue_keys[c.head]
+		tick := c.queue_ticks[c.head]
+		c.head++
+		last := c.last_use[key] or { 0 }
+		if last == tick {
+			c.entries.delete(key)
+			c.last_use.delete(key)
+			return
+		}
+	}
+}
+
+fn (mut c LruCache[K, V]) compact() {
+	mut keys := []K{cap: c.maxsize}
+	mut ticks := []u64{cap: c.maxsize}
+	for i in c.head .. c.queue_keys.len {
+		key := c.queue_keys[i]
+		last := c.last_use[key] or { 0 }
+		if last == c.queue_ticks[i] {
+			keys << key
+			ticks << last
+		}
+	}
+	c.queue_keys = keys
+	c.queue_ticks = ticks
+	c.head = 0
+}
+
 fn main() {
 	println(fib(10))
 	println(factorial(5))
@@ -9,7 +9,7 @@ fn (mut self Stack[T]) __init__() {
 	self.items = []T{}
 }
 
-fn (self Stack[T]) push(item T) {
+fn (mut self Stack[T]) push(item T) {
 	self.items << item
 }
 
@@ -5,7 +5,9 @@ fn main() {
 	code_1 := 1
 	code_a := 'a'
 	code_b := 'b'
-	l_b := [code_a]
+	l_b := {
+		code_a: true
+	}
 	l_c := {
 		code_b: code_0
 	}
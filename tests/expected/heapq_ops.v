@@ -0,0 +1,158 @@
+module main
+
+pub struct TupleIntString {
+pub mut:
+	f0 int
+	f1 string
+}
+
+fn schedule(names []string) []string {
+	mut heap := []TupleIntString{}
+	for name in names {
+		job := TupleIntString{
+			f0: name.len
+			f1: name
+		}
+		heap_push(mut heap, job, heap_less_tuple_int_string)
+	}
+	mut order := []string{}
+	for heap.len > 0 {
+		__unpack1 := heap_pop(mut heap, heap_less_tuple_int_string)
+		mut size := __unpack1.f0
+		mut label := __unpack1.f1
+		order << '${label}:${size}'
+	}
+	return order
+}
+
+fn smallest_three() []int {
+	mut heap := [9, 4, 7, 1, 8]
+	heapify(mut heap, heap_less_int)
+	mut out := []int{}
+	for _ in []int{len: 3, init: index} {
+		out << heap_pop(mut heap, heap_less_int)
+	}
+	return out
+}
+
+fn top_k(scores []int, k int) []int {
+	return heap_select(k, scores, heap_less_int)
+}
+
+fn bottom_k(scores []int, k int) []int {
+	return heap_select(k, scores, heap_greater_int)
+}
+
+fn heap_push[T](mut heap []T, item T, less fn (T, T) bool) {
+	heap << item
+	mut i := heap.len - 1
+	for i > 0 {
+		parent := (i - 1) / 2
+		if !less(heap[i], heap[parent]) {
+			break
+		}
+		heap[i], heap[parent] = heap[parent], heap[i]
+		i = parent
+	}
+}
+
+fn heap_sift_down[T](mut heap []T, start int, less fn (T, T) bool) {
+	mut i := start
+	for {
+		mut child := 2 * i + 1
+		if child >= heap.len {
+			break
+		}
+		if child + 1 < heap.len && less(heap[child + 1], heap[child]) {
+			child++
+		}
+		if !less(heap[child], heap[i]) {
+			break
+		}
+		heap[i], heap[child] = heap[child], heap[i]
+		i = child
+	}
+}
+
+fn heap_pop[T](mut heap []T, less fn (T, T) bool) T {
+	if heap.len == 0 {
+		panic('index out of range')
+	}
+	top := heap[0]
+	last := heap.pop()
+	if heap.len > 0 {
+		heap[0] = last
+		heap_sift_down(mut heap, 0, less)
+	}
+	return top
+}
+
+fn heapify[T](mut heap []T, less fn (T, T) bool) {
+	for i := heap.len / 2 - 1; i >= 0; i-- {
+		heap_sift_down(mut heap, i, less)
+	}
+}
+
+fn heap_replace[T](mut heap []T, item T, less fn (T, T) bool) T {
+	if heap.len == 0 {
+		panic('index out of range')
+	}
+	top := heap[0]
+	heap[0] = item
+	heap_sift_down(mut heap, 0, less)
+	return top
+}
+
+fn heap_pushpop[T](mut heap []T, item T, less fn (T, T) bool) T {
+	if heap.len == 0 || !less(heap[0], item) {
+		return item
+	}
+	top := heap[0]
+	heap[0] = item
+	heap_sift_down(mut heap, 0, less)
+	return top
+}
+
+// heap_select returns the n items `less` orders last, last first. It keeps
+// the best n seen so far in a bounded heap, so it runs in O(len * log n).
+fn heap_select[T](n int, items []T, less fn (T, T) bool) []T {
+	if n <= 0 {
+		return []T{}
+	}
+	mut heap := []T{cap: n}
+	for item in items {
+		if heap.len < n {
+			heap_push(mut heap, item, less)
+		} else if less(heap[0], item) {
+			heap[0] = item
+			heap_sift_down(mut heap, 0, less)
+		}
+	}
+	mut top := heap.clone()
+	for i := top.len - 1; i >= 0; i-- {
+		top[i] = heap_pop(mut heap, less)
+	}
+	return top
+}
+
+fn heap_less_tuple_int_string(a TupleIntString, b TupleIntString) bool {
+	if a.f0 != b.f0 {
+		return a.f0 < b.f0
+	}
+	return a.f1 < b.f1
+}
+
+fn heap_less_int(a int, b int) bool {
+	return a < b
+}
+
+fn heap_greater_int(a int, b int) bool {
+	return heap_less_int(b, a)
+}
+
+fn main() {
+	println(schedule(['ccc', 'a', 'bb']))
+	println(smallest_three())
+	println(top_k([5, 1, 9, 3, 7], 3))
+	println(bottom_k([5, 1, 9, 3, 7], 2))
+}
@@ -1,8 +1,6 @@
 module main
 
-type Any = bool | int | i64 | f64 | string | []u8
-
-fn test() Any {
+fn test() int {
 	a := [int(1), 2, 3]
 	return a[1]
 }
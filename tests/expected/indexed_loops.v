@@ -0,0 +1,47 @@
+module main
+
+import math
+
+fn squares(n int) []int {
+	return []int{len: n, init: index}.map(it * it)
+}
+
+fn numbered(names []string) {
+	for __i1, name in names {
+		n := __i1 + 1
+		println('${n}. ${name}')
+	}
+}
+
+fn weighted_total(prices []int, counts []int, n int) int {
+	mut total := 0
+	__zip2 := squares(n)
+	for __zipi3 in 0 .. math.min(math.min(prices.len, counts.len), __zip2.len) {
+		price := prices[__zipi3]
+		count := counts[__zipi3]
+		square := __zip2[__zipi3]
+		total += price * count + square
+	}
+	return total
+}
+
+fn countdown(n int) {
+	for i := n - 1; i >= 0; i-- {
+		println(i)
+	}
+}
+
+fn last_squares(n int) {
+	__rev4 := squares(n)
+	for __ri5 := __rev4.len - 1; __ri5 >= 0; __ri5-- {
+		sq := __rev4[__ri5]
+		println(sq)
+	}
+}
+
+fn main() {
+	numbered(['ann', 'bob'])
+	println(weighted_total([3, 5], [2, 1], 2))
+	countdown(3)
+	last_squares(3)
+}
@@ -0,0 +1,34 @@
+module main
+
+fn fact(n int) int {
+	if n <= 1 {
+		return 1
+	}
+	return n * fact(n - 1)
+}
+
+fn repeat_len(word string, times int) int {
+	mut total := 0
+	mut i := 0
+	for i < times {
+		total += word.len
+		i += 1
+	}
+	return total
+}
+
+fn describe(count int) string {
+	size := if count > 5 { 'big' } else { 'small' }
+	return '${size} ${count}'
+}
+
+fn half(x f64) f64 {
+	return x / f64(2)
+}
+
+fn main() {
+	println(fact(5))
+	println(repeat_len('abc', 3))
+	println(describe(repeat_len('ab', 2)))
+	println(half(3))
+}
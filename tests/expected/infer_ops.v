@@ -1,7 +1,5 @@
 module main
 
-type Any = bool | int | i64 | f64 | string | []u8
-
 fn foo() {
 	a := 10
 	b := 20
@@ -19,51 +17,51 @@ fn foo() {
 	_g := -a
 }
 
-fn add1(x i8, y i8) Any {
+fn add1(x i8, y i8) i16 {
 	return x + y
 }
 
-fn add2(x i16, y i16) Any {
+fn add2(x i16, y i16) int {
 	return x + y
 }
 
-fn add3(x int, y int) Any {
+fn add3(x int, y int) i64 {
 	return x + y
 }
 
-fn add4(x i64, y i64) Any {
+fn add4(x i64, y i64) i64 {
 	return x + y
 }
 
-fn add5(x u8, y u8) Any {
+fn add5(x u8, y u8) u16 {
 	return x + y
 }
 
-fn add6(x u16, y u16) Any {
+fn add6(x u16, y u16) u32 {
 	return x + y
 }
 
-fn add7(x u32, y u32) Any {
+fn add7(x u32, y u32) u64 {
 	return x + y
 }
 
-fn add8(x u64, y u64) Any {
+fn add8(x u64, y u64) u64 {
 	return x + y
 }
 
-fn add9(x i8, y u16) Any {
+fn add9(x i8, y u16) u32 {
 	return x + y
 }
 
-fn sub(x i8, y i8) Any {
+fn sub(x i8, y i8) i16 {
 	return x - y
 }
 
-fn mul(x i8, y i8) Any {
+fn mul(x i8, y i8) i16 {
 	return x * y
 }
 
-fn fadd1(x i8, y f64) Any {
+fn fadd1(x i8, y f64) f64 {
 	return x + y
 }
 
@@ -0,0 +1,75 @@
+module main
+
+import os
+import io
+
+fn count_errors(path string) int {
+	mut errors := 0
+	if true {
+		mut f := os.open(path) or { panic(err) }
+		defer { f.close() }
+		mut __reader1 := io.new_buffered_reader(reader: f)
+		for {
+			mut line := __reader1.read_line() or { break }
+			if !__reader1.end_of_stream() {
+				line += '\n'
+			}
+			if line.starts_with('ERROR') {
+				errors += 1
+			}
+		}
+	}
+	return errors
+}
+
+fn echo_stdin() {
+	mut __reader2 := io.new_buffered_reader(reader: os.stdin())
+	for {
+		line := __reader2.read_line() or { break }
+		println(line.trim_right('\n'))
+	}
+}
+
+fn longest_line(path string) int {
+	mut longest := 0
+	if true {
+		mut f := os.open(path) or { panic(err) }
+		defer { f.close() }
+		mut __reader3 := io.new_buffered_reader(reader: f)
+		for {
+			mut line := __reader3.read_line() or { break }
+			line = line.trim_space()
+			if line.len > longest {
+				longest = line.len
+			}
+		}
+	}
+	return longest
+}
+
+fn count_lines(path string) {
+	if true {
+		mut f := os.open(path) or { panic(err) }
+		defer { f.close() }
+		println(read_lines(f).len)
+	}
+}
+
+// read_lines reads the remaining lines of `r`, keeping the line ends they
+// have: a last line without one is not given one.
+fn read_lines(r io.Reader) []string {
+	mut reader := io.new_buffered_reader(reader: r)
+	mut lines := []string{}
+	for {
+		line := reader.read_line() or { break }
+		lines << if reader.end_of_stream() { line } else { line + '\n' }
+	}
+	return lines
+}
+
+fn main() {
+	println(count_errors('app.log'))
+	println(longest_line('app.log'))
+	count_lines('app.log')
+	echo_stdin()
+}
@@ -2,7 +2,7 @@ module main
 
 type Any = bool | int | i64 | f64 | string | []u8
 
-fn build(a Any, b Any, c Any, d Any, e Any, f Any, g Any, h Any, i Any, j Any, k Any, l Any) Any {
+fn build(a int, b int, c int, d int, e int, f int, g int, h int, i int, j int, k int, l int) Any {
 	items := [
 		'aaaaaaaaaa',
 		'bbbbbbbbbb',
@@ -2,7 +2,7 @@ module main
 
 type Any = bool | int | i64 | f64 | string | []u8
 
-fn describe(point Any) Any {
+fn describe(point Any) string {
 	if point.len == 2 && point[0] == 0 && point[1] == 0 {
 		return 'origin'
 	} else if point.len == 2 && point[1] == 0 {
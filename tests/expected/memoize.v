@@ -0,0 +1,182 @@
+module main
+
+import arrays
+import sync
+
+pub struct Circle {
+pub mut:
+	radius     f64
+	area_cache ?f64
+}
+
+fn (mut self Circle) __init__(radius f64) {
+	self.radius = radius
+}
+
+fn (mut self Circle) area() f64 {
+	if cached := self.area_cache {
+		return cached
+	}
+	value := self.area_uncached()
+	self.area_cache = value
+	return value
+}
+
+fn (self Circle) area_uncached() f64 {
+	return 3.14159 * self.radius * self.radius
+}
+
+struct GridPathsMemo {
+	rows   int
+	cols   int
+	result int
+}
+
+struct WeightMemo {
+	word   string
+	n      int
+	result int
+}
+
+// LruCache memoizes results by argument key; maxsize 0 keeps every entry.
+// Each use queues the key with a tick; queue slots older than the last use
+// of their key are stale and skipped on eviction, so hits are O(1). A cache
+// lives as long as the program and mu lets threads share it.
+@[heap]
+pub struct LruCache[K, V] {
+pub mut:
+	mu          &sync.Mutex = sync.new_mutex()
+	maxsize     int
+	entries     map[K]V
+	last_use    map[K]u64
+	queue_keys  []K
+	queue_ticks []u64
+	head        int
+	tick        u64
+}
+
+// grid_paths_cache holds the results of grid_paths for the whole run.
+const grid_paths_cache = &LruCache[u64, GridPathsMemo]{}
+
+fn grid_paths(rows int, cols int) int {
+	key := (u64(rows) * 0x100000001b3) ^ u64(cols)
+	mut cache := grid_paths_cache
+	if hit := cache.get(key) {
+		if hit.rows == rows && hit.cols == cols {
+			return hit.result
+		}
+	}
+	result := grid_paths_uncached(rows, cols)
+	cache.put(key, GridPathsMemo{
+		rows:   rows
+		cols:   cols
+		result: result
+	})
+	return result
+}
+
+fn grid_paths_uncached(rows int, cols int) int {
+	if rows == 0 || cols == 0 {
+		return 1
+	}
+	return grid_paths(rows - 1, cols) + grid_paths(rows, cols - 1)
+}
+
+// weight_cache holds the results of weight for the whole run.
+const weight_cache = &LruCache[u64, WeightMemo]{
+	maxsize: 32
+}
+
+fn weight(word string, n int) int {
+	key := (u64(word.hash()) * 0x100000001b3) ^ u64(n)
+	mut cache := weight_cache
+	if hit := cache.get(key) {
+		if hit.word == word && hit.n == n {
+			return hit.result
+		}
+	}
+	result := weight_uncached(word, n)
+	cache.put(key, WeightMemo{
+		word:   word
+		n:      n
+		result: result
+	})
+	return result
+}
+
+fn weight_uncached(word string, n int) int {
+	return word.len * n
+}
+
+fn (mut c LruCache[K, V]) get(key K) ?V {
+	c.mu.@lock()
+	defer { c.mu.unlock() }
+	value := c.entries[key] or { return none }
+	if c.maxsize > 0 {
+		c.touch(key)
+	}
+	return value
+}
+
+fn (mut c LruCache[K, V]) put(key K, value V) {
+	c.mu.@lock()
+	defer { c.mu.unlock() }
+	if c.maxsize > 0 {
+		if key !in c.entries && c.entries.len >= c.maxsize {
+			c.evict()
+		}
+		c.touch(key)
+	}
+	c.entries[key] = value
+}
+
+fn (mut c LruCache[K, V]) touch(key K) {
+	c.tick++
+	c.last_use[key] = c.tick
+	c.queue_keys << key
+	c.queue_ticks << c.tick
+	if c.queue_keys.len > 2 * c.maxsize {
+		c.compact()
+	}
+}
+
+fn (mut c LruCache[K, V]) evict() {
+	for c.head < c.queue_keys.len {
+		key := c.queue_keys[c.head]
+		tick := c.queue_ticks[c.head]
+		c.head++
+		last := c.last_use[key] or { 0 }
+		if last == tick {
+			c.entries.delete(key)
+			c.last_use.delete(key)
+			return
+		}
+	}
+}
+
+fn (mut c LruCache[K, V]) compact() {
+	mut keys := []K{cap: c.maxsize}
+	mut ticks := []u64{cap: c.maxsize}
+	for i in c.head .. c.queue_keys.len {
+		key := c.queue_keys[i]
+		last := c.last_use[key] or { 0 }
+		if last == c.queue_ticks[i] {
+			keys << key
+			ticks << last
+		}
+	}
+	c.queue_keys = keys
+	c.queue_ticks = ticks
+	c.head = 0
+}
+
+fn main() {
+	println(grid_paths(8, 8))
+	println(weight('a|b', 2))
+	println(weight('a', 2))
+	mut c := Circle{
+		radius: 2.5
+	}
+	println(c.area())
+	println(c.area())
+}
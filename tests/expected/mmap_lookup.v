@@ -0,0 +1,163 @@
+module main
+
+import os
+
+// MappedFile is a read-only memory map of a file, addressed by i64 offsets.
+pub struct MappedFile {
+pub:
+	ptr &u8
+	len i64
+}
+
+fn count_key(path string, key []u8) int {
+	mut count := 0
+	if true {
+		mut f := os.open(path) or { panic(err) }
+		defer { f.close() }
+		if true {
+			mm := map_file(mut f, 0)
+			defer { mm.close() }
+			mut pos := mm.find(key, 0)
+			for pos >= 0 {
+				count += 1
+				pos = mm.find(key, pos + key.len)
+			}
+			println(mm.len)
+			println(mm.at(-1))
+		}
+	}
+	return count
+}
+
+fn header(path string) {
+	if true {
+		mut f := os.open(path) or { panic(err) }
+		defer { f.close() }
+		mm := map_file(mut f, 0)
+		magic := mm.slice(0, 4)
+		println(magic)
+		println(mm.rfind([byte(0x0a)], 0))
+		mm.close()
+	}
+}
+
+#include <sys/mman.h>
+
+fn C.mmap(addr voidptr, len usize, prot int, flags int, fd int, offset isize) voidptr
+fn C.munmap(addr voidptr, len usize) int
+
+// map_file maps the first `length` bytes of `f` read-only, or all of it when
+// `length` is 0.
+fn map_file(mut f os.File, length i64) MappedFile {
+	mut size := length
+	if size == 0 {
+		pos := f.tell() or { panic(err) }
+		f.seek(0, .end) or { panic(err) }
+		size = f.tell() or { panic(err) }
+		f.seek(pos, .start) or { panic(err) }
+	}
+	if size == 0 {
+		panic('mmap: cannot map an empty file')
+	}
+	ptr := C.mmap(unsafe { nil }, usize(size), C.PROT_READ, C.MAP_SHARED, f.fd, 0)
+	if ptr == C.MAP_FAILED {
+		panic('mmap: ${os.posix_get_error_msg(C.errno)}')
+	}
+	return MappedFile{
+		ptr: &u8(ptr)
+		len: size
+	}
+}
+
+// at returns the byte at offset `i`; negative offsets count from the end.
+fn (m MappedFile) at(i i64) u8 {
+	idx := if i < 0 { i + m.len } else { i }
+	if idx < 0 || idx >= m.len {
+		panic('mmap index out of range')
+	}
+	return unsafe { m.ptr[idx] }
+}
+
+// slice returns the bytes from `start` to `end`, clamped like a Python
+// slice, as a []u8 window over the map; it is not copied.
+fn (m MappedFile) slice(start i64, end i64) []u8 {
+	lo := m.clamp(start)
+	hi := m.clamp(end)
+	if hi <= lo {
+		return []u8{}
+	}
+	if hi - lo > max_int {
+		panic('mmap: a slice of ${hi - lo} bytes does not fit in a []u8')
+	}
+	return unsafe { (m.ptr + lo).vbytes(int(hi - lo)) }
+}
+
+// clamp turns a slice bound into an offset within the map.
+fn (m MappedFile) clamp(i i64) i64 {
+	if i < 0 {
+		return if i + m.len > 0 { i + m.len } else { 0 }
+	}
+	return if i < m.len { i } else { m.len }
+}
+
+// find returns the offset of the first `sub` at or after `start`, or -1. It
+// is a Horspool search: a mismatch skips ahead by up to len(sub) bytes.
+fn (m MappedFile) find(sub []u8, start i64) i64 {
+	mut i := m.clamp(start)
+	n := i64(sub.len)
+	if n == 0 {
+		return i
+	}
+	mut skip := []i64{len: 256, init: n}
+	for j in 0 .. sub.len - 1 {
+		skip[sub[j]] = n - 1 - j
+	}
+	last := sub[sub.len - 1]
+	for i + n <= m.len {
+		c := unsafe { m.ptr[i + n - 1] }
+		if c == last && unsafe { vmemcmp(m.ptr + i, sub.data, sub.len) } == 0 {
+			return i
+		}
+		i += skip[c]
+	}
+	return -1
+}
+
+// rfind returns the offset of the last `sub` at or after `start`, or -1,
+// searching backwards with the mirrored Horspool skips.
+fn (m MappedFile) rfind(sub []u8, start i64) i64 {
+	from := m.clamp(start)
+	n := i64(sub.len)
+	if n == 0 {
+		return m.len
+	}
+	mut skip := []i64{len: 256, init: n}
+	for j := sub.len - 1; j > 0; j-- {
+		skip[sub[j]] = j
+	}
+	first := sub[0]
+	mut i := m.len - n
+	for i >= from {
+		c := unsafe { m.ptr[i] }
+		if c == first && unsafe { vmemcmp(m.ptr + i, sub.data, sub.len) } == 0 {
+			return i
+		}
+		i -= skip[c]
+	}
+	return -1
+}
+
+// size returns the mapped length in bytes.
+fn (m MappedFile) size() i64 {
+	return m.len
+}
+
+// close unmaps the file; its slices must not be used afterwards.
+fn (m MappedFile) close() {
+	C.munmap(m.ptr, usize(m.len))
+}
+
+fn main() {
+	println(count_key('index.bin', [byte(0x6b), 0x65, 0x79]))
+	header('index.bin')
+}
@@ -0,0 +1,204 @@
+module main
+
+import runtime
+
+pub struct TupleStringInt {
+pub mut:
+	f0 string
+	f1 int
+}
+
+// Task is the handle of a queued job; wait() blocks until it has run.
+@[heap]
+pub struct Task[T] {
+	done chan T
+}
+
+// Executor runs submitted jobs on its own worker threads.
+pub struct Executor {
+	jobs    chan fn ()
+	workers []thread
+	size    int
+	state   &ExecutorState = &ExecutorState{}
+}
+
+// ExecutorState records whether an executor was closed and joined, so
+// close(), join() and shutdown() can be called more than once.
+@[heap]
+struct ExecutorState {
+mut:
+	closed bool
+	joined bool
+}
+
+fn cube(n int) int {
+	return n * n * n
+}
+
+fn label(word string, times int) string {
+	return '${word}:${times}'
+}
+
+fn make_pair(word string, times int) TupleStringInt {
+	return TupleStringInt{
+		f0: word
+		f1: times
+	}
+}
+
+fn run_pool(nums []int, pairs []TupleStringInt) {
+	if true {
+		pool := new_executor(4)
+		defer { pool.shutdown() }
+		println(executor_map(pool, cube, nums, 2))
+		println(executor_map(pool, fn (args TupleStringInt) string {
+			return label(args.f0, args.f1)
+		}, pairs, 0))
+		__results1 := executor_imap(pool, cube, nums, 1, true)
+		for {
+			value := <-__results1 or { break }
+			println(value)
+		}
+		mut total := 0
+		__results2 := executor_imap(pool, cube, nums, 4, false)
+		for {
+			value := <-__results2 or { break }
+			total += value
+		}
+		println(total)
+	}
+}
+
+// queue_job queues `job` on a pool and returns its handle.
+fn queue_job[T](jobs chan fn (), job fn () T) &Task[T] {
+	task := &Task[T]{
+		done: chan T{cap: 1}
+	}
+	jobs <- fn [task, job] () {
+		task.done <- job()
+	}
+	return task
+}
+
+// wait returns the result of the task; it can be awaited more than once.
+fn (task &Task[T]) wait() T {
+	result := <-task.done
+	task.done <- result
+	return result
+}
+
+// cancel is a no-op: queued jobs always run to completion.
+fn (task &Task[T]) cancel() {}
+
+// run_jobs runs the jobs of a pool on one worker thread until its job
+// channel is closed.
+fn run_jobs(jobs chan fn ()) {
+	for {
+		job := <-jobs or { break }
+		job()
+	}
+}
+
+// new_executor starts `workers` worker threads, or one per core when
+// `workers` is not positive.
+fn new_executor(workers int) Executor {
+	size := if workers > 0 { workers } else { runtime.nr_cpus() }
+	jobs := chan fn (){cap: 1024}
+	mut threads := []thread{}
+	for _ in 0 .. size {
+		threads << spawn run_jobs(jobs)
+	}
+	return Executor{
+		jobs:    jobs
+		workers: threads
+		size:    size
+	}
+}
+
+// submit queues `job` on the executor and returns its handle.
+fn (e Executor) submit[T](job fn () T) &Task[T] {
+	return queue_job(e.jobs, job)
+}
+
+// executor_map applies `f` to `items` in jobs of `chunksize` items, one
+// chunk per worker when `chunksize` is not positive, and returns the
+// results in order.
+fn executor_map[T, R](e Executor, f fn (T) R, items []T, chunksize int) []R {
+	chunk := if chunksize > 0 { chunksize } else { (items.len + e.size - 1) / e.size }
+	mut tasks := []&Task[[]R]{}
+	for start := 0; start < items.len; start += chunk {
+		end := if start + chunk < items.len { start + chunk } else { items.len }
+		part := items[start..end]
+		tasks << e.submit(fn [f, part] () []R {
+			return part.map(f(it))
+		})
+	}
+	mut results := []R{cap: items.len}
+	for task in tasks {
+		results << task.wait()
+	}
+	return results
+}
+
+// executor_imap streams the results of `f` over `items`, computed in jobs
+// of `chunksize` items, through a bounded channel: in order, or as each
+// chunk finishes when `ordered` is false.
+fn executor_imap[T, R](e Executor, f fn (T) R, items []T, chunksize int, ordered bool) chan R {
+	chunk := if chunksize > 0 { chunksize } else { 1 }
+	out := chan R{cap: e.size * chunk}
+	spawn feed_results(e, f, items, chunk, ordered, out)
+	return out
+}
+
+// feed_results submits the chunks of `items` and sends their results to
+// `out`, closing it after the last one.
+fn feed_results[T, R](e Executor, f fn (T) R, items []T, chunk int, ordered bool, out chan R) {
+	mut tasks := []&Task[[]R]{}
+	for start := 0; start < items.len; start += chunk {
+		end := if start + chunk < items.len { start + chunk } else { items.len }
+		part := items[start..end]
+		tasks << e.submit(fn [f, part, ordered, out] () []R {
+			if ordered {
+				return part.map(f(it))
+			}
+			for item in part {
+				out <- f(item)
+			}
+			return []R{}
+		})
+	}
+	for task in tasks {
+		for result in task.wait() {
+			out <- result
+		}
+	}
+	out.close()
+}
+
+// close stops accepting jobs; the queued ones still run.
+fn (e Executor) close() {
+	mut state := e.state
+	if !state.closed {
+		state.closed = true
+		e.jobs.close()
+	}
+}
+
+// join waits for the workers to run the queued jobs after close().
+fn (e Executor) join() {
+	mut state := e.state
+	if !state.joined {
+		state.joined = true
+		e.workers.wait()
+	}
+}
+
+// shutdown waits for the queued jobs to run and stops the workers.
+fn (e Executor) shutdown() {
+	e.close()
+	e.join()
+}
+
+fn main() {
+	run_pool([1, 2, 3], [make_pair('a', 2), make_pair('b', 3)])
+}
@@ -0,0 +1,39 @@
+module main
+
+fn scores() []int {
+	return [4, 8, 15, 16, 23, 42]
+}
+
+fn last_score() int {
+	return index_from_end(scores(), 1)
+}
+
+fn second_last(values []int) int {
+	return values[values.len - 2]
+}
+
+fn nth_from_end(values []int, k int) int {
+	return values[values.len - k]
+}
+
+fn tail(k int) []int {
+	return scores()#[-k..]
+}
+
+fn trimmed(values []int, k int) []int {
+	return values#[1..-(k + 1)]
+}
+
+// index_from_end returns `items[items.len - n]` with V's bounds check, so an
+// offset past either end panics instead of being clamped.
+fn index_from_end[T](items []T, n int) T {
+	return items[items.len - n]
+}
+
+fn main() {
+	println(last_score())
+	println(second_last([1, 2, 3]))
+	println(nth_from_end([1, 2, 3], 2))
+	println(tail(2))
+	println(trimmed([1, 2, 3, 4, 5], 1))
+}
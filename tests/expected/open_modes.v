@@ -0,0 +1,31 @@
+module main
+
+import os
+
+fn update(path string) {
+	if true {
+		mut f := os.open_file(path, 'r+') or { panic(err) }
+		defer { f.close() }
+		f.write_string('hi') or { panic(err) }
+	}
+}
+
+fn create_new(path string) {
+	if true {
+		mut f := (fn (path string) os.File {
+			fd := C.open(&char(path.str), os.o_wronly | os.o_create | os.o_excl, 0o666)
+			if fd == -1 {
+				panic('${path}: ${os.posix_get_error_msg(C.errno)}')
+			}
+			C.close(fd)
+			return os.open_file(path, 'r+') or { panic(err) }
+		}(path))
+		defer { f.close() }
+		f.write_string('new') or { panic(err) }
+	}
+}
+
+fn main() {
+	create_new('fresh.txt')
+	update('fresh.txt')
+}
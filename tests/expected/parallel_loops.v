@@ -0,0 +1,56 @@
+module main
+
+import runtime
+
+fn score(x f64) f64 {
+	return x * x + 1.0
+}
+
+fn run(items []f64, n int) {
+	results := parallel_map(items, fn (x f64) f64 {
+		return score(x)
+	})
+	println(results)
+	mut out := [0.0].repeat(n)
+	for __j1, __result2 in parallel_range(0, n, fn [items] (i int) f64 {
+		return score(items[i])
+	}) {
+		out[__j1] = __result2
+	}
+	println(out)
+	squares := parallel_range(1, n, fn (i int) int {
+		return i * i
+	})
+	println(squares)
+}
+
+// parallel_map applies `f` to `items` on one thread per core.
+fn parallel_map[T, R](items []T, f fn (T) R) []R {
+	workers := runtime.nr_cpus()
+	chunk := (items.len + workers - 1) / workers
+	mut threads := []thread []R{}
+	for start := 0; start < items.len; start += chunk {
+		end := if start + chunk < items.len { start + chunk } else { items.len }
+		threads << spawn parallel_chunk(items[start..end], f)
+	}
+	mut results := []R{cap: items.len}
+	for part in threads.wait() {
+		results << part
+	}
+	return results
+}
+
+fn parallel_chunk[T, R](items []T, f fn (T) R) []R {
+	return items.map(f(it))
+}
+
+// parallel_range applies `f` to the integers `start` .. `end` on one thread
+// per core; an empty or reversed range yields no results.
+fn parallel_range[R](start int, end int, f fn (int) R) []R {
+	count := if end > start { end - start } else { 0 }
+	return parallel_map([]int{len: count, init: index + start}, f)
+}
+
+fn main() {
+	run([1.0, 2.0, 3.0], 3)
+}
@@ -0,0 +1,62 @@
+module main
+
+fn gcd(a int, b int) int {
+	mut a_ := a
+	mut b_ := b
+	for {
+		if b_ == 0 {
+			return a_
+		}
+		a_, b_ = b_, a_ % b_
+	}
+}
+
+fn factorial(n int) int {
+	mut n_ := n
+	mut __acc1 := 1
+	for {
+		if n_ <= 1 {
+			return __acc1
+		}
+		__acc1 *= n_
+		n_ = n_ - 1
+	}
+}
+
+fn count_down(n int) {
+	mut n_ := n
+	for {
+		if n_ < 0 {
+			return
+		}
+		println(n_)
+		n_ = n_ - 1
+	}
+}
+
+fn repeat(s string, n int) string {
+	mut n_ := n
+	mut __acc2 := ''
+	for {
+		if n_ == 0 {
+			return __acc2
+		}
+		__acc2 = s + __acc2
+		n_ = n_ - 1
+	}
+}
+
+fn fib(n int) int {
+	if n < 2 {
+		return n
+	}
+	return fib(n - 1) + fib(n - 2)
+}
+
+fn main() {
+	println(gcd(48, 18))
+	println(factorial(10))
+	count_down(3)
+	println(repeat('ab', 3))
+	println(fib(10))
+}
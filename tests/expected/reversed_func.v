@@ -2,19 +2,17 @@ module main
 
 fn main_func() {
 	nums := [1, 2, 3, 4, 5]
-	for x in nums.reverse() {
+	for __ri1 := nums.len - 1; __ri1 >= 0; __ri1-- {
+		x := nums[__ri1]
 		println(x)
 	}
 	s := 'hello'
-	for c in s.reverse() {
+	for __ri2 := s.len - 1; __ri2 >= 0; __ri2-- {
+		c := s[__ri2].ascii_str()
 		println(c)
 	}
 	unsorted := [3, 1, 4, 1, 5]
-	for x in (fn (a []main.Any) []main.Any {
-		mut b := a.clone()
-		b.sort()
-		return b
-	}(unsorted)) {
+	for x in unsorted.sorted(a > b) {
 		println(x)
 	}
 }
@@ -0,0 +1,81 @@
+module main
+
+import sync
+
+// Lock is a mutex shared by reference between threads.
+@[heap]
+pub struct Lock {
+	mutex &sync.Mutex = sync.new_mutex()
+}
+
+// RLock is a reentrant lock: the thread holding it can acquire it again,
+// and it is released once every acquire() has been matched.
+@[heap]
+pub struct RLock {
+	mutex &sync.Mutex     = sync.new_mutex()
+	state &RLockOwnership = &RLockOwnership{}
+}
+
+// RLockOwnership records the thread holding an RLock and how many times it
+// has acquired it. Only the holder writes it.
+@[heap]
+struct RLockOwnership {
+mut:
+	owner u64
+	count int
+}
+
+fn run_nested() {
+	@lock := &RLock{}
+	mut total := 0
+	if true {
+		@lock.acquire()
+		defer { @lock.release() }
+		if true {
+			@lock.acquire()
+			defer { @lock.release() }
+			total += 1
+		}
+	}
+	println(total)
+}
+
+fn (l &Lock) acquire() {
+	mut mutex := l.mutex
+	mutex.@lock()
+}
+
+fn (l &Lock) release() {
+	mut mutex := l.mutex
+	mutex.unlock()
+}
+
+// acquire takes the lock, or counts one more hold when the calling thread
+// already has it.
+fn (l &RLock) acquire() {
+	me := sync.thread_id()
+	mut state := l.state
+	if state.count > 0 && state.owner == me {
+		state.count++
+		return
+	}
+	mut mutex := l.mutex
+	mutex.@lock()
+	state.owner = me
+	state.count = 1
+}
+
+// release drops one hold and unlocks once the last one is gone.
+fn (l &RLock) release() {
+	mut state := l.state
+	state.count--
+	if state.count == 0 {
+		state.owner = 0
+		mut mutex := l.mutex
+		mutex.unlock()
+	}
+}
+
+fn main() {
+	run_nested()
+}
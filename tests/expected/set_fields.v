@@ -0,0 +1,37 @@
+module main
+
+pub struct Tracker {
+pub mut:
+	seen map[int]bool
+}
+
+fn (mut self Tracker) __init__() {
+	self.seen = map[int]bool{}
+}
+
+fn (mut self Tracker) visit(item int) {
+	self.seen[item] = true
+}
+
+fn (mut self Tracker) forget(item int) {
+	if item !in self.seen {
+		panic('element not in set: ${item}')
+	}
+	self.seen.delete(item)
+}
+
+fn (self Tracker) known(item int) bool {
+	return item in self.seen
+}
+
+fn main_func() {
+	tracker := Tracker{}
+	tracker.visit(3)
+	tracker.visit(5)
+	tracker.forget(3)
+	println(tracker.seen.len)
+}
+
+fn main() {
+	main_func()
+}
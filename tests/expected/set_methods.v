@@ -0,0 +1,39 @@
+module main
+
+fn main_func() {
+	mut seen := map[string]bool{}
+	for word in ['a', 'b', 'a'] {
+		seen[word] = true
+	}
+	println(seen.len)
+	seen.delete('a')
+	println(if 'a' in seen { 'True' } else { 'False' })
+	nums := [1, 2, 3]
+	squares := (fn () map[int]bool {
+		mut result := map[int]bool{}
+		for n in nums {
+			result[n * n] = true
+		}
+		return result
+	}())
+	println(squares.keys())
+	evens := (fn () map[int]bool {
+		mut result := map[int]bool{}
+		for n, _ in squares {
+			if n % 2 == 0 {
+				result[n] = true
+			}
+		}
+		return result
+	}())
+	println(evens.len)
+	flags := {
+		'a': true
+		'b': false
+	}
+	println(flags)
+}
+
+fn main() {
+	main_func()
+}
@@ -1,16 +1,54 @@
 module main
 
 fn main_func() {
-	a := [1, 2, 3]
-	b := [2, 3, 4]
+	a := {
+		1: true
+		2: true
+		3: true
+	}
+	b := {
+		2: true
+		3: true
+		4: true
+	}
 	println(if 1 in a { 'True' } else { 'False' })
 	println(if 5 in a { 'True' } else { 'False' })
-	@union := a | b
-	println(@union)
-	intersection := a & b
-	println(intersection)
-	difference := a - b
-	println(difference)
+	@union := (fn (lhs map[int]bool, rhs map[int]bool) map[int]bool {
+		mut res := lhs.clone()
+		for elem, _ in rhs {
+			res[elem] = true
+		}
+		return res
+	}(a, b))
+	println(@union.keys())
+	intersection := (fn (lhs map[int]bool, rhs map[int]bool) map[int]bool {
+		mut res := map[int]bool{}
+		if lhs.len <= rhs.len {
+			for elem, _ in lhs {
+				if elem in rhs {
+					res[elem] = true
+				}
+			}
+		} else {
+			for elem, _ in rhs {
+				if elem in lhs {
+					res[elem] = true
+				}
+			}
+		}
+		return res
+	}(a, b))
+	println(intersection.keys())
+	difference := (fn (lhs map[int]bool, rhs map[int]bool) map[int]bool {
+		mut res := map[int]bool{}
+		for elem, _ in lhs {
+			if elem !in rhs {
+				res[elem] = true
+			}
+		}
+		return res
+	}(a, b))
+	println(difference.keys())
 }
 
 fn main() {
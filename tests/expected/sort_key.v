@@ -0,0 +1,74 @@
+module main
+
+fn score(word string) int {
+	return word.len * 3
+}
+
+fn main_func() {
+	mut words := ['pear', 'fig', 'banana', 'kiwi']
+	by_len := (fn (src []string) []string {
+		keys := src.map(it.len)
+		mut order := []int{len: src.len, init: index}
+		order.sort_with_compare(fn [keys] (i &int, j &int) int {
+			if keys[*i] < keys[*j] {
+				return -1
+			}
+			if keys[*i] > keys[*j] {
+				return 1
+			}
+			return *i - *j
+		})
+		return order.map(src[it])
+	}(words))
+	println(by_len)
+	nums := [5, -3, 2, -8]
+	by_square := (fn (src []int) []int {
+		keys := src.map(it * it)
+		mut order := []int{len: src.len, init: index}
+		order.sort_with_compare(fn [keys] (i &int, j &int) int {
+			if keys[*i] < keys[*j] {
+				return 1
+			}
+			if keys[*i] > keys[*j] {
+				return -1
+			}
+			return *i - *j
+		})
+		return order.map(src[it])
+	}(nums))
+	println(by_square)
+	by_score := (fn (src []string) []string {
+		keys := src.map(score(it))
+		mut order := []int{len: src.len, init: index}
+		order.sort_with_compare(fn [keys] (i &int, j &int) int {
+			if keys[*i] < keys[*j] {
+				return -1
+			}
+			if keys[*i] > keys[*j] {
+				return 1
+			}
+			return *i - *j
+		})
+		return order.map(src[it])
+	}(words))
+	println(by_score)
+	words = (fn (src []string) []string {
+		keys := src.map(it.len)
+		mut order := []int{len: src.len, init: index}
+		order.sort_with_compare(fn [keys] (i &int, j &int) int {
+			if keys[*i] < keys[*j] {
+				return -1
+			}
+			if keys[*i] > keys[*j] {
+				return 1
+			}
+			return *i - *j
+		})
+		return order.map(src[it])
+	}(words))
+	println(words)
+}
+
+fn main() {
+	main_func()
+}
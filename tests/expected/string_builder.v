@@ -0,0 +1,49 @@
+module main
+
+import strings
+
+fn render(words []string) string {
+	mut out_builder := strings.new_builder(0)
+	for w in words {
+		out_builder.write_string(w)
+		out_builder.write_string(' ')
+	}
+	out := out_builder.str()
+	return out
+}
+
+fn digits(n int) string {
+	mut text_builder := strings.new_builder(0)
+	text_builder.write_string('#')
+	mut i := 0
+	for i < n {
+		text_builder.write_string(i.str())
+		i += 1
+	}
+	text := text_builder.str()
+	return text
+}
+
+fn csv_row(values []int) string {
+	return (fn [values] () string {
+		mut __sb1 := strings.new_builder(0)
+		mut __count2 := 0
+		for v in values {
+			if !(v > 0) {
+				continue
+			}
+			if __count2 > 0 {
+				__sb1.write_string(', ')
+			}
+			__count2++
+			__sb1.write_string(v.str())
+		}
+		return __sb1.str()
+	}())
+}
+
+fn main() {
+	println(render(['a', 'b']))
+	println(digits(3))
+	println(csv_row([1, -2, 3]))
+}
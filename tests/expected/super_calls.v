@@ -11,7 +11,7 @@ fn (mut self Base) __init__(value Any) {
 	self.value = value
 }
 
-fn (self Base) greet() Any {
+fn (self Base) greet() string {
 	return 'hi ${self.value}'
 }
 
@@ -23,7 +23,7 @@ fn (mut self Child) __init__(value Any) {
 	self.Base.__init__(value)
 }
 
-fn (self Child) greet() Any {
+fn (self Child) greet() string {
 	return self.Base.greet()
 }
 
@@ -0,0 +1,287 @@
+module main
+
+import sync
+
+// AsyncQueue is a FIFO between tasks; join() waits until every item put
+// has been marked done.
+@[heap]
+pub struct AsyncQueue[T] {
+	buf     &QueueBuffer[T]
+	mutex   &sync.Mutex     = sync.new_mutex()
+	ready   &sync.Semaphore = sync.new_semaphore()
+	slots   &sync.Semaphore
+	bounded bool
+	pending &sync.WaitGroup = sync.new_waitgroup()
+}
+
+// QueueBuffer holds the items of an AsyncQueue from `head` on; it grows as
+// needed, so put() on an unbounded queue never blocks.
+@[heap]
+pub struct QueueBuffer[T] {
+mut:
+	items []T
+	head  int
+}
+
+// Thread runs a job on its own thread once started.
+@[heap]
+pub struct Thread {
+	job  fn ()
+	done chan bool = chan bool{}
+}
+
+// Lock is a mutex shared by reference between threads.
+@[heap]
+pub struct Lock {
+	mutex &sync.Mutex = sync.new_mutex()
+}
+
+// RLock is a reentrant lock: the thread holding it can acquire it again,
+// and it is released once every acquire() has been matched.
+@[heap]
+pub struct RLock {
+	mutex &sync.Mutex     = sync.new_mutex()
+	state &RLockOwnership = &RLockOwnership{}
+}
+
+// RLockOwnership records the thread holding an RLock and how many times it
+// has acquired it. Only the holder writes it.
+@[heap]
+struct RLockOwnership {
+mut:
+	owner u64
+	count int
+}
+
+// Event is a flag threads wait() on until another thread set()s it.
+@[heap]
+pub struct Event {
+	done chan bool = chan bool{}
+}
+
+// Condition lets threads holding its mutex wait() until notified.
+@[heap]
+pub struct Condition {
+	mutex   &sync.Mutex    = sync.new_mutex()
+	waiters chan chan bool = chan chan bool{cap: 1024}
+}
+
+fn produce(jobs &AsyncQueue[int], start int, count int) {
+	for i in []int{len: start + count - start, init: index + start} {
+		jobs.put(i)
+	}
+}
+
+fn run_threads() {
+	@lock := &Lock{}
+	cond := &Condition{
+		mutex: @lock.mutex
+	}
+	ready := &Event{}
+	jobs := new_async_queue[int](4)
+	jobs.put(100)
+	producer := new_thread(fn [jobs] () {
+		produce(jobs, 0, 2)
+	})
+	producer.start()
+	mut workers := []&Thread{}
+	for n in 0 .. 2 {
+		workers << new_thread(fn [jobs, n] () {
+			produce(jobs, n * 10, 1)
+		})
+	}
+	for worker in workers {
+		worker.start()
+	}
+	mut total := 0
+	for _ in []int{len: 5, init: index} {
+		if true {
+			@lock.acquire()
+			defer { @lock.release() }
+			total += jobs.get()
+		}
+	}
+	producer.join()
+	for worker in workers {
+		worker.join()
+	}
+	ready.set()
+	if true {
+		cond.acquire()
+		defer { cond.release() }
+		cond.notify_all()
+	}
+	println(total)
+	println(ready.is_set())
+}
+
+// new_async_queue holds at most `maxsize` items; maxsize <= 0 is unbounded.
+fn new_async_queue[T](maxsize int) &AsyncQueue[T] {
+	return &AsyncQueue[T]{
+		buf:     &QueueBuffer[T]{}
+		slots:   sync.new_semaphore_init(u32(if maxsize > 0 { maxsize } else { 0 }))
+		bounded: maxsize > 0
+	}
+}
+
+fn (q &AsyncQueue[T]) put(item T) {
+	mut pending := q.pending
+	pending.add(1)
+	if q.bounded {
+		mut slots := q.slots
+		slots.wait()
+	}
+	mut mutex := q.mutex
+	mut buf := q.buf
+	mutex.@lock()
+	buf.items << item
+	mutex.unlock()
+	mut ready := q.ready
+	ready.post()
+}
+
+fn (q &AsyncQueue[T]) get() T {
+	mut ready := q.ready
+	ready.wait()
+	mut mutex := q.mutex
+	mut buf := q.buf
+	mutex.@lock()
+	item := buf.items[buf.head]
+	buf.head++
+	// Drop the consumed prefix once it is half the buffer.
+	if buf.head * 2 >= buf.items.len {
+		buf.items = buf.items[buf.head..].clone()
+		buf.head = 0
+	}
+	mutex.unlock()
+	if q.bounded {
+		mut slots := q.slots
+		slots.post()
+	}
+	return item
+}
+
+fn (q &AsyncQueue[T]) task_done() {
+	mut pending := q.pending
+	pending.done()
+}
+
+fn (q &AsyncQueue[T]) join() {
+	mut pending := q.pending
+	pending.wait()
+}
+
+fn (q &AsyncQueue[T]) qsize() int {
+	mut mutex := q.mutex
+	mutex.@lock()
+	defer { mutex.unlock() }
+	return q.buf.items.len - q.buf.head
+}
+
+fn (q &AsyncQueue[T]) empty() bool {
+	return q.qsize() == 0
+}
+
+fn new_thread(job fn ()) &Thread {
+	return &Thread{
+		job: job
+	}
+}
+
+fn (th &Thread) start() {
+	spawn fn (th &Thread) {
+		th.job()
+		th.done.close()
+	}(th)
+}
+
+fn (th &Thread) join() {
+	_ = <-th.done or { return }
+}
+
+fn (l &Lock) acquire() {
+	mut mutex := l.mutex
+	mutex.@lock()
+}
+
+fn (l &Lock) release() {
+	mut mutex := l.mutex
+	mutex.unlock()
+}
+
+// acquire takes the lock, or counts one more hold when the calling thread
+// already has it.
+fn (l &RLock) acquire() {
+	me := sync.thread_id()
+	mut state := l.state
+	if state.count > 0 && state.owner == me {
+		state.count++
+		return
+	}
+	mut mutex := l.mutex
+	mutex.@lock()
+	state.owner = me
+	state.count = 1
+}
+
+// release drops one hold and unlocks once the last one is gone.
+fn (l &RLock) release() {
+	mut state := l.state
+	state.count--
+	if state.count == 0 {
+		state.owner = 0
+		mut mutex := l.mutex
+		mutex.unlock()
+	}
+}
+
+fn (e &Event) set() {
+	e.done.close()
+}
+
+fn (e &Event) is_set() bool {
+	return e.done.closed
+}
+
+fn (e &Event) wait() bool {
+	_ = <-e.done or { return true }
+	return true
+}
+
+fn (c &Condition) acquire() {
+	mut mutex := c.mutex
+	mutex.@lock()
+}
+
+fn (c &Condition) release() {
+	mut mutex := c.mutex
+	mutex.unlock()
+}
+
+fn (c &Condition) wait() bool {
+	wake := chan bool{cap: 1}
+	c.waiters <- wake
+	c.release()
+	_ = <-wake
+	c.acquire()
+	return true
+}
+
+fn (c &Condition) notify() {
+	select {
+		wake := <-c.waiters {
+			wake <- true
+		}
+		else {}
+	}
+}
+
+fn (c &Condition) notify_all() {
+	for c.waiters.len > 0 {
+		c.notify()
+	}
+}
+
+fn main() {
+	run_threads()
+}
@@ -1,7 +1,5 @@
 module main
 
-type Any = bool | int | i64 | f64 | string | []u8
-
 const direction_north = 'north'
 const direction_south = 'south'
 const direction_east = 'east'
@@ -15,17 +13,16 @@ enum Speed {
 	speed_5 = 5
 }
 
-fn coords() [2]int {
-	return [1, 2]
+fn coords() (int, int) {
+	return 1, 2
 }
 
-fn rgb() [3]int {
-	return [255, 0, 128]
+fn rgb() (int, int, int) {
+	return 255, 0, 128
 }
 
-// NOTE: Tuple[int, string] — define a struct with named fields
-fn mixed() []Any {
-	return [1, 'hello']
+fn mixed() (int, string) {
+	return 1, 'hello'
 }
 
 fn variable_len() []int {
@@ -0,0 +1,35 @@
+module main
+
+pub struct TupleIntString {
+pub mut:
+	f0 int
+	f1 string
+}
+
+fn make_pair(n int, label string) TupleIntString {
+	return TupleIntString{
+		f0: n
+		f1: label
+	}
+}
+
+fn main_func() {
+	pairs := [make_pair(1, 'one'), make_pair(2, 'two')]
+	first := pairs[0]
+	println(first.f0)
+	println(first.f1)
+	__unpack1 := pairs[1]
+	mut num := __unpack1.f0
+	mut name := __unpack1.f1
+	println(num)
+	println(name)
+	point := TupleIntString{
+		f0: 3
+		f1: 'three'
+	}
+	println(point.f1)
+}
+
+fn main() {
+	main_func()
+}
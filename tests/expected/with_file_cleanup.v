@@ -1,18 +1,19 @@
 module main
 
 import os
+import io
 
 fn write_and_read() {
 	path := tempfile.mktemp()
 	if true {
 		mut f := os.create(path) or { panic(err) }
 		defer { f.close() }
-		f.write('hello world')
+		f.write_string('hello world') or { panic(err) }
 	}
 	if true {
 		mut f := os.open(path) or { panic(err) }
 		defer { f.close() }
-		data := f.read()
+		data := (io.read_all(reader: f) or { panic(err) }).bytestr()
 		println(data)
 	}
 	os.delete(os.index(path))
@@ -24,11 +25,11 @@ fn nested_files() {
 	if true {
 		mut f1 := os.create(path1) or { panic(err) }
 		defer { f1.close() }
-		f1.write('file1')
+		f1.write_string('file1') or { panic(err) }
 		if true {
 			mut f2 := os.create(path2) or { panic(err) }
 			defer { f2.close() }
-			f2.write('file2')
+			f2.write_string('file2') or { panic(err) }
 		}
 	}
 }
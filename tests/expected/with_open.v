@@ -1,22 +1,43 @@
 module main
 
 import os
+import io
+
+// read_chunk reads up to `n` bytes from `f` into `buf`, which is only
+// reallocated when n changes, so repeated reads of one size share a buffer.
+// The result is a slice of `buf`, without a copy, valid until the next read
+// into it, and is empty at end of file; other read errors panic. Text-mode
+// read(n) decodes this chunk, so n counts bytes rather than characters.
+fn read_chunk(f os.File, mut buf []u8, n int) []u8 {
+	if buf.len != n {
+		buf = []u8{len: n}
+	}
+	got := f.read(mut buf) or {
+		if err is os.Eof {
+			0
+		} else {
+			panic(err)
+		}
+	}
+	return buf[..got]
+}
 
 fn main() {
 	// import tempfile: no known V equivalent
+	mut __chunk1 := []u8{}
 	if true {
 		temp_file := namedTemporaryFile('a+', false)
 		file_path := temp_file.name
 		if true {
 			mut f := os.create(file_path) or { panic(err) }
 			defer { f.close() }
-			f.write('hello')
+			f.write_string('hello') or { panic(err) }
 		}
 		if true {
 			mut f := os.open(file_path) or { panic(err) }
 			defer { f.close() }
-			assert f.read(1) == 'h'
-			assert f.read() == 'ello'
+			assert read_chunk(f, mut __chunk1, 1).bytestr() == 'h'
+			assert (io.read_all(reader: f) or { panic(err) }).bytestr() == 'ello'
 			println('OK')
 		}
 	}
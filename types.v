@@ -35,11 +35,11 @@ pub const v_container_type_map = {
 	'Dict':     'map'
 	'List':     '[]'
 	'Optional': '?'
-	'Set':      '[]' // V doesn't have sets, use arrays
+	'Set':      'map' // hash set: map[T]bool
 	'Tuple':    '[]' // V doesn't have tuples, use arrays
 	'dict':     'map' // Python 3.9+ lowercase generic
 	'list':     '[]' // Python 3.9+ lowercase generic — parameterized form (see v_type_map for bare)
-	'set':      '[]' // Python 3.9+ lowercase generic
+	'set':      'map' // Python 3.9+ lowercase generic — hash set: map[T]bool
 	'tuple':    '[]' // Python 3.9+ lowercase generic
 }
 
@@ -190,7 +190,11 @@ pub fn map_type(typename string) string {
 	}
 	if typename.starts_with('Set[') || typename.starts_with('set[') {
 		inner := typename[typename.index_u8(`[`) + 1..typename.len - 1]
-		return '[]${map_type(inner)}' // V doesn't have sets
+		return 'map[${map_type(inner)}]bool' // hash set keyed by element
+	}
+	if typename.starts_with('Deque[') || typename.starts_with('deque[') {
+		inner := typename[typename.index_u8(`[`) + 1..typename.len - 1]
+		return 'Deque[${map_type(inner)}]' // generic ring buffer
 	}
 	if typename.starts_with('Tuple[') || typename.starts_with('tuple[') {
 		// Tuples become arrays in V
@@ -200,6 +204,47 @@ pub fn map_type(typename string) string {
 	return typename
 }
 
+// set_elem_type returns T for a map-backed set type map[T]bool, or '' when
+// `typ` is not a map of bools. Whether a value is a set at all is tracked by
+// the transpiler (see VTranspiler.is_set_expr), since dicts of bools share
+// the representation.
+pub fn set_elem_type(typ string) string {
+	key_type, value_type := map_key_value_types(typ)
+	if value_type == 'bool' {
+		return key_type
+	}
+	return ''
+}
+
+// map_key_value_types returns K and V for a map type map[K]V, or empty
+// strings when `typ` is not a map.
+pub fn map_key_value_types(typ string) (string, string) {
+	if !typ.starts_with('map[') {
+		return '', ''
+	}
+	mut depth := 0
+	for i := 3; i < typ.len; i++ {
+		if typ[i] == `[` {
+			depth++
+		} else if typ[i] == `]` {
+			depth--
+			if depth == 0 {
+				return typ[4..i], typ[i + 1..]
+			}
+		}
+	}
+	return '', ''
+}
+
+// deque_elem_type returns T for the Deque[T] ring buffer collections.deque
+// is lowered to, or '' when `typ` is not a deque.
+pub fn deque_elem_type(typ string) string {
+	if typ.starts_with('Deque[') && typ.ends_with(']') {
+		return typ[6..typ.len - 1]
+	}
+	return ''
+}
+
 // split_type_args splits type arguments like "str, int" into ["str", "int"].
 fn split_type_args(s string) []string {
 	mut result := []string{}
@@ -256,19 +301,15 @@ pub fn get_wider_type(left_type string, right_type string) string {
 	return right_type
 }
 
-// promote_numeric_type promotes numeric types for operations like Add/Mult.
-pub fn promote_numeric_type(left_type string, right_type string, op string) string {
+// promote_numeric_type promotes numeric types for Add/Sub/Mult.
+pub fn promote_numeric_type(left_type string, right_type string) string {
 	// Float always wins
 	if left_type == 'f64' || right_type == 'f64' || left_type == 'f32' || right_type == 'f32' {
 		return 'f64'
 	}
 
-	// Sub keeps the wider type (no promotion)
-	if op == 'Sub' {
-		return get_wider_type(left_type, right_type)
-	}
-
-	// For Add, Mult: promote to next-wider type
+	// Add, Sub and Mult can all overflow the operand type: promote to the
+	// next-wider type (64-bit types are already the widest)
 	wider := get_wider_type(left_type, right_type)
 	return match wider {
 		'i16' { 'int' }
@@ -291,45 +332,51 @@ pub const default_type = 'Any'
 // A '!' prefix means "emit comment only" (no direct V equivalent).
 pub const python_to_v_import = {
 	// stdlib with direct V counterparts
-	'__future__':  ''
-	'abc':         ''
-	'argparse':    'flag'
-	'asyncio':     '!// import asyncio: use V goroutines and channels'
-	'base64':      'encoding.base64'
-	'builtins':    ''
-	'cmath':       'math.complex'
-	'collections': 'datatypes'
-	'contextlib':  ''
-	'copy':        ''
-	'csv':         '!// import csv: use V csv or manual parsing'
-	'dataclasses': ''
-	'enum':        ''
-	'functools':   'arrays'
-	'hashlib':     'crypto'
-	'http':        '!// import http: use V net.http'
-	'io':          'os'
-	'itertools':   'arrays'
-	'json':        'json'
-	'logging':     'log'
-	'math':        'math'
-	'os':          'os'
-	'os.path':     'os'
-	'pathlib':     'os'
-	'pytest':      '!// import pytest: use V built-in `assert` and `v test`'
-	'random':      'rand'
-	're':          'regex'
-	'requests':    '!// import requests: use V net.http'
-	'shutil':      'os'
-	'socket':      '!// import socket: use V net module'
-	'sqlite3':     'db.sqlite'
-	'struct':      'encoding.binary'
-	'subprocess':  'os'
+	'__future__':      ''
+	'abc':             ''
+	'argparse':        'flag'
+	'asyncio':         '!// import asyncio: use V goroutines and channels'
+	'base64':          'encoding.base64'
+	'bisect':          ''
+	'builtins':        ''
+	'cmath':           'math.complex'
+	'collections':     ''
+	'concurrent':      ''
+	'contextlib':      ''
+	'copy':            ''
+	'csv':             '!// import csv: use V csv or manual parsing'
+	'dataclasses':     ''
+	'enum':            ''
+	'functools':       'arrays'
+	'hashlib':         'crypto'
+	'heapq':           ''
+	'http':            '!// import http: use V net.http'
+	'io':              'os'
+	'itertools':       'arrays'
+	'json':            'json'
+	'logging':         'log'
+	'math':            'math'
+	'mmap':            ''
+	'multiprocessing': ''
+	'os':              'os'
+	'os.path':         'os'
+	'pathlib':         'os'
+	'pytest':          '!// import pytest: use V built-in `assert` and `v test`'
+	'queue':           ''
+	'random':          'rand'
+	're':              'regex'
+	'requests':        '!// import requests: use V net.http'
+	'shutil':          'os'
+	'socket':          '!// import socket: use V net module'
+	'sqlite3':         'db.sqlite'
+	'struct':          'encoding.binary'
+	'subprocess':      'os'
 	// suppress — no V equivalent needed
-	'sys':         'os'
-	'threading':   '!// import threading: use V goroutines (go fn(){})'
-	'time':        'time'
-	'types':       ''
-	'typing':      ''
-	'unittest':    '!// import unittest: use V built-in `assert` and `v test`'
-	'urllib':      '!// import urllib: use V net.http'
+	'sys':             'os'
+	'threading':       ''
+	'time':            'time'
+	'types':           ''
+	'typing':          ''
+	'unittest':        '!// import unittest: use V built-in `assert` and `v test`'
+	'urllib':          '!// import urllib: use V net.http'
 }